@@ -6,7 +6,13 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import TypeAlias
 
+from .cron import cron_measure
+from .job_memory import job_memory_measure
+from .middleware import middleware_measure
+from .run_modes import run_modes_measure
+from .schedule import schedule_measure
 from .serializers import serializers_measure
+from .startup import startup_measure
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +39,12 @@ def main() -> None:
     results: Results = {}
     with timer():
         results |= serializers_measure()
+        results |= run_modes_measure()
+        results |= middleware_measure()
+        results |= startup_measure()
+        results |= schedule_measure()
+        results |= job_memory_measure()
+        results |= cron_measure()
     write_results(results)
 
 
@@ -0,0 +1,43 @@
+import timeit
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from jobify.crontab import create_crontab, create_native_crontab
+
+CALLS = 2_000
+EXPRESSIONS = {
+    "every_10s": "*/10 * * * * * *",
+    "weekdays": "0 9 * * 1-5",
+    "last_day": "0 0 L * *",
+    "leap_day": "0 0 29 2 *",
+}
+
+
+def next_run_us(
+    case: str,
+    expression: str,
+    now: datetime,
+) -> dict[str, float]:
+    results: dict[str, float] = {}
+    for name, factory in (
+        ("crontab", create_crontab),
+        ("native", create_native_crontab),
+    ):
+        parser = factory(expression)
+        best = min(
+            timeit.repeat(
+                lambda parser=parser: parser.next_run(now=now),
+                number=CALLS,
+                repeat=5,
+            ),
+        )
+        results[f"{case}_{name}"] = round(best / CALLS * 1_000_000, 2)
+    return results
+
+
+def cron_measure() -> dict[str, dict[str, float]]:
+    now = datetime(2024, 3, 14, 15, 9, 26, tzinfo=ZoneInfo("Europe/Moscow"))
+    results: dict[str, float] = {}
+    for case, expression in EXPRESSIONS.items():
+        results |= next_run_us(case, expression, now)
+    return {"cron_next_run_us": results}
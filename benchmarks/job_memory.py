@@ -0,0 +1,31 @@
+import asyncio
+import tracemalloc
+
+from jobify import Jobify
+
+JOBS = 10_000
+
+
+async def send(user_id: int) -> None:
+    return None
+
+
+async def job_memory_case() -> float:
+    app = Jobify(storage=False)
+    _ = app.task(send, func_name="send")
+    async with app:
+        route = app.task._routes["send"]
+        _ = await route.schedule(0).delay(3600)
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        for user_id in range(JOBS):
+            _ = await route.schedule(user_id).delay(3600)
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    return round(sum(stat.size_diff for stat in stats) / JOBS)
+
+
+def job_memory_measure() -> dict[str, dict[str, float]]:
+    bytes_per_job = asyncio.run(job_memory_case())
+    return {"job_memory": {"bytes_per_pending_job": bytes_per_job}}
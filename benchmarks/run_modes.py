@@ -0,0 +1,46 @@
+import asyncio
+import sys
+import time
+
+from jobify import Jobify, RunMode
+
+JOBS = 16
+ITERATIONS = 200_000
+
+
+def cpu_bound(n: int) -> int:
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+async def run_mode_case(mode: RunMode) -> float:
+    app = Jobify(storage=False)
+    task = app.task(
+        cpu_bound,
+        func_name=f"cpu_bound_{mode.value}",
+        run_mode=mode,
+    )
+    async with app:
+        # Warm up the pool so that worker startup is not part of the result.
+        job = await task.schedule(1).delay(0)
+        await job.wait()
+
+        start = time.perf_counter()
+        for _ in range(JOBS):
+            _ = await task.schedule(ITERATIONS).delay(0)
+        await app.wait_all()
+        return time.perf_counter() - start
+
+
+def run_modes_measure() -> dict[str, dict[str, float]]:
+    modes = [RunMode.THREAD, RunMode.PROCESS]
+    if sys.version_info >= (3, 14):
+        modes.append(RunMode.INTERPRETER)
+
+    results: dict[str, float] = {}
+    for mode in modes:
+        results[mode.value] = round(asyncio.run(run_mode_case(mode)), 2)
+    results = dict(sorted(results.items(), key=lambda item: item[1]))
+    return {"run_modes": results}
@@ -0,0 +1,37 @@
+import asyncio
+import time
+
+from jobify import Jobify
+from jobify.storage import SQLiteStorage
+
+JOBS = 5_000
+ROUNDS = 5
+
+
+async def send(user_id: int, text: str) -> None:
+    return None
+
+
+async def schedule_case(app: Jobify) -> float:
+    _ = app.task(send, func_name="send")
+    async with app:
+        route = app.task._routes["send"]
+        _ = await route.schedule(0, "warm-up").delay(60)
+        best = float("inf")
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            for user_id in range(JOBS):
+                _ = await route.schedule(user_id, "hello").delay(60)
+            best = min(best, time.perf_counter() - start)
+    return round(JOBS / best)
+
+
+def schedule_measure() -> dict[str, dict[str, float]]:
+    return {
+        "schedule_jobs_per_second": {
+            "memory": asyncio.run(schedule_case(Jobify(storage=False))),
+            "sqlite": asyncio.run(
+                schedule_case(Jobify(storage=SQLiteStorage(":memory:"))),
+            ),
+        },
+    }
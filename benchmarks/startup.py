@@ -0,0 +1,64 @@
+import asyncio
+import sys
+import time
+import types
+
+from jobify import Jobify
+
+ROUTES = (1_000, 10_000)
+
+TEMPLATE = """
+async def task_{i}(user: User, amount: int, note: str | None = None) -> Receipt:
+    return Receipt(user.id, amount)
+"""
+
+HEADER = """
+from dataclasses import dataclass
+
+
+@dataclass
+class User:
+    id: int
+
+
+@dataclass
+class Receipt:
+    user_id: int
+    amount: int
+"""
+
+
+def make_module(count: int) -> types.ModuleType:
+    name = f"benchmarks._startup_routes_{count}"
+    module = types.ModuleType(name)
+    # Registration looks the functions up in their module.
+    sys.modules[name] = module
+    source = HEADER + "".join(TEMPLATE.format(i=i) for i in range(count))
+    exec(compile(source, name, "exec"), module.__dict__)  # noqa: S102
+    return module
+
+
+async def startup_case(count: int) -> dict[str, float]:
+    module = make_module(count)
+    funcs = [getattr(module, f"task_{i}") for i in range(count)]
+
+    start = time.perf_counter()
+    app = Jobify(storage=False)
+    for func in funcs:
+        _ = app.task(func)
+    registered = time.perf_counter()
+    await app.startup()
+    started = time.perf_counter()
+    await app.shutdown()
+    del sys.modules[module.__name__]
+    return {
+        f"register_{count}_s": round(registered - start, 4),
+        f"startup_{count}_s": round(started - start, 4),
+    }
+
+
+def startup_measure() -> dict[str, dict[str, float]]:
+    results: dict[str, float] = {}
+    for count in ROUTES:
+        results |= asyncio.run(startup_case(count))
+    return {"startup": results}
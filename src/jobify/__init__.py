@@ -7,29 +7,49 @@ form the basis of the jobify asynchronous job scheduling system.
 
 from importlib.metadata import version as get_version
 
-from jobify._internal.common.constants import JobStatus, RunMode
+from jobify._internal.cancellation import CancellationToken
+from jobify._internal.common.constants import (
+    JobStatus,
+    RunMode,
+    StreamOverflow,
+)
 from jobify._internal.common.datastructures import RequestState, State
-from jobify._internal.configuration import Cron
+from jobify._internal.configuration import (
+    CircuitBreaker,
+    Cron,
+    ResultCache,
+    Retention,
+    RetryPolicy,
+)
 from jobify._internal.context import JobContext
 from jobify._internal.injection import INJECT
 from jobify._internal.router.node import NodeRouter as JobRouter
 from jobify._internal.runners import Runnable
 from jobify._internal.scheduler.job import Job
+from jobify._internal.scheduler.registry import JobRegistry
 from jobify._internal.scheduler.scheduler import ScheduleBuilder
-from jobify.jobify import Jobify
+from jobify.jobify import Jobify, ShutdownReport
 
 __version__ = get_version("jobify")
 __all__ = (
     "INJECT",
+    "CancellationToken",
+    "CircuitBreaker",
     "Cron",
     "Job",
     "JobContext",
+    "JobRegistry",
     "JobRouter",
     "JobStatus",
     "Jobify",
     "RequestState",
+    "ResultCache",
+    "Retention",
+    "RetryPolicy",
     "RunMode",
     "Runnable",
     "ScheduleBuilder",
+    "ShutdownReport",
     "State",
+    "StreamOverflow",
 )
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import threading
+from typing import final
+
+
+@final
+class CancellationToken:
+    """Cooperative cancellation signal for a running job.
+
+    An executor cannot interrupt a function that is already running in one
+    of its threads. A `RunMode.THREAD` task can receive the token through
+    `INJECT` and check it regularly, so that it stops early when its job
+    times out or is cancelled and the worker thread becomes free again.
+
+    Example:
+        ```python
+        @app.task(timeout=10)
+        def crunch(token: CancellationToken = INJECT) -> None:
+            for chunk in chunks():
+                if token.cancelled:
+                    return
+                process(chunk)
+        ```
+
+    """
+
+    __slots__: tuple[str, ...] = ("_event",)
+
+    def __init__(self) -> None:
+        self._event: threading.Event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the job is cancelled or `timeout` seconds pass.
+
+        Returns `True` if the job was cancelled. Use it instead of
+        `time.sleep` in tasks that pause between steps.
+        """
+        return self._event.wait(timeout)
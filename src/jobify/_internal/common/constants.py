@@ -6,6 +6,10 @@ from jobify._internal.common.datastructures import EmptyPlaceholder
 EMPTY: Any = EmptyPlaceholder()
 INFINITY = -1
 PATCH_SUFFIX = "__jobify_original"
+DEFAULT_STREAM_BUFFER = 64
+RESTORE_PAGE_SIZE = 500
+# Jobs armed between two yields to the event loop during a restore.
+RESTORE_CHUNK_SIZE = 100
 
 
 @unique
@@ -24,3 +28,21 @@ class RunMode(str, Enum):
     MAIN = "main"
     THREAD = "thread"
     PROCESS = "process"
+    INTERPRETER = "interpreter"
+
+
+@unique
+class StreamOverflow(str, Enum):
+    """What a streaming job does when its `stream_buffer` is full."""
+
+    # Wait until a consumer of `job.stream()` reads an item.
+    WAIT = "wait"
+    # Drop the oldest item and go on, for streams nobody may read.
+    DROP_OLDEST = "drop_oldest"
+
+
+@unique
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
@@ -1,49 +1,407 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import functools
+import gc
+import importlib
+import itertools
+import logging
 import multiprocessing
+import os
+import random
+import socket
 import sys
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict, TypeVar
 
 from typing_extensions import NotRequired
 
-from jobify._internal.common.constants import INFINITY
+from jobify._internal.common.constants import (
+    INFINITY,
+    RunMode,
+    StreamOverflow,
+)
+from jobify._internal.cron_parser import CronParserCache
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Hashable, Mapping, Sequence
+    from concurrent.futures import Executor, Future
+    from multiprocessing.context import BaseContext
+    from multiprocessing.process import BaseProcess
     from zoneinfo import ZoneInfo
 
-    from jobify._internal.common.constants import RunMode
     from jobify._internal.common.types import LoopFactory
     from jobify._internal.cron_parser import CronFactory
     from jobify._internal.serializers.base import Serializer
+    from jobify._internal.shards import Shards
     from jobify._internal.storage.abc import Storage
+    from jobify._internal.tracing import Tracer
     from jobify._internal.typeadapter.base import Dumper, Loader
 
 
+logger = logging.getLogger("jobify.worker_pools")
+
+ReturnT = TypeVar("ReturnT")
+
+# Tasks completed by the current process worker.
+_worker_tasks = itertools.count(1)
+
+
+class WorkerReport(NamedTuple):
+    pid: int
+    tasks: int
+    rss: int
+
+
+def _node_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{os.urandom(4).hex()}"
+
+
+def _peak_rss() -> int:  # pragma: no cover
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:
+        return 0  # Windows: the RSS ceiling is not enforced.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _current_rss() -> int:
+    try:
+        with open("/proc/self/statm", "rb") as statm:  # noqa: PTH123
+            pages = int(statm.read().split()[1])
+    except OSError:  # pragma: no cover
+        return _peak_rss()
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _run_tracked(
+    func: Callable[[], ReturnT],
+) -> tuple[ReturnT | None, Exception | None, WorkerReport]:
+    result: ReturnT | None = None
+    error: Exception | None = None
+    try:
+        result = func()
+    except Exception as exc:  # noqa: BLE001
+        error = exc
+    report = WorkerReport(os.getpid(), next(_worker_tasks), _current_rss())
+    return result, error, report
+
+
+def _pool_processes(pool: ProcessPoolExecutor) -> tuple[BaseProcess, ...]:
+    # Cleared by `shutdown`, so it is read before the pool is retired.
+    processes: dict[int, BaseProcess] = getattr(pool, "_processes", None) or {}
+    return tuple(processes.values())
+
+
+def _processpool_factory(
+    pool: ProcessPoolExecutor,
+) -> Callable[[], ProcessPoolExecutor] | None:
+    """Return a factory of pools with the settings of `pool`.
+
+    `None` for a subclass, whose settings cannot be known.
+    """
+    if type(pool) is not ProcessPoolExecutor:
+        return None
+    options: dict[str, Any] = {
+        "max_workers": getattr(pool, "_max_workers", None),
+        "mp_context": getattr(pool, "_mp_context", None),
+        "initializer": getattr(pool, "_initializer", None),
+        "initargs": getattr(pool, "_initargs", ()),
+    }
+    if (max_tasks := getattr(pool, "_max_tasks_per_child", None)) is not None:
+        options["max_tasks_per_child"] = max_tasks
+    return functools.partial(ProcessPoolExecutor, **options)
+
+
+def _max_tasks_per_child(pool: ProcessPoolExecutor) -> int | None:
+    # What the executor enforces, whichever created it.
+    max_tasks: int | None = getattr(pool, "_max_tasks_per_child", None)
+    return max_tasks
+
+
+def _preload_modules(modules: Sequence[str]) -> None:
+    for module in modules:
+        _ = importlib.import_module(module)
+
+
+def _warmup_worker(modules: Sequence[str]) -> None:
+    _preload_modules(modules)
+    # The executor counts the warm-up call towards `max_tasks_per_child`.
+    _ = next(_worker_tasks)
+
+
+def _init_process_worker(
+    modules: Sequence[str],
+    initializer: Callable[[], None] | None,
+) -> None:
+    _preload_modules(modules)
+    if initializer is not None:
+        initializer()
+
+
 @dataclass(slots=True, kw_only=True)
 class WorkerPools:
     _processpool: ProcessPoolExecutor | None
+    _interpreterpool: ThreadPoolExecutor | None = None
     threadpool: ThreadPoolExecutor | None = None
+    process_initializer: Callable[[], None] | None = None
+    preload_modules: tuple[str, ...] = ()
+    max_tasks_per_child: int | None = None
+    max_worker_rss: int | None = None
+    process_tasks: int = field(default=0, init=False)
+    worker_recycles: int = field(default=0, init=False)
+    processpool_recycles: int = field(default=0, init=False)
+    process_terminations: int = field(default=0, init=False)
+    # Builds the replacement of a custom `_processpool` with its settings.
+    _processpool_factory: Callable[[], ProcessPoolExecutor] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    _custom_processpool: bool = field(default=False, init=False, repr=False)
+    _running: dict[ProcessPoolExecutor, set[Future[Any]]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    _retired: dict[ProcessPoolExecutor, tuple[BaseProcess, ...]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    _abandoned: set[ProcessPoolExecutor] = field(
+        default_factory=set,
+        init=False,
+        repr=False,
+    )
+
+    def __post_init__(self) -> None:
+        if self.max_tasks_per_child is not None and sys.version_info < (3, 11):
+            msg = "max_tasks_per_child requires Python 3.11 or newer."
+            raise RuntimeError(msg)
+        if self._processpool is not None:
+            self._custom_processpool = True
+            self._processpool_factory = _processpool_factory(self._processpool)
+            if self.max_worker_rss is not None and not self.replaceable:
+                msg = (
+                    "processpool_max_worker_rss cannot recycle an executor of"
+                    f" type {type(self._processpool).__qualname__}."
+                    " Use a ProcessPoolExecutor or the default executor."
+                )
+                raise ValueError(msg)
 
     @property
-    def processpool(self) -> ProcessPoolExecutor:  # pragma: no cover
+    def replaceable(self) -> bool:
+        """Whether a process pool can be replaced by an identical one."""
+        return not self._custom_processpool or (
+            self._processpool_factory is not None
+        )
+
+    @property
+    def processpool(self) -> ProcessPoolExecutor:
+        if self._processpool is None and self._processpool_factory is not None:
+            self._processpool = self._processpool_factory()
         if self._processpool is None:
-            if sys.platform in ("win32", "darwin"):
+            if sys.platform in ("win32", "darwin"):  # pragma: no cover
                 start_method = "spawn"
             elif "forkserver" in multiprocessing.get_all_start_methods():
                 start_method = "forkserver"
-            else:
+            else:  # pragma: no cover
                 start_method = "spawn"
             mp_ctx = multiprocessing.get_context(start_method)
-            self._processpool = ProcessPoolExecutor(mp_context=mp_ctx)
+            if start_method == "forkserver" and self.preload_modules:
+                # Imported once by the fork server, so every worker forked
+                # from it starts with the route modules already loaded.
+                mp_ctx.set_forkserver_preload(list(self.preload_modules))
+            options: dict[str, Any] = {}
+            if self.max_tasks_per_child is not None:
+                options["max_tasks_per_child"] = self.max_tasks_per_child
+            self._processpool = ProcessPoolExecutor(
+                mp_context=mp_ctx,
+                initializer=_init_process_worker,
+                initargs=(self.preload_modules, self.process_initializer),
+                **options,
+            )
         return self._processpool
 
+    @property
+    def interpreterpool(self) -> ThreadPoolExecutor:  # pragma: no cover
+        if self._interpreterpool is None:
+            # Available since Python 3.14, looked up dynamically so that
+            # older interpreters can still import this module.
+            executor_cls: type[ThreadPoolExecutor] | None = getattr(
+                concurrent.futures,
+                "InterpreterPoolExecutor",
+                None,
+            )
+            if executor_cls is None:
+                msg = "RunMode.INTERPRETER requires Python 3.14 or newer."
+                raise RuntimeError(msg)
+            self._interpreterpool = executor_cls()
+        return self._interpreterpool
+
+    async def run_in_processpool(
+        self,
+        func: Callable[[], ReturnT],
+        loop: asyncio.AbstractEventLoop,
+    ) -> ReturnT:
+        pool = self.processpool
+        self.process_tasks += 1
+        if _max_tasks_per_child(pool) is None and self.max_worker_rss is None:
+            return await self._submit(pool, func, loop)
+
+        tracked = functools.partial(_run_tracked, func)
+        result, error, report = await self._submit(pool, tracked, loop)
+        self._check_worker(pool, report)
+        if error is not None:
+            raise error
+        return result  # type: ignore[return-value]
+
+    async def _submit(
+        self,
+        pool: ProcessPoolExecutor,
+        func: Callable[[], ReturnT],
+        loop: asyncio.AbstractEventLoop,
+    ) -> ReturnT:
+        future = pool.submit(func)
+        running = self._running.setdefault(pool, set())
+        running.add(future)
+        try:
+            return await asyncio.wrap_future(future, loop=loop)
+        except asyncio.CancelledError:
+            if not future.cancel() and not future.done():
+                self._abandon(pool)
+            raise
+        finally:
+            running.discard(future)
+            if not running:
+                del self._running[pool]
+                self._terminate_abandoned(pool)
+
+    def _abandon(self, pool: ProcessPoolExecutor) -> None:
+        """Give up a pool whose worker keeps running a cancelled call.
+
+        A process cannot be interrupted in the middle of a call, so new jobs
+        go to a fresh pool. The old workers are terminated as soon as the
+        other jobs they are running are finished.
+        """
+        if not self.replaceable:
+            logger.warning(
+                "A cancelled job is still running in the custom process pool,"
+                " which cannot be replaced. Its worker stays busy until the"
+                " call returns.",
+            )
+            return
+        self.process_terminations += 1
+        self._abandoned.add(pool)
+        if pool is self._processpool:
+            logger.warning(
+                "A cancelled job is still running in the process pool."
+                " Replacing the pool and terminating its workers.",
+            )
+            self.recycle_processpool()
+
+    def _terminate_abandoned(self, pool: ProcessPoolExecutor) -> None:
+        processes = self._retired.pop(pool, ())
+        if pool not in self._abandoned:
+            return
+        self._abandoned.discard(pool)
+        for process in processes:
+            process.terminate()
+
+    def _check_worker(
+        self,
+        pool: ProcessPoolExecutor,
+        report: WorkerReport,
+    ) -> None:
+        max_tasks = _max_tasks_per_child(pool)
+        if max_tasks is not None and report.tasks >= max_tasks:
+            # The executor replaces this worker on its own.
+            self.worker_recycles += 1
+            logger.info(
+                "Process worker %s reached %s tasks and is being replaced.",
+                report.pid,
+                report.tasks,
+            )
+        if (
+            self.max_worker_rss is not None
+            and report.rss > self.max_worker_rss
+            and pool is self._processpool
+        ):
+            logger.warning(
+                "Process worker %s uses %s bytes of memory (limit %s)."
+                " Recycling the process pool.",
+                report.pid,
+                report.rss,
+                self.max_worker_rss,
+            )
+            self.recycle_processpool()
+
+    def recycle_processpool(self) -> None:
+        """Replace the process pool without losing jobs in flight.
+
+        New jobs go to a fresh pool. The old pool still finishes the jobs it
+        has already accepted and its workers exit afterwards.
+        """
+        if self._processpool is None:
+            return
+        old_pool, self._processpool = self._processpool, None
+        self.processpool_recycles += 1
+        if old_pool in self._running:
+            self._retired[old_pool] = _pool_processes(old_pool)
+        old_pool.shutdown(wait=False, cancel_futures=False)
+
+    def get_executor(self, mode: RunMode) -> Executor | None:
+        if mode is RunMode.PROCESS:
+            return self.processpool
+        if mode is RunMode.INTERPRETER:  # pragma: no cover
+            return self.interpreterpool
+        return self.threadpool
+
+    async def start_processpool(
+        self,
+        modules: Sequence[str],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """Spawn every process worker and preload the route modules.
+
+        A custom executor has no initializer of ours, so its workers only
+        import the modules through the warm-up calls.
+        """
+        self.preload_modules = tuple(dict.fromkeys(modules))
+        pool = self.processpool
+        # Every submit spawns a new worker while none of them is idle.
+        max_workers: int = getattr(pool, "_max_workers", 1)
+        mp_ctx: BaseContext | None = getattr(pool, "_mp_context", None)
+        is_fork = mp_ctx is not None and mp_ctx.get_start_method() == "fork"
+        if is_fork:  # pragma: no cover
+            # Keep the parent's objects out of the collector, so that forked
+            # workers do not copy the pages it would touch.
+            gc.freeze()
+        try:
+            futures = [
+                pool.submit(_warmup_worker, self.preload_modules)
+                for _ in range(max_workers)
+            ]
+        finally:
+            if is_fork:  # pragma: no cover
+                gc.unfreeze()
+        _ = await asyncio.gather(
+            *(asyncio.wrap_future(f, loop=loop) for f in futures),
+        )
+
     def close(self) -> None:
+        for pool in tuple(self._abandoned):
+            self._terminate_abandoned(pool)
         if self._processpool is not None:
             self._processpool.shutdown(wait=True, cancel_futures=True)
             self._processpool = None
+        if self._interpreterpool is not None:  # pragma: no cover
+            self._interpreterpool.shutdown(wait=True, cancel_futures=True)
+            self._interpreterpool = None
 
 
 @dataclass(slots=True, kw_only=True)
@@ -56,8 +414,21 @@ class JobifyConfiguration:
     serializer: Serializer
     worker_pools: WorkerPools
     cron_factory: CronFactory
+    # `cron_factory` behind a cache, what the scheduler parses with.
+    cron_parsers: CronParserCache = field(init=False)
+    tracer: Tracer | None = None
+    restore_horizon: float | None = None
+    drain_timeout: float | None = None
+    cron_lease: float | None = None
+    # Owner of the cron leases taken by this app.
+    node_id: str = field(default_factory=_node_id)
+    # `None` unless the app runs more than one shard.
+    shards: Shards | None = None
     app_started: bool = False
 
+    def __post_init__(self) -> None:
+        self.cron_parsers = CronParserCache(self.cron_factory)
+
 
 @dataclass(slots=True, kw_only=True, frozen=True)
 class Cron:
@@ -74,11 +445,129 @@ class Cron:
             raise ValueError(msg)
 
 
+@dataclass(slots=True, kw_only=True, frozen=True)
+class RetryPolicy:
+    """How a failed job is retried.
+
+    The n-th retry runs `backoff_base * 2 ** (n - 1)` seconds after the
+    failure, at most `backoff_cap` seconds. `jitter` is the share of that
+    delay that is randomly taken off, so that jobs failing together do not
+    retry together. Only exceptions that are instances of `retry_on` are
+    retried.
+    """
+
+    max_retries: int = field(kw_only=False)
+    backoff_base: float = 1.0
+    backoff_cap: float = 60.0
+    jitter: float = 0.0
+    retry_on: tuple[type[Exception], ...] = (Exception,)
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            msg = "max_retries must be >= 0."
+            raise ValueError(msg)
+        if self.backoff_base < 0 or self.backoff_cap < 0:
+            msg = "backoff_base and backoff_cap must be >= 0."
+            raise ValueError(msg)
+        if not 0 <= self.jitter <= 1:
+            msg = "jitter must be between 0 and 1."
+            raise ValueError(msg)
+
+    def should_retry(self, exc: Exception, attempt: int) -> bool:
+        return attempt < self.max_retries and isinstance(exc, self.retry_on)
+
+    def delay(self, attempt: int) -> float:
+        delay: float = min(
+            self.backoff_base * 2 ** (attempt - 1),
+            self.backoff_cap,
+        )
+        if self.jitter:
+            delay -= delay * self.jitter * random.random()  # noqa: S311
+        return delay
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class CircuitBreaker:
+    """When to stop running the jobs of a failing route.
+
+    After `failure_threshold` failures within `window` seconds the circuit
+    opens and due jobs are deferred instead of executed. Once
+    `recovery_timeout` seconds have passed, up to `trial_runs` jobs are let
+    through. The circuit closes when all of them succeed and opens again
+    on the first failure.
+    """
+
+    failure_threshold: int = field(kw_only=False)
+    window: float = 60.0
+    recovery_timeout: float = 30.0
+    trial_runs: int = 1
+
+    def __post_init__(self) -> None:
+        if self.failure_threshold < 1 or self.trial_runs < 1:
+            msg = "failure_threshold and trial_runs must be >= 1."
+            raise ValueError(msg)
+        if self.window <= 0 or self.recovery_timeout <= 0:
+            msg = "window and recovery_timeout must be > 0."
+            raise ValueError(msg)
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class ResultCache:
+    """How the results of a route are reused.
+
+    A job whose arguments match a stored result completes with that result
+    without running the function. Results are kept for `ttl` seconds, or
+    until they are evicted as the least recently used of `maxsize` entries.
+    `key` maps the arguments of a job, without the `INJECT` ones, to a
+    hashable cache key; by default it is the tuple of their items.
+    """
+
+    ttl: float | None = None
+    maxsize: int = 128
+    key: Callable[[Mapping[str, Any]], Hashable] | None = None
+
+    def __post_init__(self) -> None:
+        if self.ttl is not None and self.ttl <= 0:
+            msg = "ttl must be > 0."
+            raise ValueError(msg)
+        if self.maxsize < 1:
+            msg = "maxsize must be >= 1."
+            raise ValueError(msg)
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class Retention:
+    """How long completed jobs can still be found with `Jobify.find_job`.
+
+    The last `max_per_route` completed jobs of each route are kept, and a
+    job is dropped `ttl` seconds after it completes, whichever comes first.
+    At least one of them must be set.
+    """
+
+    max_per_route: int | None = None
+    ttl: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_per_route is None and self.ttl is None:
+            msg = "Set max_per_route, ttl or both."
+            raise ValueError(msg)
+        if self.max_per_route is not None and self.max_per_route < 1:
+            msg = "max_per_route must be >= 1."
+            raise ValueError(msg)
+        if self.ttl is not None and self.ttl <= 0:
+            msg = "ttl must be > 0."
+            raise ValueError(msg)
+
+
 class RouteOptions(TypedDict):
     func_name: NotRequired[str]
     cron: NotRequired[Cron | str]
-    retry: NotRequired[int]
+    retry: NotRequired[int | RetryPolicy]
+    circuit_breaker: NotRequired[CircuitBreaker]
+    cache: NotRequired[ResultCache]
     timeout: NotRequired[float]
     durable: NotRequired[bool]
     run_mode: NotRequired[RunMode]
     metadata: NotRequired[Mapping[str, Any]]
+    stream_buffer: NotRequired[int]
+    stream_overflow: NotRequired[StreamOverflow]
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any
 
+from jobify._internal.cancellation import CancellationToken
 from jobify._internal.common.datastructures import RequestState, State
 from jobify._internal.configuration import (
     JobifyConfiguration,
@@ -18,3 +20,6 @@ class JobContext:
     request_state: RequestState
     route_options: RouteOptions
     jobify_config: JobifyConfiguration
+    cancel_token: CancellationToken = field(default_factory=CancellationToken)
+    # Called once the middleware lets the function run, for the metrics.
+    _on_start: Callable[[], None] | None = field(default=None, repr=False)
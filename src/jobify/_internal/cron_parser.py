@@ -1,7 +1,10 @@
+import threading
+import weakref
 from abc import ABCMeta, abstractmethod
 from collections.abc import Callable
+from contextlib import suppress
 from datetime import datetime
-from typing import Protocol, TypeAlias, runtime_checkable
+from typing import Protocol, TypeAlias, final, runtime_checkable
 
 Expression: TypeAlias = str
 CronFactory: TypeAlias = Callable[[Expression], "CronParser"]
@@ -12,3 +15,46 @@ class CronParser(Protocol, metaclass=ABCMeta):
     @abstractmethod
     def next_run(self, *, now: datetime) -> datetime:
         raise NotImplementedError
+
+
+@final
+class CronParserCache:
+    """The parsers of the cron jobs of an app, one per expression.
+
+    A parser only depends on its expression, so every job with the same
+    expression shares it. The cache holds weak references: a parser is
+    dropped with the last job that uses it.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_factory",
+        "_lock",
+        "_parsers",
+        "hits",
+        "misses",
+    )
+
+    def __init__(self, factory: CronFactory) -> None:
+        self._factory: CronFactory = factory
+        self._parsers: weakref.WeakValueDictionary[Expression, CronParser] = (
+            weakref.WeakValueDictionary()
+        )
+        # The shards of an app share the cache.
+        self._lock: threading.Lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._parsers)
+
+    def __call__(self, expression: Expression) -> CronParser:
+        with self._lock:
+            if (parser := self._parsers.get(expression)) is not None:
+                self.hits += 1
+                return parser
+            self.misses += 1
+        parser = self._factory(expression)
+        # A parser that cannot be weakly referenced is not cached.
+        with suppress(TypeError):
+            self._parsers[expression] = parser
+        return parser
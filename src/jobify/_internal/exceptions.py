@@ -1,3 +1,4 @@
+import traceback
 from typing import NoReturn
 
 
@@ -39,6 +40,23 @@ class JobTimeoutError(BaseJobifyError):
         super().__init__(msg)
 
 
+class JobRescheduledError(BaseJobifyError):
+    """Raised by middleware to run the job again after `delay` seconds.
+
+    The scheduler catches it, so the job is not marked as failed and keeps
+    its place in the storage with the new execution time.
+    """
+
+    def __init__(self, job_id: str, *, delay: float, attempt: int) -> None:
+        self.job_id: str = job_id
+        self.delay: float = delay
+        self.attempt: int = attempt
+        super().__init__(
+            f"job_id: {job_id} is rescheduled in {delay} seconds"
+            f" (attempt {attempt}).",
+        )
+
+
 class DuplicateJobError(RuntimeError):
     """Raised when a job is scheduled with an ID that is already in use."""
 
@@ -98,3 +116,17 @@ def raise_app_already_started_error(operation: str) -> NoReturn:
             "Move this call outside/before the 'async with jobify:' block."
         ),
     )
+
+
+def clear_frames(exc: BaseException) -> None:
+    """Drop the locals of the finished frames of `exc` and of its causes.
+
+    The tracebacks still tell where the errors happened, but no longer keep
+    the objects of those frames alive for as long as the exception is.
+    """
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        traceback.clear_frames(current.__traceback__)
+        current = current.__cause__ or current.__context__
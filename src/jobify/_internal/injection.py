@@ -1,10 +1,15 @@
 import inspect
-from typing import Any, TypeVar, get_origin, get_type_hints
+from collections.abc import Callable, Mapping
+from typing import Any, TypeAlias, TypeVar, get_origin, get_type_hints
 
 from jobify._internal.context import JobContext
 
 ReturnT = TypeVar("ReturnT")
 
+# Pairs of a parameter and the `JobContext` field injected into it,
+# `None` standing for the context itself.
+InjectionPlan: TypeAlias = tuple[tuple[str, str | None], ...]
+
 
 def _build_context_mapping(context_cls: type[JobContext]) -> dict[type, str]:
     type_hints = get_type_hints(context_cls)
@@ -18,27 +23,56 @@ INJECT: Any = object()
 CONTEXT_TYPE_MAP = _build_context_mapping(JobContext)
 
 
-def inject_context(context: JobContext) -> None:
-    runnable = context.runnable
-    arguments = runnable.bound.arguments
-    for name, param in runnable.bound.signature.parameters.items():
+def has_injection(func: Callable[..., Any]) -> bool:
+    """Check for `INJECT` defaults without inspecting the signature.
+
+    Callables without their own defaults, such as partials, count as
+    having some.
+    """
+    func = inspect.unwrap(func)
+    try:
+        defaults = func.__defaults__ or ()
+        kwdefaults = func.__kwdefaults__ or {}
+    except AttributeError:
+        return True
+    return any(value is INJECT for value in defaults) or any(
+        value is INJECT for value in kwdefaults.values()
+    )
+
+
+def make_injection_plan(
+    signature: inspect.Signature,
+    hints: Mapping[str, Any],
+) -> InjectionPlan:
+    plan: list[tuple[str, str | None]] = []
+    for name, param in signature.parameters.items():
         if param.default is not INJECT:
             continue
 
-        annotation = param.annotation
+        annotation = hints.get(name, inspect.Parameter.empty)
         if annotation is inspect.Parameter.empty:
             msg = f"Parameter {name} requires a type annotation for INJECT"
             raise ValueError(msg)
 
         tp = get_origin(annotation) or annotation
         if tp is JobContext:
-            val = context
+            plan.append((name, None))
         elif field_name := CONTEXT_TYPE_MAP.get(tp):
-            val = getattr(context, field_name)
+            plan.append((name, field_name))
         else:
             msg = (
                 f"Unknown type for injection: {tp}. "
                 f"Available types: {list(CONTEXT_TYPE_MAP.keys())}"
             )
             raise ValueError(msg)
-        arguments[name] = val
+    return tuple(plan)
+
+
+def inject_context(context: JobContext) -> None:
+    runnable = context.runnable
+    arguments = runnable.bound.arguments
+    for name, field_name in runnable.injection:
+        if field_name is None:
+            arguments[name] = context
+        else:
+            arguments[name] = getattr(context, field_name)
@@ -3,12 +3,29 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, Generic, ParamSpec, TypeAlias, TypeVar, get_type_hints
 
+from jobify._internal.injection import InjectionPlan, make_injection_plan
+
 ReturnT = TypeVar("ReturnT")
 ParamsT = ParamSpec("ParamsT")
 
 ParamName: TypeAlias = str
 TypeHint: TypeAlias = Any
 
+# Raised by `make_func_spec` for a function whose annotations or signature
+# cannot be read, e.g. a `NameError` from an unresolved forward reference.
+INSPECTION_ERRORS: tuple[type[Exception], ...] = (
+    AttributeError,
+    NameError,
+    SyntaxError,
+    TypeError,
+    ValueError,
+)
+
+_POSITIONAL = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
 
 @dataclass(slots=True, kw_only=True)
 class FuncSpec(Generic[ReturnT]):
@@ -16,6 +33,23 @@ class FuncSpec(Generic[ReturnT]):
     signature: inspect.Signature
     params_type: dict[ParamName, TypeHint]
     result_type: type[ReturnT]
+    injection: InjectionPlan
+    # Names of the parameters when all of them can be passed positionally,
+    # which lets `bind` skip `Signature.bind` for positional calls.
+    positional: tuple[ParamName, ...] | None = None
+    required: int = 0
+
+    def bind(self, *args: Any, **kwargs: Any) -> inspect.BoundArguments:  # noqa: ANN401
+        positional = self.positional
+        if (
+            positional is not None
+            and not kwargs
+            and self.required <= len(args) <= len(positional)
+        ):
+            arguments = dict(zip(positional, args, strict=False))
+            # `Signature.bind` also builds a plain dict since Python 3.9.
+            return inspect.BoundArguments(self.signature, arguments)  # type: ignore[arg-type]
+        return self.signature.bind(*args, **kwargs)
 
 
 def get_params_type(
@@ -31,12 +65,26 @@ def get_result_type(hints: dict[str, Any]) -> Any:  # noqa: ANN401
     return hints.get("return", Any)
 
 
+def get_positional(
+    sig: inspect.Signature,
+) -> tuple[tuple[ParamName, ...] | None, int]:
+    params = sig.parameters.values()
+    if any(param.kind not in _POSITIONAL for param in params):
+        return None, 0
+    required = sum(param.default is param.empty for param in params)
+    return tuple(sig.parameters), required
+
+
 def make_func_spec(func: Callable[ParamsT, ReturnT]) -> FuncSpec[ReturnT]:
     sig = inspect.signature(func)
     hints = get_type_hints(func)
+    positional, required = get_positional(sig)
     return FuncSpec(
         name=func.__name__,
         params_type=get_params_type(sig, hints),
         result_type=get_result_type(hints),
         signature=sig,
+        injection=make_injection_plan(sig, hints),
+        positional=positional,
+        required=required,
     )
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, TypedDict
 
+from typing_extensions import NotRequired
+
 from jobify._internal.configuration import Cron
 
 
@@ -9,6 +11,8 @@ class CronArguments(TypedDict):
     cron: Cron
     job_id: str
     now: datetime
+    # The time of a pending retry, before the next regular run.
+    at: NotRequired[datetime]
 
 
 class AtArguments(TypedDict):
@@ -23,3 +27,5 @@ class Message:
     func_name: str
     arguments: dict[str, Any]
     trigger: CronArguments | AtArguments
+    attempt: int = 0
+    trace_context: dict[str, str] | None = None
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import bisect
+from typing import TYPE_CHECKING, Any, Final, final
+
+from jobify._internal.common.constants import CircuitState, JobStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from jobify._internal.configuration import WorkerPools
+    from jobify._internal.cron_parser import CronParserCache
+    from jobify._internal.middleware.cache import CacheMiddleware
+    from jobify._internal.middleware.circuit_breaker import (
+        CircuitBreakerMiddleware,
+    )
+    from jobify._internal.scheduler.job import Job
+
+
+SECONDS_BUCKETS: Final = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+
+COUNTERS: Final = (
+    ("scheduled", "Jobs scheduled."),
+    ("started", "Job executions that ran the function."),
+    ("succeeded", "Job executions that succeeded."),
+    ("failed", "Job executions that failed."),
+    ("timed_out", "Job executions that exceeded their timeout."),
+    ("rescheduled", "Job executions deferred to a retry or an open circuit."),
+)
+
+
+@final
+class Histogram:
+    __slots__: tuple[str, ...] = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...] = SECONDS_BUCKETS) -> None:
+        self.bounds: tuple[float, ...] = bounds
+        # The last bucket is +Inf.
+        self.counts: list[int] = [0] * (len(bounds) + 1)
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def add(self, other: Histogram) -> None:
+        self.counts = [
+            a + b for a, b in zip(self.counts, other.counts, strict=True)
+        ]
+        self.sum += other.sum
+
+
+@final
+class RouteMetrics:
+    """Counters of one route, updated in place on every job."""
+
+    __slots__: tuple[str, ...] = (
+        "duration",
+        "failed",
+        "in_flight",
+        "lateness",
+        "rescheduled",
+        "scheduled",
+        "started",
+        "succeeded",
+        "timed_out",
+    )
+
+    def __init__(self) -> None:
+        self.scheduled: int = 0
+        self.started: int = 0
+        self.succeeded: int = 0
+        self.failed: int = 0
+        self.timed_out: int = 0
+        self.rescheduled: int = 0
+        self.in_flight: int = 0
+        self.duration: Histogram = Histogram()
+        self.lateness: Histogram = Histogram()
+
+    def add(self, other: RouteMetrics) -> None:
+        for attr, _ in COUNTERS:
+            setattr(self, attr, getattr(self, attr) + getattr(other, attr))
+        self.in_flight += other.in_flight
+        self.duration.add(other.duration)
+        self.lateness.add(other.lateness)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+@final
+class Metrics:
+    __slots__: tuple[str, ...] = ("routes",)
+
+    def __init__(self) -> None:
+        self.routes: dict[str, RouteMetrics] = {}
+
+    def route(self, name: str) -> RouteMetrics:
+        if (metrics := self.routes.get(name)) is None:
+            # Atomic, as the shards of an app can add a route together.
+            metrics = self.routes.setdefault(name, RouteMetrics())
+        return metrics
+
+    @classmethod
+    def merge(cls, shards: Iterable[Metrics]) -> Metrics:
+        """Add up the metrics of the shards of an app."""
+        merged = cls()
+        for metrics in shards:
+            for name, route in metrics.routes.items():
+                merged.route(name).add(route)
+        return merged
+
+    def render(
+        self,
+        jobs: Iterable[Job[Any]],
+        breakers: Mapping[str, CircuitBreakerMiddleware],
+        caches: Mapping[str, CacheMiddleware],
+        cron_parsers: CronParserCache | None = None,
+        worker_pools: WorkerPools | None = None,
+    ) -> str:
+        """Render the metrics in the OpenMetrics text format."""
+        lines: list[str] = []
+        labels = {name: f'route="{_escape(name)}"' for name in self.routes}
+
+        for attr, help_text in COUNTERS:
+            name = f"jobify_jobs_{attr}"
+            lines += (f"# TYPE {name} counter", f"# HELP {name} {help_text}")
+            lines.extend(
+                f"{name}_total{{{labels[route]}}} {getattr(metrics, attr)}"
+                for route, metrics in self.routes.items()
+            )
+
+        for attr, help_text in (
+            ("duration", "Job execution time."),
+            ("lateness", "Delay between the planned and the actual start."),
+        ):
+            name = f"jobify_job_{attr}_seconds"
+            lines += (
+                f"# TYPE {name} histogram",
+                f"# UNIT {name} seconds",
+                f"# HELP {name} {help_text}",
+            )
+            for route, metrics in self.routes.items():
+                lines += self._render_histogram(
+                    name,
+                    labels[route],
+                    getattr(metrics, attr),
+                )
+
+        pending = dict.fromkeys(self.routes, 0)
+        for job in jobs:
+            if job.status is JobStatus.SCHEDULED and job.func_name in pending:
+                pending[job.func_name] += 1
+        for name, help_text, values in (
+            (
+                "jobify_jobs_in_flight",
+                "Jobs currently running.",
+                {route: m.in_flight for route, m in self.routes.items()},
+            ),
+            ("jobify_jobs_pending", "Jobs waiting for their time.", pending),
+        ):
+            lines += (f"# TYPE {name} gauge", f"# HELP {name} {help_text}")
+            lines.extend(
+                f"{name}{{{labels[route]}}} {value}"
+                for route, value in values.items()
+            )
+
+        if breakers:
+            lines += self._render_breakers(breakers)
+        if caches:
+            lines += self._render_caches(caches)
+        lines += self._render_cron_parsers(cron_parsers)
+        lines += self._render_worker_pools(worker_pools)
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histogram(
+        name: str,
+        labels: str,
+        histogram: Histogram,
+    ) -> list[str]:
+        lines: list[str] = []
+        cumulative = 0
+        bounds = (*map(_number, histogram.bounds), "+Inf")
+        for bound, count in zip(bounds, histogram.counts, strict=True):
+            cumulative += count
+            lines.append(
+                f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+            )
+        lines.append(f"{name}_sum{{{labels}}} {_number(histogram.sum)}")
+        lines.append(f"{name}_count{{{labels}}} {cumulative}")
+        return lines
+
+    @staticmethod
+    def _render_breakers(
+        breakers: Mapping[str, CircuitBreakerMiddleware],
+    ) -> list[str]:
+        state_name = "jobify_circuit_state"
+        transitions_name = "jobify_circuit_transitions"
+        lines = [
+            f"# TYPE {state_name} stateset",
+            f"# HELP {state_name} Circuit breaker state.",
+        ]
+        for route, breaker in breakers.items():
+            label = f'route="{_escape(route)}"'
+            lines.extend(
+                f'{state_name}{{{label},{state_name}="{state.value}"}}'
+                f" {int(breaker.state is state)}"
+                for state in CircuitState
+            )
+        lines += (
+            f"# TYPE {transitions_name} counter",
+            f"# HELP {transitions_name} Circuit breaker state changes.",
+        )
+        for route, breaker in breakers.items():
+            label = f'route="{_escape(route)}"'
+            lines.extend(
+                f'{transitions_name}_total{{{label},to="{state.value}"}}'
+                f" {count}"
+                for state, count in breaker.transitions.items()
+            )
+        return lines
+
+    @staticmethod
+    def _render_caches(caches: Mapping[str, CacheMiddleware]) -> list[str]:
+        lines: list[str] = []
+        for attr, help_text in (
+            ("hits", "Jobs completed with a cached result."),
+            ("misses", "Jobs executed because no result was cached."),
+            ("evictions", "Results evicted from a full cache."),
+        ):
+            name = f"jobify_cache_{attr}"
+            lines += (f"# TYPE {name} counter", f"# HELP {name} {help_text}")
+            lines.extend(
+                f'{name}_total{{route="{_escape(route)}"}}'
+                f" {getattr(cache, attr)}"
+                for route, cache in caches.items()
+            )
+        name = "jobify_cache_size"
+        lines += (f"# TYPE {name} gauge", f"# HELP {name} Cached results.")
+        lines.extend(
+            f'{name}{{route="{_escape(route)}"}} {cache.size}'
+            for route, cache in caches.items()
+        )
+        return lines
+
+    @staticmethod
+    def _render_cron_parsers(
+        cron_parsers: CronParserCache | None,
+    ) -> list[str]:
+        lines: list[str] = []
+        if cron_parsers is None or not (
+            cron_parsers.hits or cron_parsers.misses
+        ):
+            return lines
+        for attr, help_text in (
+            ("hits", "Cron jobs that reused the parser of their expression."),
+            ("misses", "Cron expressions parsed."),
+        ):
+            name = f"jobify_cron_parser_{attr}"
+            lines += (
+                f"# TYPE {name} counter",
+                f"# HELP {name} {help_text}",
+                f"{name}_total {getattr(cron_parsers, attr)}",
+            )
+        name = "jobify_cron_parsers"
+        lines += (
+            f"# TYPE {name} gauge",
+            f"# HELP {name} Cron parsers in use.",
+            f"{name} {len(cron_parsers)}",
+        )
+        return lines
+
+    @staticmethod
+    def _render_worker_pools(worker_pools: WorkerPools | None) -> list[str]:
+        lines: list[str] = []
+        if worker_pools is None or (
+            worker_pools._processpool is None
+            and not worker_pools.process_tasks
+        ):
+            return lines  # The app has no process pool.
+        for metric, attr, help_text in (
+            (
+                "process_tasks",
+                "process_tasks",
+                "Jobs run in the process pool.",
+            ),
+            (
+                "process_worker_recycles",
+                "worker_recycles",
+                "Process workers replaced after max_tasks_per_child tasks.",
+            ),
+            (
+                "processpool_recycles",
+                "processpool_recycles",
+                "Process pools replaced, after an RSS breach or a stuck job.",
+            ),
+            (
+                "process_terminations",
+                "process_terminations",
+                "Process pools terminated to stop a cancelled job.",
+            ),
+        ):
+            name = f"jobify_{metric}"
+            lines += (
+                f"# TYPE {name} counter",
+                f"# HELP {name} {help_text}",
+                f"{name}_total {getattr(worker_pools, attr)}",
+            )
+        return lines
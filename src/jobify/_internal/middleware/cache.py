@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import collections
+import math
+import time
+from typing import TYPE_CHECKING, Any, final
+
+from typing_extensions import override
+
+from jobify._internal.middleware.base import BaseMiddleware, CallNext
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Mapping
+
+    from jobify._internal.configuration import ResultCache
+    from jobify._internal.context import JobContext
+
+
+def default_cache_key(arguments: Mapping[str, Any]) -> Hashable:
+    return tuple(arguments.items())
+
+
+@final
+class CacheMiddleware(BaseMiddleware):
+    """Completes the jobs of one route with the results of earlier jobs."""
+
+    __slots__: tuple[str, ...] = (
+        "_entries",
+        "_key",
+        "config",
+        "evictions",
+        "hits",
+        "misses",
+        "name",
+    )
+
+    def __init__(self, name: str, config: ResultCache) -> None:
+        self.name: str = name
+        self.config: ResultCache = config
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._key: Callable[[Mapping[str, Any]], Hashable] = (
+            config.key or default_cache_key
+        )
+        # Ordered from the least to the most recently used.
+        self._entries: collections.OrderedDict[Hashable, tuple[float, Any]]
+        self._entries = collections.OrderedDict()
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @override
+    async def __call__(self, call_next: CallNext, context: JobContext) -> Any:
+        runnable = context.runnable
+        arguments: Mapping[str, Any] = runnable.bound.arguments
+        if runnable.injection:
+            injected = {name for name, _ in runnable.injection}
+            arguments = {
+                name: value
+                for name, value in arguments.items()
+                if name not in injected
+            }
+        key = self._key(arguments)
+        now = time.monotonic()
+        try:
+            entry = self._entries.get(key)
+        except TypeError:
+            # Jobs with unhashable arguments are not cached.
+            return await call_next(context)
+
+        if entry is not None:
+            expires_at, result = entry
+            if now < expires_at:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return result
+            del self._entries[key]
+
+        self.misses += 1
+        result = await call_next(context)
+        self._store(key, result, time.monotonic())
+        return result
+
+    def _store(self, key: Hashable, result: Any, now: float) -> None:  # noqa: ANN401
+        ttl = self.config.ttl
+        expires_at = math.inf if ttl is None else now + ttl
+        self._entries[key] = (expires_at, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.maxsize:
+            _ = self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import collections
+import logging
+import time
+from typing import TYPE_CHECKING, Any, NoReturn, final
+
+from typing_extensions import override
+
+from jobify._internal.common.constants import CircuitState
+from jobify._internal.exceptions import JobRescheduledError
+from jobify._internal.middleware.base import BaseMiddleware, CallNext
+
+if TYPE_CHECKING:
+    from jobify._internal.configuration import CircuitBreaker
+    from jobify._internal.context import JobContext
+
+logger = logging.getLogger("jobify.middleware")
+
+
+@final
+class CircuitBreakerMiddleware(BaseMiddleware):
+    """Defers the jobs of one route while its circuit is open."""
+
+    __slots__: tuple[str, ...] = (
+        "_failures",
+        "_opened_at",
+        "_trial_successes",
+        "_trials",
+        "config",
+        "deferred",
+        "name",
+        "state",
+        "transitions",
+    )
+
+    def __init__(self, name: str, config: CircuitBreaker) -> None:
+        self.name: str = name
+        self.config: CircuitBreaker = config
+        self.state: CircuitState = CircuitState.CLOSED
+        self.deferred: int = 0
+        self.transitions: dict[CircuitState, int] = dict.fromkeys(
+            CircuitState,
+            0,
+        )
+        self._failures: collections.deque[float] = collections.deque()
+        self._opened_at: float = 0.0
+        self._trials: int = 0
+        self._trial_successes: int = 0
+
+    @override
+    async def __call__(self, call_next: CallNext, context: JobContext) -> Any:
+        is_trial = self._admit(context, time.monotonic())
+        half_opened = self.transitions[CircuitState.HALF_OPEN]
+
+        try:
+            result = await call_next(context)
+        except JobRescheduledError:
+            if is_trial:
+                self._release_trial(half_opened)
+            raise
+        except Exception:
+            self._on_failure(time.monotonic())
+            raise
+        except BaseException:
+            # Cancelled: the trial ends without an outcome.
+            if is_trial:
+                self._release_trial(half_opened)
+            raise
+        if is_trial and self.state is CircuitState.HALF_OPEN:
+            self._trial_successes += 1
+            if self._trial_successes >= self.config.trial_runs:
+                self._transition(CircuitState.CLOSED)
+        return result
+
+    def _admit(self, context: JobContext, now: float) -> bool:
+        """Defer the job unless the circuit lets it run, a trial or not."""
+        if self.state is CircuitState.OPEN:
+            reopen_at = self._opened_at + self.config.recovery_timeout
+            if now < reopen_at:
+                self._defer(context, reopen_at - now)
+            self._transition(CircuitState.HALF_OPEN)
+
+        is_trial = self.state is CircuitState.HALF_OPEN
+        if is_trial:
+            if self._trials >= self.config.trial_runs:
+                self._defer(context, self.config.recovery_timeout)
+            self._trials += 1
+        return is_trial
+
+    def _defer(self, context: JobContext, delay: float) -> NoReturn:
+        self.deferred += 1
+        job = context.job
+        raise JobRescheduledError(job.id, delay=delay, attempt=job.attempt)
+
+    def _release_trial(self, half_opened: int) -> None:
+        """Give back the slot of a trial that ended without an outcome.
+
+        Only while the circuit is still in the half-open state that the
+        trial started in, since a transition resets the slots.
+        """
+        if (
+            self.state is CircuitState.HALF_OPEN
+            and self.transitions[CircuitState.HALF_OPEN] == half_opened
+            and self._trials > 0
+        ):
+            self._trials -= 1
+
+    def _on_failure(self, now: float) -> None:
+        if self.state is CircuitState.HALF_OPEN:
+            self._transition(CircuitState.OPEN, now)
+            return
+        if self.state is CircuitState.OPEN:
+            return
+        failures = self._failures
+        failures.append(now)
+        while failures[0] <= now - self.config.window:
+            _ = failures.popleft()
+        if len(failures) >= self.config.failure_threshold:
+            self._transition(CircuitState.OPEN, now)
+
+    def _transition(self, state: CircuitState, now: float = 0.0) -> None:
+        self.state = state
+        self.transitions[state] += 1
+        self._failures.clear()
+        self._trials = 0
+        self._trial_successes = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = now
+            logger.warning(
+                "Circuit of route %s is open. Deferring its jobs for %ss.",
+                self.name,
+                self.config.recovery_timeout,
+            )
+        elif state is CircuitState.HALF_OPEN:
+            logger.info(
+                "Circuit of route %s is half-open. Allowing %s trial runs.",
+                self.name,
+                self.config.trial_runs,
+            )
+        else:
+            logger.info("Circuit of route %s is closed.", self.name)
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, TypeAlias, final
 from typing_extensions import override
 
 from jobify._internal.context import JobContext
+from jobify._internal.exceptions import JobRescheduledError
 from jobify._internal.middleware.base import BaseMiddleware, CallNext
 
 if TYPE_CHECKING:
@@ -24,7 +25,11 @@ MappingExceptionHandlers: TypeAlias = Mapping[
 
 @final
 class ExceptionMiddleware(BaseMiddleware):
-    __slots__: tuple[str, ...] = ("exc_handlers", "jobify_config")
+    __slots__: tuple[str, ...] = (
+        "_handlers_cache",
+        "exc_handlers",
+        "jobify_config",
+    )
 
     def __init__(
         self,
@@ -33,11 +38,15 @@ class ExceptionMiddleware(BaseMiddleware):
     ) -> None:
         self.exc_handlers = exc_handlers
         self.jobify_config = jobify_config
+        self._handlers_cache: dict[type[Exception], ExceptionHandler | None]
+        self._handlers_cache = {}
 
     @override
     async def __call__(self, call_next: CallNext, context: JobContext) -> Any:
         try:
             return await call_next(context)
+        except JobRescheduledError:
+            raise
         except Exception as exc:
             handler = self._lookup_exc_handler(exc)
             if handler:
@@ -49,8 +58,18 @@ class ExceptionMiddleware(BaseMiddleware):
                     await loop.run_in_executor(thread, handler, exc, context)  # pyright: ignore[reportUnusedCallResult]
             raise
 
+    def clear_cache(self) -> None:
+        self._handlers_cache.clear()
+
     def _lookup_exc_handler(self, exc: Exception) -> ExceptionHandler | None:
-        for cls_exc in type(exc).__mro__:
+        exc_type = type(exc)
+        try:
+            return self._handlers_cache[exc_type]
+        except KeyError:
+            pass
+        handler: ExceptionHandler | None = None
+        for cls_exc in exc_type.__mro__:
             if handler := self.exc_handlers.get(cls_exc):
-                return handler
-        return None
+                break
+        self._handlers_cache[exc_type] = handler
+        return handler
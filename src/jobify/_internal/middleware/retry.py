@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
 from typing_extensions import override
 
+from jobify._internal.configuration import RetryPolicy
+from jobify._internal.exceptions import JobRescheduledError
 from jobify._internal.middleware.base import BaseMiddleware, CallNext
 
 if TYPE_CHECKING:
@@ -17,30 +18,36 @@ logger = logging.getLogger("jobify.middleware")
 class RetryMiddleware(BaseMiddleware):
     @override
     async def __call__(self, call_next: CallNext, context: JobContext) -> Any:
-        max_retries = context.route_options.get("retry")
-        if max_retries is None:
+        if (policy := context.route_options.get("retry")) is None:
             return await call_next(context)
 
-        failures = 0
-        while True:
-            try:
-                return await call_next(context)
-            except Exception as exc:  # noqa: PERF203
-                failures += 1
-                if failures > max_retries:
-                    msg = (
-                        f"Job failed after exhausting all {max_retries}"
-                        " retries. Propagating error."
+        try:
+            return await call_next(context)
+        except JobRescheduledError:
+            raise
+        except Exception as exc:
+            if isinstance(policy, int):
+                policy = RetryPolicy(policy)
+            job = context.job
+            if not policy.should_retry(exc, job.attempt):
+                if job.attempt:
+                    logger.warning(
+                        "Job failed after %s retries. Propagating error.",
+                        job.attempt,
                     )
-                    logger.warning(msg)
-                    raise
-
-                seconds_wait = min(2 ** (failures - 1), 60)
-                logger.warning(
-                    "Attempt %s/%s failed. Retrying in %ss. Error: %s",
-                    failures,
-                    max_retries,
-                    seconds_wait,
-                    exc,
-                )
-                await asyncio.sleep(seconds_wait)  # Exponential backoff
+                raise
+
+            attempt = job.attempt + 1
+            delay = policy.delay(attempt)
+            logger.warning(
+                "Attempt %s/%s failed. Retrying in %ss. Error: %s",
+                attempt,
+                policy.max_retries,
+                delay,
+                exc,
+            )
+            raise JobRescheduledError(
+                job.id,
+                delay=delay,
+                attempt=attempt,
+            ) from exc
@@ -1,31 +1,49 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import functools
 import sys
-from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar, cast, get_type_hints
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar, cast
 
 from typing_extensions import override
 
-from jobify._internal.common.constants import PATCH_SUFFIX
+from jobify._internal.common.constants import PATCH_SUFFIX, RunMode
 from jobify._internal.configuration import Cron
 from jobify._internal.exceptions import (
     raise_app_already_started_error,
     raise_app_not_started_error,
 )
-from jobify._internal.injection import inject_context
+from jobify._internal.injection import has_injection, inject_context
 from jobify._internal.inspection import FuncSpec, make_func_spec
 from jobify._internal.middleware.base import build_middleware
+from jobify._internal.middleware.cache import CacheMiddleware
+from jobify._internal.middleware.circuit_breaker import (
+    CircuitBreakerMiddleware,
+)
 from jobify._internal.middleware.exceptions import ExceptionMiddleware
 from jobify._internal.middleware.retry import RetryMiddleware
 from jobify._internal.middleware.timeout import TimeoutMiddleware
 from jobify._internal.router.base import Registrator, Route, Router
-from jobify._internal.runners import Runnable, create_run_strategy
-from jobify._internal.scheduler.scheduler import ScheduleBuilder
+from jobify._internal.runners import (
+    PoolStrategy,
+    Runnable,
+    create_run_strategy,
+)
+from jobify._internal.scheduler.scheduler import (
+    RouteSchedule,
+    ScheduleBuilder,
+)
 from jobify._internal.serializers.json_extended import ExtendedJSONSerializer
 
 if TYPE_CHECKING:
     import inspect
-    from collections.abc import Callable, Iterator, Sequence
+    from collections.abc import (
+        AsyncGenerator,
+        Callable,
+        Iterator,
+        Sequence,
+    )
 
     from jobify._internal.common.datastructures import State
     from jobify._internal.common.types import Lifespan
@@ -34,6 +52,7 @@ if TYPE_CHECKING:
         RouteOptions,
     )
     from jobify._internal.context import JobContext
+    from jobify._internal.metrics import RouteMetrics
     from jobify._internal.middleware.base import BaseMiddleware, CallNext
     from jobify._internal.middleware.exceptions import (
         ExceptionHandler,
@@ -42,6 +61,7 @@ if TYPE_CHECKING:
     )
     from jobify._internal.router.node import NodeRouter
     from jobify._internal.runners import RunStrategy
+    from jobify._internal.scheduler.stream import JobStream
     from jobify._internal.shared_state import SharedState
 
 
@@ -58,7 +78,6 @@ class RootRoute(Route[ParamsT, ReturnT]):
         *,
         name: str,
         func: Callable[ParamsT, ReturnT],
-        func_spec: FuncSpec[ReturnT],
         state: State,
         options: RouteOptions,
         strategy: RunStrategy[ParamsT, ReturnT],
@@ -68,10 +87,14 @@ class RootRoute(Route[ParamsT, ReturnT]):
         super().__init__(name, func, options)
         self._run_strategy: RunStrategy[ParamsT, ReturnT] = strategy
         self._chain_middleware: CallNext | None = None
+        # Built on the first schedule after every startup.
+        self._schedule: RouteSchedule[ReturnT] | None = None
         self._shared_state: SharedState = shared_state
+        self.metrics: RouteMetrics = shared_state.metrics.route(name)
         self.state: State = state
-        self.func_spec: FuncSpec[ReturnT] = func_spec
         self.jobify_config: JobifyConfiguration = jobify_config
+        # Inspected on first use, which keeps registration cheap.
+        self._func_spec: FuncSpec[ReturnT] | None = None
 
         # --------------------------------------------------------------------
         # HACK: ProcessPoolExecutor / Multiprocessing  # noqa: ERA001, FIX004
@@ -90,8 +113,19 @@ class RootRoute(Route[ParamsT, ReturnT]):
         # 1. If `register` is used as a direct function call (`reg(my_func)`),
         #    because `my_func` in the module still points to the original.
         # 2. If the function has already been renamed (protects from re-entry).
+        #
+        # Only the functions sent to another process or interpreter are
+        # pickled, so the routes of the other run modes are left alone.
+        # It cannot wait for startup: a worker process imports the module
+        # and needs the renamed function right after the registration.
         # --------------------------------------------------------------------
 
+        if not (
+            isinstance(strategy, PoolStrategy)
+            and strategy.mode in (RunMode.PROCESS, RunMode.INTERPRETER)
+        ):
+            return
+
         # Guard 1: Protect against double-renaming
         if func.__name__.endswith(PATCH_SUFFIX):
             return
@@ -113,13 +147,28 @@ class RootRoute(Route[ParamsT, ReturnT]):
             func.__qualname__ = new_qualname
         setattr(module, new_name, func)
 
+    @property
+    def func_spec(self) -> FuncSpec[ReturnT]:
+        if (func_spec := self._func_spec) is None:
+            func_spec = self._func_spec = self._inspect()
+        return func_spec
+
+    def _inspect(self) -> FuncSpec[ReturnT]:
+        func_spec = make_func_spec(self.func)
+        serializer = self.jobify_config.serializer
+        if isinstance(serializer, ExtendedJSONSerializer):
+            serializer.registry_types(
+                [*func_spec.params_type.values(), func_spec.result_type],
+            )
+        return func_spec
+
     @override
     def schedule(
         self,
         *args: ParamsT.args,
         **kwargs: ParamsT.kwargs,
     ) -> ScheduleBuilder[Any]:
-        bound = self.func_spec.signature.bind(*args, **kwargs)
+        bound = self.func_spec.bind(*args, **kwargs)
         return self.create_builder(bound)
 
     def create_builder(
@@ -127,17 +176,48 @@ class RootRoute(Route[ParamsT, ReturnT]):
         bound: inspect.BoundArguments,
         /,
     ) -> ScheduleBuilder[Any]:
+        if (schedule := self._schedule) is None:
+            schedule = self._create_schedule()
+        elif not self.jobify_config.app_started:
+            raise_app_not_started_error("schedule")
+        runnable = Runnable(
+            self._run_strategy, bound, schedule.func_spec.injection
+        )
+        return ScheduleBuilder(schedule, runnable)
+
+    def _create_schedule(self) -> RouteSchedule[ReturnT]:
         if not (self.jobify_config.app_started and self._chain_middleware):
             raise_app_not_started_error("schedule")
-        return ScheduleBuilder(
-            state=self.state,
-            options=self.options,
+        self._schedule = RouteSchedule.create(
             func_name=self.name,
             func_spec=self.func_spec,
+            options=self.options,
+            state=self.state,
             shared_state=self._shared_state,
             jobify_config=self.jobify_config,
             chain_middleware=self._chain_middleware,
-            runnable=Runnable(self._run_strategy, bound),
+            metrics=self.metrics,
+            is_stream=self._run_strategy.is_stream,
+        )
+        if (shards := self.jobify_config.shards) is not None:
+            self._schedule = self._schedule.sharded(
+                shards,
+                pinned=self._is_pinned(),
+            )
+        return self._schedule
+
+    def _is_pinned(self) -> bool:
+        # The state of these routes belongs to one event loop, or is not
+        # safe to share between threads.
+        strategy = self._run_strategy
+        return (
+            strategy.is_stream
+            or self.options.get("cache") is not None
+            or self.options.get("circuit_breaker") is not None
+            or (
+                isinstance(strategy, PoolStrategy)
+                and strategy.mode in (RunMode.PROCESS, RunMode.INTERPRETER)
+            )
         )
 
 
@@ -155,11 +235,37 @@ class RootRegistrator(Registrator[RootRoute[..., Any]]):
         self._shared_state: SharedState = shared_state
         self._exc_handlers: ExceptionHandlers = dict(exception_handlers or {})
         self._jobify_config: JobifyConfiguration = jobify_config
-        self._system_middleware: list[BaseMiddleware] = [
-            ExceptionMiddleware(self._exc_handlers, jobify_config),
-            RetryMiddleware(),
-            TimeoutMiddleware(),
-        ]
+        self._exc_middleware: ExceptionMiddleware = ExceptionMiddleware(
+            self._exc_handlers,
+            jobify_config,
+        )
+        self._retry_middleware: RetryMiddleware = RetryMiddleware()
+        self._timeout_middleware: TimeoutMiddleware = TimeoutMiddleware()
+        self._breakers: dict[str, CircuitBreakerMiddleware] = {}
+        self._caches: dict[str, CacheMiddleware] = {}
+
+    def system_middleware(
+        self,
+        route: RootRoute[..., Any],
+    ) -> list[BaseMiddleware]:
+        """Return the system middleware that has work to do for a route.
+
+        Retries and timeouts are configured per route and exception handlers
+        cannot change after startup, so the rest is left out of the chain.
+        """
+        options = route.options
+        middleware: list[BaseMiddleware] = []
+        if self._exc_handlers:
+            middleware.append(self._exc_middleware)
+        if cache := self._caches.get(route.name):
+            middleware.append(cache)
+        if options.get("retry") is not None:
+            middleware.append(self._retry_middleware)
+        if breaker := self._breakers.get(route.name):
+            middleware.append(breaker)
+        if options.get("timeout") is not None:
+            middleware.append(self._timeout_middleware)
+        return middleware
 
     @override
     def register(
@@ -171,19 +277,19 @@ class RootRegistrator(Registrator[RootRoute[..., Any]]):
         if self._jobify_config.app_started is True:
             raise_app_already_started_error("register")
 
-        if isinstance(self._jobify_config.serializer, ExtendedJSONSerializer):
-            hints = get_type_hints(func)
-            self._jobify_config.serializer.registry_types(hints.values())
-
         strategy = create_run_strategy(
             func,
             self._jobify_config,
             mode=options.get("run_mode"),
         )
+        cache_config = options.get("cache")
+        if cache_config is not None and strategy.is_stream:
+            msg = f"Route {name} produces a stream and cannot be cached."
+            raise ValueError(msg)
+
         route = RootRoute(
             name=name,
             func=func,
-            func_spec=make_func_spec(func),
             state=self.state,
             options=options,
             strategy=strategy,
@@ -191,7 +297,17 @@ class RootRegistrator(Registrator[RootRoute[..., Any]]):
             jobify_config=self._jobify_config,
         )
         _ = functools.update_wrapper(route, func)
+        if has_injection(func):
+            # Checks the INJECT parameters when the task is registered.
+            _ = route.func_spec
         self._routes[name] = route
+        if breaker_config := options.get("circuit_breaker"):
+            self._breakers[name] = CircuitBreakerMiddleware(
+                name,
+                breaker_config,
+            )
+        if cache_config is not None:
+            self._caches[name] = CacheMiddleware(name, cache_config)
 
         if cron := options.get("cron"):
             if isinstance(cron, str):
@@ -204,7 +320,12 @@ class RootRegistrator(Registrator[RootRoute[..., Any]]):
     def start_pending_crons(self) -> None:
         for route, cron, func_name in self.state.pop(PENDING_CRON_JOBS, []):
             builder = route.schedule()
-            builder._cron(cron=cron, job_id=func_name, now=builder._now())
+            _ = builder._cron(
+                cron=cron,
+                job_id=func_name,
+                now=builder._now(),
+                stored=False,
+            )
 
 
 class RootRouter(Router):
@@ -240,6 +361,7 @@ class RootRouter(Router):
         if self.task._jobify_config.app_started is True:
             raise_app_already_started_error("add_exception_handler")
         self.task._exc_handlers[cls_exc] = handler
+        self.task._exc_middleware.clear_cache()
 
     @override
     def add_middleware(self, middleware: BaseMiddleware) -> None:
@@ -273,14 +395,22 @@ class RootRouter(Router):
     async def _propagate_startup(self, router: Router) -> None:
         await router.task.emit_startup()
 
-        final_middleware = [
-            *router.task._middleware,
-            *self.task._system_middleware,
-        ]
-        chain = build_middleware(final_middleware, self._entry)
+        # Routes with the same applicable middleware share a chain.
+        chains: dict[tuple[Any, ...], CallNext] = {}
         for route in cast("Iterator[RootRoute[..., Any]]", router.routes):
             route.state = router.task.state
+            system_middleware = self.task.system_middleware(route)
+            is_stream = route._run_strategy.is_stream
+            key = (is_stream, *map(id, system_middleware))
+            if (chain := chains.get(key)) is None:
+                entry = self._entry_stream if is_stream else self._entry
+                chain = build_middleware(
+                    [*router.task._middleware, *system_middleware],
+                    entry,
+                )
+                chains[key] = chain
             route._chain_middleware = chain
+            route._schedule = None
 
         for sub_router in router.sub_routers:
             sub_router.task.state = router.task.state | sub_router.task.state
@@ -295,5 +425,28 @@ class RootRouter(Router):
             await router.task.emit_shutdown()
 
     async def _entry(self, context: JobContext) -> Any:  # noqa: ANN401
-        inject_context(context)
-        return await context.runnable()
+        if context.runnable.injection:
+            inject_context(context)
+        if (on_start := context._on_start) is not None:
+            on_start()
+        try:
+            return await context.runnable()
+        except asyncio.CancelledError:
+            # Lets a function still running in a worker thread stop early.
+            context.cancel_token.cancel()
+            raise
+
+    async def _entry_stream(self, context: JobContext) -> None:
+        if context.runnable.injection:
+            inject_context(context)
+        stream = cast("JobStream[Any]", context.job._stream)
+        if (on_start := context._on_start) is not None:
+            on_start()
+        try:
+            items = cast("AsyncGenerator[Any, None]", await context.runnable())
+            async with contextlib.aclosing(items):
+                async for item in items:
+                    await stream.put(item)
+        except asyncio.CancelledError:
+            context.cancel_token.cancel()
+            raise
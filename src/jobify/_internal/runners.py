@@ -1,23 +1,44 @@
 from __future__ import annotations
 
+import asyncio
 import functools
 import inspect
+import sys
 import warnings
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
-from typing import TYPE_CHECKING, Final, Generic, ParamSpec, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Final,
+    Generic,
+    ParamSpec,
+    TypeVar,
+    cast,
+)
 
 from typing_extensions import override
 
-from jobify._internal.common.constants import RunMode
+from jobify._internal.common.constants import EMPTY, RunMode
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import (
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Generator,
+    )
     from concurrent.futures import Executor
 
     from jobify._internal.common.types import LoopFactory
-    from jobify._internal.configuration import JobifyConfiguration
+    from jobify._internal.configuration import (
+        JobifyConfiguration,
+        WorkerPools,
+    )
+    from jobify._internal.injection import InjectionPlan
 
+T = TypeVar("T")
 ReturnT = TypeVar("ReturnT")
 ParamsT = ParamSpec("ParamsT")
 
@@ -25,6 +46,9 @@ ParamsT = ParamSpec("ParamsT")
 class RunStrategy(ABC, Generic[ParamsT, ReturnT]):
     __slots__: tuple[str, ...] = ("func",)
 
+    # Streaming strategies return an async iterator of the produced items.
+    is_stream: ClassVar[bool] = False
+
     def __init__(self, func: Callable[ParamsT, ReturnT]) -> None:
         self.func: Final = func
 
@@ -47,6 +71,10 @@ class SyncStrategy(RunStrategy[ParamsT, ReturnT]):
         return self.func(*args, **kwargs)
 
 
+class AsyncGenStrategy(SyncStrategy[ParamsT, ReturnT]):
+    is_stream: ClassVar[bool] = True
+
+
 class AsyncStrategy(RunStrategy[ParamsT, ReturnT]):
     @override
     async def __call__(
@@ -58,16 +86,18 @@ class AsyncStrategy(RunStrategy[ParamsT, ReturnT]):
 
 
 class PoolStrategy(RunStrategy[ParamsT, ReturnT]):
-    __slots__: tuple[str, ...] = ("executor", "getloop")
+    __slots__: tuple[str, ...] = ("getloop", "mode", "worker_pools")
 
     def __init__(
         self,
         func: Callable[ParamsT, ReturnT],
-        executor: Executor | None,
+        worker_pools: WorkerPools,
+        mode: RunMode,
         getloop: LoopFactory,
     ) -> None:
         super().__init__(func)
-        self.executor: Executor | None = executor
+        self.worker_pools: WorkerPools = worker_pools
+        self.mode: RunMode = mode
         self.getloop: LoopFactory = getloop
 
     @override
@@ -77,19 +107,67 @@ class PoolStrategy(RunStrategy[ParamsT, ReturnT]):
         **kwargs: ParamsT.kwargs,
     ) -> ReturnT:
         func_call = functools.partial(self.func, *args, **kwargs)
-        return await self.getloop().run_in_executor(self.executor, func_call)
+        loop = self.getloop()
+        if self.mode is RunMode.PROCESS:
+            return await self.worker_pools.run_in_processpool(func_call, loop)
+        executor = self.worker_pools.get_executor(self.mode)
+        return await loop.run_in_executor(executor, func_call)
+
+
+async def iterate_in_executor(
+    generator: Generator[T, None, None],
+    executor: Executor | None,
+    loop: asyncio.AbstractEventLoop,
+) -> AsyncIterator[T]:
+    step: asyncio.Future[T] | None = None
+    try:
+        while True:
+            step = loop.run_in_executor(executor, next, generator, EMPTY)
+            # Shielded, as a cancelled step still runs in its thread.
+            item = await asyncio.shield(step)
+            if item is EMPTY:
+                return
+            yield item
+    finally:
+        if step is not None and not step.done():
+            # A generator cannot be closed while it is executing.
+            _ = await asyncio.wait((step,))
+            _ = step.exception()
+        await loop.run_in_executor(executor, generator.close)
+
+
+class SyncGenStrategy(PoolStrategy[ParamsT, ReturnT]):
+    is_stream: ClassVar[bool] = True
+
+    @override
+    async def __call__(
+        self,
+        *args: ParamsT.args,
+        **kwargs: ParamsT.kwargs,
+    ) -> ReturnT:
+        # Creating the generator does not run its body, so only the steps
+        # of the iteration are moved to the executor.
+        generator = cast(
+            "Generator[Any, None, None]",
+            self.func(*args, **kwargs),
+        )
+        executor = self.worker_pools.get_executor(self.mode)
+        items = iterate_in_executor(generator, executor, self.getloop())
+        return cast("ReturnT", items)
 
 
 class Runnable(Generic[ReturnT]):
-    __slots__: tuple[str, ...] = ("bound", "strategy")
+    __slots__: tuple[str, ...] = ("bound", "injection", "strategy")
 
     def __init__(
         self,
         strategy: RunStrategy[ParamsT, ReturnT],
         bound: inspect.BoundArguments,
+        injection: InjectionPlan = (),
     ) -> None:
         self.strategy: Final = strategy
         self.bound: inspect.BoundArguments = bound
+        self.injection: InjectionPlan = injection
 
     def __call__(self) -> Awaitable[ReturnT]:
         return self.strategy(*self.bound.args, **self.bound.kwargs)
@@ -97,15 +175,18 @@ class Runnable(Generic[ReturnT]):
 
 def _validate_run_mode(mode: RunMode | None, *, is_async: bool) -> RunMode:
     if is_async:
-        if mode in (RunMode.PROCESS, RunMode.THREAD):
+        if mode in (RunMode.PROCESS, RunMode.THREAD, RunMode.INTERPRETER):
             msg = (
                 "Async functions are always done in the main loop."
-                " This mode (PROCESS/THREAD) is not used."
+                " This mode (PROCESS/THREAD/INTERPRETER) is not used."
             )
             warnings.warn(msg, category=RuntimeWarning, stacklevel=3)
         return RunMode.MAIN
     if mode is None:
         return RunMode.THREAD
+    if mode is RunMode.INTERPRETER and sys.version_info < (3, 14):
+        msg = "RunMode.INTERPRETER requires Python 3.14 or newer."
+        raise RuntimeError(msg)
     return mode
 
 
@@ -117,18 +198,37 @@ def create_run_strategy(
 ) -> RunStrategy[ParamsT, ReturnT]:
     # inspect.iscoroutinefunction returns TypeGuard,
     # but we need a regular bool variable
-    is_async = bool(inspect.iscoroutinefunction(func))
+    is_async_gen = bool(inspect.isasyncgenfunction(func))
+    is_sync_gen = bool(inspect.isgeneratorfunction(func))
+    is_async = bool(inspect.iscoroutinefunction(func)) or is_async_gen
 
     mode = _validate_run_mode(mode, is_async=is_async)
+    if is_async_gen:
+        return AsyncGenStrategy(func)
     if is_async:
         return AsyncStrategy(func)
 
+    if is_sync_gen:
+        if mode is not RunMode.THREAD:
+            msg = (
+                "Generator functions can only stream from RunMode.THREAD,"
+                f" got {mode}."
+            )
+            raise ValueError(msg)
+        return SyncGenStrategy(
+            func,
+            jobify_config.worker_pools,
+            mode,
+            jobify_config.getloop,
+        )
+
     match mode:
-        case RunMode.PROCESS:
-            processpool = jobify_config.worker_pools.processpool
-            return PoolStrategy(func, processpool, jobify_config.getloop)
-        case RunMode.THREAD:
-            threadpool = jobify_config.worker_pools.threadpool
-            return PoolStrategy(func, threadpool, jobify_config.getloop)
+        case RunMode.PROCESS | RunMode.INTERPRETER | RunMode.THREAD:
+            return PoolStrategy(
+                func,
+                jobify_config.worker_pools,
+                mode,
+                jobify_config.getloop,
+            )
         case _:
             return SyncStrategy(func)
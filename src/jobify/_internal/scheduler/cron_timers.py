@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Generic, TypeAlias, TypeVar, final
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable
+    from datetime import datetime, tzinfo
+
+    from jobify._internal.cron_parser import CronParser
+
+T = TypeVar("T")
+
+GroupKey: TypeAlias = "tuple[str, tzinfo | None]"
+
+
+@final
+class CronTimer(Generic[T]):
+    """The place of one job in a `CronTick`, cancelled like a timer handle."""
+
+    __slots__: tuple[str, ...] = ("_arg", "_callback", "_cancelled", "_tick")
+
+    def __init__(
+        self,
+        tick: CronTick,
+        callback: Callable[[T], None],
+        arg: T,
+    ) -> None:
+        self._tick: CronTick = tick
+        self._callback: Callable[[T], None] = callback
+        self._arg: T = arg
+        self._cancelled: bool = False
+
+    def cancel(self) -> None:
+        if not self._cancelled:
+            self._cancelled = True
+            self._tick.discard(self)
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def run(self) -> None:
+        self._callback(self._arg)
+
+
+@final
+class CronTick:
+    """The single timer of the jobs of a group that run at the same time."""
+
+    __slots__: tuple[str, ...] = ("_group", "at", "handle", "timers")
+
+    def __init__(self, group: CronGroup, at: datetime) -> None:
+        self._group: CronGroup = group
+        self.at: datetime = at
+        self.handle: asyncio.TimerHandle | None = None
+        self.timers: dict[int, CronTimer[Any]] = {}
+
+    def discard(self, timer: CronTimer[Any]) -> None:
+        if self.timers.pop(id(timer), None) is None:
+            return  # Already fired.
+        if not self.timers and self.handle is not None:
+            self.handle.cancel()
+            self._group.remove(self)
+
+    def fire(self) -> None:
+        self._group.remove(self)
+        timers, self.timers = self.timers, {}
+        for timer in timers.values():
+            timer.run()
+
+
+@final
+class CronGroup:
+    """The cron jobs of one event loop with the same expression and zone.
+
+    The next run is computed once for the whole group: it stays valid
+    until the time it returns, whichever job of the group asks for it.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_after",
+        "_next",
+        "_timers",
+        "key",
+        "parser",
+        "ticks",
+    )
+
+    def __init__(
+        self,
+        timers: CronTimers,
+        key: GroupKey,
+        parser: CronParser,
+    ) -> None:
+        self._timers: CronTimers = timers
+        self.key: GroupKey = key
+        self.parser: CronParser = parser
+        self.ticks: dict[datetime, CronTick] = {}
+        self._after: datetime | None = None
+        self._next: datetime | None = None
+
+    def next_run(self, now: datetime) -> datetime:
+        after, next_at = self._after, self._next
+        if after is None or next_at is None or not after <= now < next_at:
+            next_at = self._next = self.parser.next_run(now=now)
+            self._after = now
+        return next_at
+
+    def call_at(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        when: float,
+        at: datetime,
+        callback: Callable[[T], None],
+        arg: T,
+    ) -> CronTimer[T]:
+        """Add a job to the tick of the group at `at`, started if new."""
+        if (tick := self.ticks.get(at)) is None:
+            if not self.ticks:
+                self._timers.add(self)
+            tick = self.ticks[at] = CronTick(self, at)
+            tick.handle = loop.call_at(when, tick.fire)
+        timer = CronTimer(tick, callback, arg)
+        tick.timers[id(timer)] = timer
+        return timer
+
+    def remove(self, tick: CronTick) -> None:
+        if self.ticks.get(tick.at) is tick:
+            del self.ticks[tick.at]
+        if not self.ticks:
+            self._timers.remove(self)
+
+
+@final
+class CronTimers:
+    """The cron groups of one event loop, by expression and time zone.
+
+    Jobs of a group that run at the same time share one timer, which
+    starts all of them in a single pass. A group is kept while it has a
+    timer running.
+    """
+
+    __slots__: tuple[str, ...] = ("_groups",)
+
+    def __init__(self) -> None:
+        self._groups: dict[GroupKey, CronGroup] = {}
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def group(
+        self,
+        expression: str,
+        tz: tzinfo | None,
+        parser: CronParser,
+    ) -> CronGroup:
+        key = (expression, tz)
+        if (group := self._groups.get(key)) is None:
+            group = CronGroup(self, key, parser)
+        return group
+
+    def add(self, group: CronGroup) -> None:
+        self._groups[group.key] = group
+
+    def remove(self, group: CronGroup) -> None:
+        if self._groups.get(group.key) is group:
+            del self._groups[group.key]
@@ -1,33 +1,53 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Generic, TypeVar, final
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar, final
 
 from typing_extensions import override
 
 from jobify._internal.common.constants import EMPTY, JobStatus
 from jobify._internal.exceptions import JobFailedError, JobNotCompletedError
+from jobify._internal.shards import call_in_loop
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from datetime import datetime
 
+    from jobify._internal.scheduler.registry import JobRegistry
+    from jobify._internal.scheduler.stream import JobStream
     from jobify._internal.storage.abc import Storage
 
 ReturnT = TypeVar("ReturnT")
 
 
+class TimerHandle(Protocol):
+    """A started timer, either an `asyncio.Handle` or a `CronTimer`."""
+
+    def cancel(self) -> None: ...
+
+    def cancelled(self) -> bool: ...
+
+
 @final
 class Job(Generic[ReturnT]):
     __slots__: tuple[str, ...] = (
+        "_done",
         "_event",
+        "_event_loop",
+        "_exec_at",
         "_handle",
+        "_loop",
         "_pending_jobs",
         "_result",
         "_status",
         "_storage",
+        "_stream",
+        "_task",
+        "_trace_context",
+        "attempt",
         "cron_expression",
         "exception",
-        "exec_at",
+        "func_name",
         "id",
     )
 
@@ -36,26 +56,49 @@ class Job(Generic[ReturnT]):
         *,
         job_id: str,
         exec_at: datetime,
-        pending_jobs: dict[str, Job[ReturnT]],
+        pending_jobs: JobRegistry,
         job_status: JobStatus = JobStatus.SCHEDULED,
         storage: Storage,
         cron_expression: str | None = None,
+        stream: JobStream[Any] | None = None,
+        attempt: int = 0,
+        func_name: str = "",
+        loop: asyncio.AbstractEventLoop | None = None,
     ) -> None:
-        self._event = asyncio.Event()
+        # Created by the first `wait()`, as most jobs are never awaited.
+        self._event: asyncio.Event | None = None
+        self._event_loop: asyncio.AbstractEventLoop | None = None
+        # The loop of the shard of the job, `None` if the app is not sharded.
+        self._loop = loop
+        self._done: bool = False
         self._pending_jobs = pending_jobs
         self._result: ReturnT = EMPTY
         self._status = job_status
         self._storage = storage
-        self._handle: asyncio.Handle | None = None
+        self._handle: TimerHandle | None = None
+        self._stream = stream
+        self._task: asyncio.Task[None] | None = None
+        self._trace_context: dict[str, str] | None = None
         self.id = job_id
+        self.func_name = func_name
+        self.attempt = attempt
         self.exception: Exception | None = None
         self.cron_expression = cron_expression
-        self.exec_at = exec_at
+        self._exec_at = exec_at
 
     @property
     def status(self) -> JobStatus:
         return self._status
 
+    @property
+    def exec_at(self) -> datetime:
+        return self._exec_at
+
+    @exec_at.setter
+    def exec_at(self, exec_at: datetime) -> None:
+        self._exec_at = exec_at
+        self._pending_jobs._move_due(self)
+
     @override
     def __repr__(self) -> str:
         return (
@@ -64,9 +107,15 @@ class Job(Generic[ReturnT]):
             f"exec_at={self.exec_at.isoformat()}"
         )
 
-    def bind_handle(self, handle: asyncio.Handle) -> None:
+    def bind_handle(self, handle: TimerHandle) -> None:
         self._handle = handle
 
+    def bind_task(self, task: asyncio.Task[None]) -> None:
+        # The timer has fired. Its handle refers back to the job, and would
+        # keep a completed job alive until the garbage collector runs.
+        self._handle = None
+        self._task = task
+
     def result(self) -> ReturnT:
         if self.status is JobStatus.SUCCESS or self._result is not EMPTY:
             return self._result
@@ -79,26 +128,43 @@ class Job(Generic[ReturnT]):
 
     def set_result(self, val: ReturnT, *, status: JobStatus) -> None:
         self._result = val
-        self._status = status
+        self._set_status(status)
+        # A cron job does not keep the error of a previous run.
+        self.exception = None
 
     def set_exception(self, exc: Exception, *, status: JobStatus) -> None:
         self.exception = exc
-        self._status = status
+        self._set_status(status)
 
     def update(
         self,
         *,
         exec_at: datetime,
         job_status: JobStatus,
-        time_handler: asyncio.TimerHandle,
+        time_handler: TimerHandle,
+        stream: JobStream[Any] | None = None,
     ) -> None:
-        self._status = job_status
-        self._event = asyncio.Event()
+        self._set_status(job_status)
+        self._event = None
+        self._done = False
         self._handle = time_handler
+        self._stream = stream
         self.exec_at = exec_at
 
+    def _set_status(self, status: JobStatus) -> None:
+        # Keeps the status index of the registry up to date.
+        if status is not self._status:
+            self._pending_jobs._move_status(self, status)
+            self._status = status
+
     def is_done(self) -> bool:
-        return self._event.is_set()
+        return self._done
+
+    def _set_done(self) -> None:
+        self._done = True
+        if (event := self._event) is not None:
+            # The waiter can be on the loop of another shard.
+            call_in_loop(self._event_loop, event.set)
 
     def is_reschedulable(self) -> bool:
         return self._status not in (
@@ -112,15 +178,61 @@ class Job(Generic[ReturnT]):
         If the job is already completed, this method returns immediately.
         Safe for concurrent use by multiple coroutines.
         """
-        _ = await self._event.wait()
+        if self._done:
+            return
+        if (event := self._event) is None:
+            event = self._event = asyncio.Event()
+            self._event_loop = asyncio.get_running_loop()
+            if self.is_done():
+                return  # Done by another shard before it saw the event.
+        _ = await event.wait()
+
+    async def stream(self) -> AsyncIterator[Any]:
+        """Iterate over the items of a streaming job as they are produced.
+
+        The job's route must be an async generator function, or a sync
+        generator function running in `RunMode.THREAD`. While a stream is
+        iterated, the producer is paused when the route's `stream_buffer`
+        is full, unless the route drops the oldest items instead.
+
+        Raises:
+            TypeError: The job does not belong to a streaming route.
+            JobFailedError: The producer failed after the items that were
+                already delivered.
+
+        """
+        if (stream := self._stream) is None:
+            msg = f"Job {self.id} does not produce a stream."
+            raise TypeError(msg)
+        async for item in stream:
+            yield item
+        if self._status in (JobStatus.FAILED, JobStatus.TIMEOUT):
+            raise JobFailedError(
+                self.id,
+                reason=str(self.exception),
+            ) from self.exception
 
     async def cancel(self) -> None:
-        self._status = JobStatus.CANCELLED
+        """Cancel the job and remove it from the storage.
+
+        A job that is already running is interrupted: the task is cancelled,
+        its `CancellationToken` is set and `RunMode.PROCESS` work is
+        terminated.
+        """
+        self._set_status(JobStatus.CANCELLED)
         self._cancel()
         await self._storage.delete_schedule(self.id)
 
     def _cancel(self) -> None:
-        self._event.set()
+        self._set_done()
+        if self._stream is not None:
+            self._stream.close()
         _ = self._pending_jobs.pop(self.id, None)
+        # The timer and the task belong to the loop of the shard.
+        call_in_loop(self._loop, self._stop)
+
+    def _stop(self) -> None:
         if self._handle is not None:
             self._handle.cancel()
+        if self._task is not None:
+            _ = self._task.cancel()
@@ -0,0 +1,461 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar, final, overload
+
+from typing_extensions import override
+
+from jobify._internal.common.constants import JobStatus
+from jobify._internal.shards import call_in_loop
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Iterator
+    from datetime import datetime
+
+    from jobify._internal.configuration import Retention
+    from jobify._internal.scheduler.job import Job
+
+T = TypeVar("T")
+
+
+@final
+class CompletedJobs:
+    """Completed jobs kept according to a `Retention`.
+
+    Jobs are stored in completion order, which is also the order in which
+    they expire, so both limits only ever drop the oldest entries.
+    """
+
+    __slots__: tuple[str, ...] = ("_by_route", "_jobs", "retention")
+
+    def __init__(self, retention: Retention) -> None:
+        self.retention: Retention = retention
+        # Job ID -> (expiration time, job).
+        self._jobs: OrderedDict[str, tuple[float, Job[Any]]] = OrderedDict()
+        self._by_route: dict[str, OrderedDict[str, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def add(self, job: Job[Any]) -> None:
+        now = time.monotonic()
+        self._expire(now)
+        ttl = self.retention.ttl
+        expires_at = now + ttl if ttl is not None else math.inf
+        self._jobs[job.id] = (expires_at, job)
+        self._jobs.move_to_end(job.id)
+        if (limit := self.retention.max_per_route) is None:
+            return
+        ids = self._by_route.setdefault(job.func_name, OrderedDict())
+        ids[job.id] = None
+        ids.move_to_end(job.id)
+        while len(ids) > limit:
+            job_id, _ = ids.popitem(last=False)
+            _ = self._jobs.pop(job_id, None)
+
+    def get(self, job_id: str) -> Job[Any] | None:
+        self._expire(time.monotonic())
+        if (entry := self._jobs.get(job_id)) is None:
+            return None
+        return entry[1]
+
+    def _expire(self, now: float) -> None:
+        jobs = self._jobs
+        while jobs:
+            job_id, (expires_at, job) = next(iter(jobs.items()))
+            if expires_at > now:
+                return
+            del jobs[job_id]
+            if (ids := self._by_route.get(job.func_name)) is not None:
+                _ = ids.pop(job_id, None)
+
+
+@final
+class DueIndex:
+    """Pending jobs ordered by `exec_at`.
+
+    A binary heap with lazy deletion: moving or removing a job only turns
+    its entry stale. Stale entries are skipped when the heap is read and
+    dropped all at once when they outnumber the live ones.
+    """
+
+    __slots__: tuple[str, ...] = ("_heap", "_live", "_seq")
+
+    def __init__(self) -> None:
+        # (exec_at timestamp, sequence number, job)
+        self._heap: list[tuple[float, int, Job[Any]]] = []
+        # Job ID -> sequence number of its live entry.
+        self._live: dict[str, int] = {}
+        self._seq: Iterator[int] = itertools.count()
+
+    def push(self, job: Job[Any]) -> None:
+        seq = next(self._seq)
+        self._live[job.id] = seq
+        heapq.heappush(self._heap, (job.exec_at.timestamp(), seq, job))
+        self._compact()
+
+    def discard(self, job_id: str) -> None:
+        if self._live.pop(job_id, None) is not None:
+            self._compact()
+
+    def __iter__(self) -> Iterator[Job[Any]]:
+        """Yield the jobs by `exec_at`, in O(log k) per job read.
+
+        The heap is walked as a tree, from the root down to the children of
+        the entries already yielded, so reading the first `k` jobs does not
+        depend on the size of the heap. It must not change meanwhile.
+        """
+        heap, live = self._heap, self._live
+        frontier = [(heap[0][:2], 0)] if heap else []
+        while frontier:
+            _, index = heapq.heappop(frontier)
+            _, seq, job = heap[index]
+            if live.get(job.id) == seq:
+                yield job
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child][:2], child))
+
+    def _compact(self) -> None:
+        heap = self._heap
+        if len(heap) <= 2 * len(self._live) + 64:
+            return
+        live = self._live
+        self._heap = [
+            entry for entry in heap if live.get(entry[2].id) == entry[1]
+        ]
+        heapq.heapify(self._heap)
+
+
+@final
+class JobRegistry(dict[str, "Job[Any]"]):
+    """Pending jobs by ID, indexed by route, status and `exec_at`.
+
+    The indexes and the number of jobs left per route are kept up to date
+    as jobs come and go, so `query` and `count` do not scan every job, and
+    waiting for the jobs to complete takes one event rather than one
+    waiter per job. A sharded app reads the registry of a shard from other
+    threads, so changes and reads go through a lock.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_by_route",
+        "_by_status",
+        "_crons",
+        "_due",
+        "_idle",
+        "_jobs",
+        "_lock",
+        "_total_crons",
+        "_total_jobs",
+        "completed",
+    )
+
+    def __init__(self, retention: Retention | None = None) -> None:
+        super().__init__()
+        self.completed: CompletedJobs | None = None
+        if retention is not None:
+            self.completed = CompletedJobs(retention)
+        self._jobs: Counter[str] = Counter()
+        self._crons: Counter[str] = Counter()
+        self._total_jobs: int = 0
+        self._total_crons: int = 0
+        # Set once the filter of its key has no jobs left, from the loop
+        # that waits for it.
+        self._idle: dict[
+            tuple[str | None, bool],
+            tuple[asyncio.Event, asyncio.AbstractEventLoop],
+        ] = {}
+        self._lock: threading.RLock = threading.RLock()
+        self._by_route: dict[str, dict[str, Job[Any]]] = {}
+        self._by_status: dict[JobStatus, dict[str, Job[Any]]] = {
+            status: {} for status in JobStatus
+        }
+        self._due: DueIndex = DueIndex()
+
+    def query(
+        self,
+        *,
+        route: str | None = None,
+        status: JobStatus | None = None,
+        due_before: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[Job[Any]]:
+        """Find the pending jobs that match all the given filters.
+
+        Args:
+            route: Name of the route of the jobs.
+            status: Current status of the jobs.
+            due_before: Only the jobs planned before this time.
+            limit: The maximum number of jobs to return.
+
+        Returns:
+            The matching jobs, the earliest `exec_at` first.
+
+        """
+        with self._lock:
+            candidates = self._candidates(route, status)
+            if candidates is None or (
+                limit is not None and limit * len(self) < len(candidates) ** 2
+            ):
+                # Most jobs match: read them in order and stop early.
+                jobs: list[Job[Any]] = []
+                for job in self._due:
+                    if len(jobs) == limit or (
+                        due_before is not None and job.exec_at >= due_before
+                    ):
+                        break
+                    if (route is None or job.func_name == route) and (
+                        status is None or job._status is status
+                    ):
+                        jobs.append(job)
+                return jobs
+
+            jobs = [
+                job
+                for job in candidates
+                if (route is None or job.func_name == route)
+                and (status is None or job._status is status)
+                and (due_before is None or job.exec_at < due_before)
+            ]
+        jobs.sort(key=_exec_at)
+        return jobs if limit is None else jobs[:limit]
+
+    def count(
+        self,
+        *,
+        route: str | None = None,
+        status: JobStatus | None = None,
+    ) -> int:
+        """Count the pending jobs that match all the given filters."""
+        if status is None:
+            if route is None:
+                return len(self)
+            return len(self._by_route.get(route, ()))
+        if route is None:
+            return len(self._by_status[status])
+        with self._lock:
+            candidates = self._candidates(route, status) or ()
+            return sum(
+                1
+                for job in candidates
+                if job.func_name == route and job._status is status
+            )
+
+    def outstanding(
+        self,
+        route: str | None = None,
+        *,
+        crons: bool = True,
+    ) -> int:
+        """Count the pending jobs, of one route or of all routes."""
+        if route is None:
+            return self._total_jobs + (self._total_crons if crons else 0)
+        return self._jobs[route] + (self._crons[route] if crons else 0)
+
+    def complete(self, job: Job[Any]) -> None:
+        """Remove a job that has run for the last time."""
+        with self._lock:
+            if self.pop(job.id, None) is job and self.completed is not None:
+                self.completed.add(job)
+
+    def find(self, job_id: str) -> Job[Any] | None:
+        """Find a pending job, or a completed one kept by the retention."""
+        with self._lock:
+            job = self.get(job_id)
+            if job is None and self.completed is not None:
+                job = self.completed.get(job_id)
+            return job
+
+    async def wait_idle(
+        self,
+        route: str | None = None,
+        *,
+        crons: bool = True,
+    ) -> None:
+        with self._lock:
+            if not self.outstanding(route, crons=crons):
+                return
+            key = (route, crons)
+            if (idle := self._idle.get(key)) is None:
+                loop = asyncio.get_running_loop()
+                idle = self._idle[key] = (asyncio.Event(), loop)
+        _ = await idle[0].wait()
+
+    @override
+    def __setitem__(self, key: str, job: Job[Any]) -> None:
+        with self._lock:
+            if (old := self.get(key)) is not None:
+                self._forget(old)
+            super().__setitem__(key, job)
+            if (by_route := self._by_route.get(job.func_name)) is None:
+                by_route = self._by_route[job.func_name] = {}
+            by_route[key] = job
+            self._by_status[job._status][key] = job
+            self._due.push(job)
+            if job.cron_expression is None:
+                self._jobs[job.func_name] += 1
+                self._total_jobs += 1
+            else:
+                self._crons[job.func_name] += 1
+                self._total_crons += 1
+
+    @override
+    def __delitem__(self, key: str) -> None:
+        _ = self.pop(key)
+
+    @overload
+    def pop(self, key: str, /) -> Job[Any]: ...
+    @overload
+    def pop(self, key: str, default: Job[Any] | T, /) -> Job[Any] | T: ...
+    @override
+    def pop(self, key: str, *default: Any) -> Any:
+        with self._lock:
+            if key not in self:
+                return super().pop(key, *default)
+            job = super().pop(key)
+            self._forget(job)
+            return job
+
+    @override
+    def popitem(self) -> tuple[str, Job[Any]]:
+        with self._lock:
+            item = super().popitem()
+            self._forget(item[1])
+            return item
+
+    @override
+    def clear(self) -> None:
+        with self._lock:
+            for job in tuple(self.values()):
+                _ = self.pop(job.id)
+
+    def _move_status(self, job: Job[Any], status: JobStatus) -> None:
+        with self._lock:
+            if self.get(job.id) is job:
+                del self._by_status[job._status][job.id]
+                self._by_status[status][job.id] = job
+
+    def _move_due(self, job: Job[Any]) -> None:
+        with self._lock:
+            if self.get(job.id) is job:
+                self._due.push(job)
+
+    def _candidates(
+        self,
+        route: str | None,
+        status: JobStatus | None,
+    ) -> Collection[Job[Any]] | None:
+        # The smaller of the indexes that match one of the filters.
+        by_route = None if route is None else self._by_route.get(route, {})
+        by_status = None if status is None else self._by_status[status]
+        if by_route is None or (
+            by_status is not None and len(by_status) < len(by_route)
+        ):
+            return None if by_status is None else by_status.values()
+        return by_route.values()
+
+    def _forget(self, job: Job[Any]) -> None:
+        route = job.func_name
+        del self._by_route[route][job.id]
+        del self._by_status[job._status][job.id]
+        self._due.discard(job.id)
+        if job.cron_expression is None:
+            self._jobs[route] -= 1
+            self._total_jobs -= 1
+        else:
+            self._crons[route] -= 1
+            self._total_crons -= 1
+        if self._idle:
+            self._wake(route)
+
+    def _wake(self, route: str) -> None:
+        for name in (None, route):
+            for crons in (False, True):
+                key = (name, crons)
+                if key in self._idle and not self.outstanding(
+                    name,
+                    crons=crons,
+                ):
+                    event, loop = self._idle.pop(key)
+                    call_in_loop(loop, event.set)
+
+
+@final
+class ShardedJobs(Mapping[str, "Job[Any]"]):
+    """The pending jobs of every shard of an app, by ID.
+
+    A read-only view over the registries of the shards, with the same
+    `query` and `count` as a `JobRegistry`.
+    """
+
+    __slots__: tuple[str, ...] = ("_registries",)
+
+    def __init__(self, registries: Iterable[JobRegistry]) -> None:
+        self._registries: tuple[JobRegistry, ...] = tuple(registries)
+
+    @override
+    def __getitem__(self, key: str) -> Job[Any]:
+        for registry in self._registries:
+            if (job := registry.get(key)) is not None:
+                return job
+        raise KeyError(key)
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        for registry in self._registries:
+            yield from tuple(registry)
+
+    @override
+    def __len__(self) -> int:
+        return sum(map(len, self._registries))
+
+    def query(
+        self,
+        *,
+        route: str | None = None,
+        status: JobStatus | None = None,
+        due_before: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[Job[Any]]:
+        """Find the pending jobs that match all the given filters.
+
+        See `JobRegistry.query`. The results of the shards are merged, the
+        earliest `exec_at` first.
+        """
+        merged = heapq.merge(
+            *(
+                registry.query(
+                    route=route,
+                    status=status,
+                    due_before=due_before,
+                    limit=limit,
+                )
+                for registry in self._registries
+            ),
+            key=_exec_at,
+        )
+        return list(itertools.islice(merged, limit))
+
+    def count(
+        self,
+        *,
+        route: str | None = None,
+        status: JobStatus | None = None,
+    ) -> int:
+        """Count the pending jobs that match all the given filters."""
+        return sum(
+            registry.count(route=route, status=status)
+            for registry in self._registries
+        )
+
+
+def _exec_at(job: Job[Any]) -> datetime:
+    return job.exec_at
@@ -1,39 +1,61 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
 import logging
+import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from itertools import count
-from typing import TYPE_CHECKING, Generic, TypeVar
-from uuid import uuid4
-
-from jobify._internal.common.constants import INFINITY, JobStatus
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+
+from jobify._internal.common.constants import (
+    DEFAULT_STREAM_BUFFER,
+    INFINITY,
+    JobStatus,
+    StreamOverflow,
+)
 from jobify._internal.common.datastructures import RequestState, State
 from jobify._internal.configuration import Cron
 from jobify._internal.context import JobContext
-from jobify._internal.exceptions import DuplicateJobError, JobTimeoutError
+from jobify._internal.exceptions import (
+    DuplicateJobError,
+    JobRescheduledError,
+    JobTimeoutError,
+    clear_frames,
+)
 from jobify._internal.message import AtArguments, CronArguments, Message
 from jobify._internal.scheduler.job import Job
+from jobify._internal.scheduler.stream import JobStream
 from jobify._internal.storage.abc import ScheduledJob
 from jobify._internal.storage.dummy import DummyStorage
+from jobify._internal.typeadapter.dummy import DummyDumper
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
     from jobify._internal.configuration import (
         JobifyConfiguration,
         RouteOptions,
     )
     from jobify._internal.cron_parser import CronParser
     from jobify._internal.inspection import FuncSpec
+    from jobify._internal.metrics import RouteMetrics
     from jobify._internal.middleware.base import CallNext
     from jobify._internal.runners import Runnable
+    from jobify._internal.scheduler.cron_timers import CronGroup, CronTimer
+    from jobify._internal.shards import Shards
     from jobify._internal.shared_state import SharedState
+    from jobify._internal.tracing import Span, Tracer
 
 
 logger = logging.getLogger("jobify.scheduler")
 
 
 ReturnT = TypeVar("ReturnT")
+T = TypeVar("T")
 
 
 @dataclass(slots=True, kw_only=True)
@@ -43,6 +65,8 @@ class CronContext(Generic[ReturnT]):
     cron_parser: CronParser
     exec_count: count[int] = field(default_factory=lambda: count(start=1))
     failure_count: int = 0
+    # Kept in the storage, unlike the crons of `@app.task(cron=...)`.
+    stored: bool = False
 
     def is_run_allowed_by_limit(self) -> bool:
         if self.cron.max_runs == INFINITY:
@@ -53,38 +77,125 @@ class CronContext(Generic[ReturnT]):
         return self.failure_count < self.cron.max_failures
 
 
+@dataclass(slots=True, kw_only=True, frozen=True)
+class RouteSchedule(Generic[ReturnT]):
+    """What the jobs of one route share, computed once per startup."""
+
+    func_name: str
+    func_spec: FuncSpec[ReturnT]
+    options: RouteOptions
+    state: State
+    shared_state: SharedState
+    jobify_config: JobifyConfiguration
+    chain_middleware: CallNext
+    metrics: RouteMetrics
+    persist: bool
+    # `None` for routes that do not produce a stream.
+    stream_buffer: int | None
+    stream_overflow: StreamOverflow
+    injected: frozenset[str]
+    dump_arguments: bool
+    # The loop of the shard, `None` if the app is not sharded.
+    loop: asyncio.AbstractEventLoop | None = None
+    # One schedule per shard, empty for a schedule that is not split.
+    shards: tuple[RouteSchedule[ReturnT], ...] = ()
+
+    @classmethod
+    def create(  # noqa: PLR0913
+        cls,
+        *,
+        func_name: str,
+        func_spec: FuncSpec[ReturnT],
+        options: RouteOptions,
+        state: State,
+        shared_state: SharedState,
+        jobify_config: JobifyConfiguration,
+        chain_middleware: CallNext,
+        metrics: RouteMetrics,
+        is_stream: bool,
+    ) -> RouteSchedule[ReturnT]:
+        return cls(
+            func_name=func_name,
+            func_spec=func_spec,
+            options=options,
+            state=state,
+            shared_state=shared_state,
+            jobify_config=jobify_config,
+            chain_middleware=chain_middleware,
+            metrics=metrics,
+            persist=(
+                type(jobify_config.storage) is not DummyStorage
+                and options.get("durable", True) is True
+            ),
+            stream_buffer=(
+                options.get("stream_buffer", DEFAULT_STREAM_BUFFER)
+                if is_stream
+                else None
+            ),
+            # Nobody can read a cron fire before it starts.
+            stream_overflow=options.get(
+                "stream_overflow",
+                StreamOverflow.DROP_OLDEST
+                if options.get("cron")
+                else StreamOverflow.WAIT,
+            ),
+            injected=frozenset(name for name, _ in func_spec.injection),
+            dump_arguments=type(jobify_config.dumper) is not DummyDumper,
+        )
+
+    def sharded(
+        self,
+        shards: Shards,
+        *,
+        pinned: bool,
+    ) -> RouteSchedule[ReturnT]:
+        """Split the schedule between the shards of the app.
+
+        A pinned route keeps all its jobs on shard 0.
+        """
+        if pinned:
+            return dataclasses.replace(self, loop=shards.loops[0])
+        schedules = tuple(
+            dataclasses.replace(
+                self,
+                shared_state=state,
+                metrics=state.metrics.route(self.func_name),
+                loop=loop,
+            )
+            for state, loop in zip(shards.states, shards.loops, strict=True)
+        )
+        return dataclasses.replace(schedules[0], shards=schedules)
+
+
 class ScheduleBuilder(Generic[ReturnT]):
     __slots__: tuple[str, ...] = (
-        "_chain_middleware",
         "_configs",
+        "_route",
         "_runnable",
         "_shared_state",
-        "_state",
-        "func_name",
-        "func_spec",
-        "route_options",
     )
 
-    def __init__(  # noqa: PLR0913
+    def __init__(
         self,
-        *,
-        state: State,
-        shared_state: SharedState,
-        jobify_config: JobifyConfiguration,
+        route: RouteSchedule[ReturnT],
         runnable: Runnable[ReturnT],
-        chain_middleware: CallNext,
-        func_name: str,
-        func_spec: FuncSpec[ReturnT],
-        options: RouteOptions,
     ) -> None:
-        self._state: State = state
-        self._shared_state: SharedState = shared_state
-        self._configs: JobifyConfiguration = jobify_config
+        self._route: RouteSchedule[ReturnT] = route
         self._runnable: Runnable[ReturnT] = runnable
-        self._chain_middleware: CallNext = chain_middleware
-        self.func_name: str = func_name
-        self.func_spec: FuncSpec[ReturnT] = func_spec
-        self.route_options: RouteOptions = options
+        self._configs: JobifyConfiguration = route.jobify_config
+        self._shared_state: SharedState = route.shared_state
+
+    @property
+    def func_name(self) -> str:
+        return self._route.func_name
+
+    @property
+    def func_spec(self) -> FuncSpec[ReturnT]:
+        return self._route.func_spec
+
+    @property
+    def route_options(self) -> RouteOptions:
+        return self._route.options
 
     def _now(self) -> datetime:
         return datetime.now(tz=self._configs.tz)
@@ -93,14 +204,52 @@ class ScheduleBuilder(Generic[ReturnT]):
         return at.timestamp() - now.timestamp()
 
     def _ensure_job_id(self, job_id: str) -> None:
-        if job_id in self._shared_state.pending_jobs:
+        if (shards := self._configs.shards) is None:
+            exists = job_id in self._shared_state.pending_jobs
+        else:
+            exists = any(job_id in jobs for jobs in shards.lookup(job_id))
+        if exists:
             raise DuplicateJobError(job_id)
 
-    def _is_persist(self) -> bool:
-        return (
-            type(self._configs.storage) is not DummyStorage
-            and self.route_options.get("durable", True) is True
-        )
+    def _for_job(self, job_id: str) -> ScheduleBuilder[ReturnT]:
+        """Return the builder of the shard the job belongs to."""
+        shards = self._route.shards
+        route = shards[hash(job_id) % len(shards)]
+        return ScheduleBuilder(route, self._runnable)
+
+    def _loop(self) -> asyncio.AbstractEventLoop:
+        return self._route.loop or self._configs.getloop()
+
+    def _foreign_loop(self) -> asyncio.AbstractEventLoop | None:
+        """Return the loop of the shard if another thread schedules the job."""
+        loop = self._route.loop
+        if loop is None or loop is self._configs.getloop():
+            return None
+        return loop
+
+    def _arm(
+        self,
+        job: Job[ReturnT],
+        delay_seconds: float,
+        callback: Callable[[T], None],
+        arg: T,
+    ) -> bool:
+        """Start the timer of a job scheduled by the thread of another shard.
+
+        Timers belong to the loop of the shard of the job, so the timer is
+        started by that loop, unless the job is cancelled meanwhile.
+        Returns `False` when called from the loop of the job itself.
+        """
+        if (loop := self._foreign_loop()) is None:
+            return False
+        when = loop.time() + delay_seconds
+
+        def arm() -> None:
+            if job._pending_jobs.get(job.id) is job:
+                job.bind_handle(loop.call_at(when, callback, arg))
+
+        _ = loop.call_soon_threadsafe(arm)
+        return True
 
     async def cron(
         self,
@@ -109,37 +258,123 @@ class ScheduleBuilder(Generic[ReturnT]):
         job_id: str,
         now: datetime | None = None,
     ) -> Job[ReturnT]:
-        self._ensure_job_id(job_id)
-        now = now or self._now()
-        if isinstance(cron, str):
-            cron = Cron(cron)
-        job = self._cron(cron=cron, job_id=job_id, now=now)
-
-        if self._is_persist():
-            trigger = CronArguments(cron=cron, job_id=job_id, now=now)
-            await self._save_scheduled(trigger, job)
+        span = self._start_span("jobify.schedule", job_id)
+        try:
+            self._ensure_job_id(job_id)
+            now = now or self._now()
+            if isinstance(cron, str):
+                cron = Cron(cron)
+            job = self._cron(cron=cron, job_id=job_id, now=now)
+            if span is not None:
+                self._bind_trace(job, span)
+
+            if self._route.persist:
+                trigger = CronArguments(cron=cron, job_id=job_id, now=now)
+                await self._save_scheduled(trigger, job)
+        finally:
+            if span is not None:
+                span.end()
 
         return job
 
-    def _cron(self, *, cron: Cron, job_id: str, now: datetime) -> Job[ReturnT]:
-        cron_parser = self._configs.cron_factory(cron.expression)
-        at = cron_parser.next_run(now=now)
-        job = Job(
+    def _new_stream(self) -> JobStream[ReturnT] | None:
+        if (maxsize := self._route.stream_buffer) is None:
+            return None
+        return JobStream(maxsize, self._route.stream_overflow)
+
+    def _cron(  # noqa: PLR0913
+        self,
+        *,
+        cron: Cron,
+        job_id: str,
+        now: datetime,
+        at: datetime | None = None,
+        attempt: int = 0,
+        stored: bool = True,
+    ) -> Job[ReturnT]:
+        if self._route.shards:
+            return self._for_job(job_id)._cron(
+                cron=cron,
+                job_id=job_id,
+                now=now,
+                at=at,
+                attempt=attempt,
+                stored=stored,
+            )
+        cron_parser = self._configs.cron_parsers(cron.expression)
+        group: CronGroup | None = None
+        if at is not None:
+            # A restored retry runs on its own timer, as in `_retry_cron`.
+            now = self._now()
+        elif self._foreign_loop() is None:
+            group = self._cron_group(cron.expression, cron_parser, now)
+            at = group.next_run(now)
+        else:
+            # The groups belong to the loop of the shard, which adds the job
+            # to its group from the next run on.
+            at = cron_parser.next_run(now=now)
+        job: Job[ReturnT] = Job(
             exec_at=at,
             job_id=job_id,
             pending_jobs=self._shared_state.pending_jobs,
             cron_expression=cron.expression,
             storage=self._configs.storage,
+            stream=self._new_stream(),
+            attempt=attempt,
+            func_name=self._route.func_name,
+            loop=self._route.loop,
         )
         self._shared_state.pending_jobs[job.id] = job
-        cron_ctx = CronContext(job=job, cron=cron, cron_parser=cron_parser)
+        self._route.metrics.scheduled += 1
+        cron_ctx = CronContext(
+            job=job,
+            cron=cron,
+            cron_parser=cron_parser,
+            stored=stored and self._route.persist,
+        )
         delay_seconds = self._calculate_delay_seconds(now=now, at=at)
-        loop = self._configs.getloop()
-        when = loop.time() + delay_seconds
-        handle = loop.call_at(when, self._pre_exec_cron, cron_ctx)
-        job.bind_handle(handle)
+        if group is None:
+            self._call_cron_at(cron_ctx, delay_seconds)
+        else:
+            job.bind_handle(
+                self._join_cron(group, cron_ctx, at, delay_seconds),
+            )
         return job
 
+    def _call_cron_at(
+        self,
+        ctx: CronContext[ReturnT],
+        delay_seconds: float,
+    ) -> None:
+        """Start a cron job on a timer of its own, outside of its group."""
+        job = ctx.job
+        if self._arm(job, delay_seconds, self._pre_exec_cron, ctx):
+            return
+        loop = self._loop()
+        when = loop.time() + delay_seconds
+        job.bind_handle(loop.call_at(when, self._pre_exec_cron, ctx))
+
+    def _cron_group(
+        self,
+        expression: str,
+        cron_parser: CronParser,
+        now: datetime,
+    ) -> CronGroup:
+        timers = self._shared_state.cron_timers
+        return timers.group(expression, now.tzinfo, cron_parser)
+
+    def _join_cron(
+        self,
+        group: CronGroup,
+        ctx: CronContext[ReturnT],
+        at: datetime,
+        delay_seconds: float,
+    ) -> CronTimer[CronContext[ReturnT]]:
+        """Start the job with the others of its group that run at `at`."""
+        loop = self._loop()
+        when = loop.time() + delay_seconds
+        return group.call_at(loop, when, at, self._pre_exec_cron, ctx)
+
     async def delay(
         self,
         seconds: float,
@@ -158,87 +393,225 @@ class ScheduleBuilder(Generic[ReturnT]):
         job_id: str | None = None,
         now: datetime | None = None,
     ) -> Job[ReturnT]:
-        job_id = job_id or uuid4().hex
-        self._ensure_job_id(job_id)
-        now = now or self._now()
-        job = self._at(at=at, now=now, job_id=job_id)
-
-        if self._is_persist():
-            trigger = AtArguments(at=at, job_id=job_id, now=now)
-            await self._save_scheduled(trigger, job)
+        job_id = job_id or os.urandom(16).hex()
+        span = self._start_span("jobify.schedule", job_id)
+        try:
+            self._ensure_job_id(job_id)
+            now = now or self._now()
+            job = self._at(at=at, now=now, job_id=job_id)
+            if span is not None:
+                self._bind_trace(job, span)
+
+            if self._route.persist:
+                trigger = AtArguments(at=at, job_id=job_id, now=now)
+                await self._save_scheduled(trigger, job)
+        finally:
+            if span is not None:
+                span.end()
 
         return job
 
-    def _at(self, *, at: datetime, now: datetime, job_id: str) -> Job[ReturnT]:
-        job = Job(
+    def _at(
+        self,
+        *,
+        at: datetime,
+        now: datetime,
+        job_id: str,
+        attempt: int = 0,
+    ) -> Job[ReturnT]:
+        if self._route.shards:
+            return self._for_job(job_id)._at(
+                at=at,
+                now=now,
+                job_id=job_id,
+                attempt=attempt,
+            )
+        job: Job[ReturnT] = Job(
             exec_at=at,
             job_id=job_id,
             pending_jobs=self._shared_state.pending_jobs,
             storage=self._configs.storage,
+            stream=self._new_stream(),
+            attempt=attempt,
+            func_name=self._route.func_name,
+            loop=self._route.loop,
         )
         self._shared_state.pending_jobs[job.id] = job
-        loop = self._configs.getloop()
+        self._route.metrics.scheduled += 1
         delay_seconds = self._calculate_delay_seconds(now=now, at=at)
+        self._call_at(job, delay_seconds)
+        return job
+
+    def _call_at(self, job: Job[ReturnT], delay_seconds: float) -> None:
+        if self._arm(job, delay_seconds, self._pre_exec_at, job):
+            return
+        loop = self._loop()
         if delay_seconds <= 0:
             handle = loop.call_soon(self._pre_exec_at, job)
         else:
             when = loop.time() + delay_seconds
             handle = loop.call_at(when, self._pre_exec_at, job)
         job.bind_handle(handle)
-        return job
+
+    def _start_span(
+        self,
+        name: str,
+        job_id: str,
+        *,
+        parent: Mapping[str, str] | None = None,
+        start_time: int | None = None,
+    ) -> Span | None:
+        if (tracer := self._configs.tracer) is None:
+            return None
+        return tracer.start_span(
+            name,
+            parent=parent,
+            attributes={
+                "jobify.route": self._route.func_name,
+                "jobify.job_id": job_id,
+            },
+            start_time=start_time,
+        )
+
+    def _bind_trace(self, job: Job[ReturnT], span: Span) -> None:
+        tracer = cast("Tracer", self._configs.tracer)
+        job._trace_context = tracer.inject(span)
 
     async def _save_scheduled(
         self,
         trigger: CronArguments | AtArguments,
         job: Job[ReturnT],
     ) -> None:
+        parent = job._trace_context
+        span = self._start_span("jobify.serialize", job.id, parent=parent)
+        try:
+            raw_message = self._serialize(trigger, job)
+        finally:
+            if span is not None:
+                span.end()
+
+        scheduled_job = ScheduledJob(
+            job_id=job.id,
+            func_name=self._route.func_name,
+            message=raw_message,
+            status=job.status,
+            exec_at=job.exec_at.timestamp(),
+        )
+        span = self._start_span("jobify.storage.write", job.id, parent=parent)
+        try:
+            await self._configs.storage.add_schedule(scheduled_job)
+        finally:
+            if span is not None:
+                span.end()
+
+    def _serialize(
+        self,
+        trigger: CronArguments | AtArguments,
+        job: Job[ReturnT],
+    ) -> bytes:
+        route = self._route
+        arguments: dict[str, Any] = self._runnable.bound.arguments
+        if route.injected:
+            # Injected values belong to a single execution.
+            arguments = {
+                name: arg
+                for name, arg in arguments.items()
+                if name not in route.injected
+            }
+        if route.dump_arguments:
+            params_type = route.func_spec.params_type
+            dumper = self._configs.dumper
+            arguments = {
+                name: dumper.dump(arg, params_type[name])
+                for name, arg in arguments.items()
+            }
         msg = Message(
             job_id=job.id,
-            func_name=self.func_name,
-            arguments=self._runnable.bound.arguments,
+            func_name=route.func_name,
+            arguments=arguments,
             trigger=trigger,
+            attempt=job.attempt,
+            trace_context=job._trace_context,
         )
-        for name, arg in msg.arguments.items():
-            msg.arguments[name] = self._configs.dumper.dump(
-                arg,
-                self.func_spec.params_type[name],
-            )
         formatted = self._configs.dumper.dump(msg, Message)
-        raw_message = self._configs.serializer.dumpb(formatted)
-        scheduled_job = ScheduledJob(
-            job_id=msg.job_id,
-            func_name=self.func_name,
-            message=raw_message,
-            status=job.status,
-        )
-        await self._configs.storage.add_schedule(scheduled_job)
+        return self._configs.serializer.dumpb(formatted)
 
     def _pre_exec_at(self, job: Job[ReturnT]) -> None:
+        if not self._configs.app_started:
+            return  # Shutting down: the job stays in the storage.
         task = asyncio.create_task(self._exec_at(job), name=job.id)
+        job.bind_task(task)
         self._shared_state.pending_tasks.add(task)
         task.add_done_callback(self._shared_state.pending_tasks.discard)
-        task.add_done_callback(lambda _: job._event.set())
+        task.add_done_callback(lambda _: self._set_done(job))
+
+    def _set_done(self, job: Job[ReturnT]) -> None:
+        # A job waiting for its retry is not done yet.
+        if job._status is not JobStatus.SCHEDULED:
+            job._set_done()
 
     async def _exec_at(self, job: Job[ReturnT]) -> None:
-        await self._exec_job(job)
-        _ = self._shared_state.pending_jobs.pop(job.id, None)
-        if self._is_persist():
-            await self._configs.storage.delete_schedule(job.id)
+        retry_delay = await self._exec_job(job)
+        if job.exception is not None:
+            # The exception handlers, the log and the span are done with
+            # the locals of the failed frames, `_exec_job` included.
+            clear_frames(job.exception)
+        if retry_delay is not None:
+            await self._retry_at(job, retry_delay)
+            return
+        try:
+            if self._route.persist:
+                await self._configs.storage.delete_schedule(job.id)
+        finally:
+            # Done before it leaves the registry, which wakes `wait_all`.
+            job._set_done()
+            self._shared_state.pending_jobs.complete(job)
+
+    async def _retry_at(self, job: Job[ReturnT], delay_seconds: float) -> None:
+        now = self._now()
+        job.exec_at = now + timedelta(seconds=delay_seconds)
+        self._call_at(job, delay_seconds)
+        if self._route.persist:
+            trigger = AtArguments(at=job.exec_at, job_id=job.id, now=now)
+            await self._save_scheduled(trigger, job)
 
     def _pre_exec_cron(self, ctx: CronContext[ReturnT]) -> None:
+        if not self._configs.app_started:
+            return
         task = asyncio.create_task(self._exec_cron(ctx=ctx), name=ctx.job.id)
+        ctx.job.bind_task(task)
         self._shared_state.pending_tasks.add(task)
         task.add_done_callback(self._shared_state.pending_tasks.discard)
 
     async def _exec_cron(self, ctx: CronContext[ReturnT]) -> None:
         job = ctx.job
-        await self._exec_job(job)
+        if job.attempt == 0 and not await self._acquire_cron_lease(job):
+            # Another replica runs this fire.
+            self._skip_cron(ctx)
+            return
+        retry_delay = await self._exec_job(job)
+        if job.exception is not None:
+            clear_frames(job.exception)
+        if retry_delay is not None:
+            await self._retry_cron(ctx, retry_delay)
+            return
+
+        if job.attempt and ctx.stored:
+            # The stored message still holds the retry.
+            job.attempt = 0
+            trigger = CronArguments(
+                cron=ctx.cron,
+                job_id=job.id,
+                now=self._now(),
+            )
+            await self._save_scheduled(trigger, job)
+        job.attempt = 0
         if job.status is JobStatus.SUCCESS:
             ctx.failure_count = 0
         else:
             ctx.failure_count += 1
 
-        job._event.set()
+        job._set_done()
         if (
             job.is_reschedulable()
             and ctx.is_run_allowed_by_limit()
@@ -247,47 +620,157 @@ class ScheduleBuilder(Generic[ReturnT]):
             if ctx.is_failure_allowed_by_limit():
                 self._reschedule_cron(ctx)
             else:
-                job._status = JobStatus.PERMANENTLY_FAILED
+                job._set_status(JobStatus.PERMANENTLY_FAILED)
                 logger.warning(
                     "Job %s stopped due to max failures policy (%s/%s)",
                     job.id,
                     ctx.failure_count,
                     ctx.cron.max_failures,
                 )
-                _ = self._shared_state.pending_jobs.pop(job.id, None)
+                self._shared_state.pending_jobs.complete(job)
         else:
-            _ = self._shared_state.pending_jobs.pop(job.id, None)
+            self._shared_state.pending_jobs.complete(job)
 
     def _reschedule_cron(self, ctx: CronContext[ReturnT]) -> None:
         now = self._now()
-        next_at = ctx.cron_parser.next_run(now=now)
+        group = self._cron_group(ctx.cron.expression, ctx.cron_parser, now)
+        next_at = group.next_run(now)
         delay_seconds = self._calculate_delay_seconds(now=now, at=next_at)
-        loop = self._configs.getloop()
-        when = loop.time() + delay_seconds
-        time_handler = loop.call_at(when, self._pre_exec_cron, ctx)
         job = ctx.job
         job.update(
             exec_at=next_at,
-            time_handler=time_handler,
+            time_handler=self._join_cron(group, ctx, next_at, delay_seconds),
             job_status=JobStatus.SCHEDULED,
+            stream=self._new_stream(),
         )
 
-    async def _exec_job(self, job: Job[ReturnT]) -> None:
-        job._status = JobStatus.RUNNING
+    async def _acquire_cron_lease(self, job: Job[ReturnT]) -> bool:
+        configs = self._configs
+        if (ttl := configs.cron_lease) is None:
+            return True
+        try:
+            return await configs.storage.acquire_cron_lease(
+                job.id,
+                configs.node_id,
+                job.exec_at.timestamp(),
+                ttl,
+            )
+        except Exception:
+            # Skipping a fire is better than running it on every replica.
+            logger.exception("Cannot acquire the lease of cron %s", job.id)
+            return False
+
+    def _skip_cron(self, ctx: CronContext[ReturnT]) -> None:
+        if not self._configs.app_started:
+            return  # Cancelled with the other pending jobs at shutdown.
+        job = ctx.job
+        # The fire counts towards `max_runs`, as on the replica that ran it.
+        if not ctx.is_run_allowed_by_limit():
+            job._set_done()
+            self._shared_state.pending_jobs.complete(job)
+            return
+        now = self._now()
+        group = self._cron_group(ctx.cron.expression, ctx.cron_parser, now)
+        next_at = group.next_run(now)
+        delay_seconds = self._calculate_delay_seconds(now=now, at=next_at)
+        job.exec_at = next_at
+        job.bind_handle(self._join_cron(group, ctx, next_at, delay_seconds))
+
+    async def _retry_cron(
+        self,
+        ctx: CronContext[ReturnT],
+        delay: float,
+    ) -> None:
+        # The next regular run is computed once the retries are over.
+        job = ctx.job
+        now = self._now()
+        job.exec_at = now + timedelta(seconds=delay)
+        loop = self._configs.getloop()
+        when = loop.time() + delay
+        job.bind_handle(loop.call_at(when, self._pre_exec_cron, ctx))
+        if ctx.stored:
+            trigger = CronArguments(
+                cron=ctx.cron,
+                job_id=job.id,
+                now=now,
+                at=job.exec_at,
+            )
+            await self._save_scheduled(trigger, job)
+
+    def _start_execute_span(self, job: Job[ReturnT]) -> Span | None:
+        parent = job._trace_context
+        # The time between the planned start and now.
+        queue_wait = self._start_span(
+            "jobify.queue_wait",
+            job.id,
+            parent=parent,
+            start_time=int(job.exec_at.timestamp() * 1e9),
+        )
+        if queue_wait is not None:
+            queue_wait.end()
+        return self._start_span("jobify.execute", job.id, parent=parent)
+
+    async def _exec_job(self, job: Job[ReturnT]) -> float | None:
+        """Run the job and record its outcome.
+
+        Returns the delay before the next attempt if the job has been
+        rescheduled, or `None` once it is finished.
+        """
+        metrics = self._route.metrics
+        metrics.in_flight += 1
+        span = None
+        if self._configs.tracer is not None:
+            span = self._start_execute_span(job)
+        job._set_status(JobStatus.RUNNING)
         job_context = JobContext(
             job=job,
-            state=self._state,
+            state=self._route.state,
             request_state=RequestState(),
             runnable=self._runnable,
-            route_options=self.route_options,
+            route_options=self._route.options,
             jobify_config=self._configs,
+            _on_start=functools.partial(self._record_start, job),
         )
+        start = time.perf_counter()
         try:
-            result = await self._chain_middleware(job_context)
+            result = await self._route.chain_middleware(job_context)
+        except JobRescheduledError as exc:
+            metrics.rescheduled += 1
+            job.attempt = exc.attempt
+            job._set_status(JobStatus.SCHEDULED)
+            return exc.delay
         except JobTimeoutError as exc:
+            metrics.timed_out += 1
             job.set_exception(exc, status=JobStatus.TIMEOUT)
         except Exception as exc:
+            metrics.failed += 1
             logger.exception("Job %s failed with unexpected error", job.id)
             job.set_exception(exc, status=JobStatus.FAILED)
         else:
+            metrics.succeeded += 1
             job.set_result(result, status=JobStatus.SUCCESS)
+        finally:
+            metrics.in_flight -= 1
+            metrics.duration.observe(time.perf_counter() - start)
+            if span is not None:
+                self._end_execute_span(job, span)
+            if (
+                job._stream is not None
+                and job._status is not JobStatus.SCHEDULED
+            ):
+                job._stream.close()
+        return None
+
+    def _record_start(self, job: Job[ReturnT]) -> None:
+        # Jobs completed or deferred by a middleware have not started.
+        metrics = self._route.metrics
+        metrics.started += 1
+        metrics.lateness.observe(max(time.time() - job.exec_at.timestamp(), 0))
+
+    def _end_execute_span(self, job: Job[ReturnT], span: Span) -> None:
+        status = job._status
+        span.set_attribute("jobify.status", status.value)
+        failed = status in (JobStatus.FAILED, JobStatus.TIMEOUT)
+        if failed and job.exception is not None:
+            span.record_exception(job.exception)
+        span.end()
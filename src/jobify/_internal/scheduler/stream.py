@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Generic, TypeVar, final
+
+from jobify._internal.common.constants import EMPTY, StreamOverflow
+
+T = TypeVar("T")
+
+
+@final
+class JobStream(Generic[T]):
+    """Bounded buffer between a streaming job and its consumers.
+
+    With `StreamOverflow.WAIT`, the producer waits in `put` while the buffer
+    is full, so the memory used by a stream does not depend on the size of
+    its output. With `StreamOverflow.DROP_OLDEST`, the oldest item is
+    dropped instead, for streams that nobody may ever read.
+    """
+
+    __slots__: tuple[str, ...] = ("_closed", "_overflow", "_queue", "dropped")
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow: StreamOverflow = StreamOverflow.WAIT,
+    ) -> None:
+        self._queue: asyncio.Queue[T] = asyncio.Queue(maxsize)
+        self._overflow: StreamOverflow = overflow
+        self._closed: bool = False
+        self.dropped: int = 0
+
+    async def put(self, item: T) -> None:
+        queue = self._queue
+        if self._overflow is StreamOverflow.WAIT:
+            await queue.put(item)
+            return
+        if queue.full():
+            _ = queue.get_nowait()
+            self.dropped += 1
+        queue.put_nowait(item)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if not self._queue.full():
+            # Wake up a consumer waiting on an empty buffer.
+            self._queue.put_nowait(EMPTY)
+
+    def __aiter__(self) -> JobStream[T]:
+        return self
+
+    async def __anext__(self) -> T:
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        item = await self._queue.get()
+        if item is EMPTY:
+            # Pass the end marker on to the other consumers.
+            self._queue.put_nowait(EMPTY)
+            raise StopAsyncIteration
+        return item
@@ -69,7 +69,20 @@ def is_structured_type(tp: Any) -> bool:  # noqa: ANN401
     )
 
 
+# Checked by exact type first, so that subclasses such as `IntEnum` still
+# get their own encoding.
+_JSON_SCALARS: frozenset[type] = frozenset((str, int, float, bool, type(None)))
+
+
 def json_extended_encoder(o: SupportedTypes) -> JSONCompat:  # noqa: C901, PLR0911
+    tp = type(o)
+    if tp in _JSON_SCALARS:
+        return o  # type: ignore[return-value]
+    if tp is dict:
+        return {
+            k: json_extended_encoder(v)
+            for k, v in o.items()  # type: ignore[union-attr]
+        }
     if is_dataclass(o):  # pragma: no cover
         return {
             "__dataclass__": {
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from jobify._internal.common.types import LoopFactory
+    from jobify._internal.scheduler.registry import JobRegistry
+    from jobify._internal.shared_state import SharedState
+
+
+def running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def call_in_loop(
+    loop: asyncio.AbstractEventLoop | None,
+    callback: Callable[[], object],
+) -> None:
+    """Call `callback` from the thread of `loop`, now if it is this one."""
+    if loop is None or loop is running_loop():
+        _ = callback()
+    else:
+        _ = loop.call_soon_threadsafe(callback)
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+    asyncio.set_event_loop(loop)
+    _ = loop.call_soon(ready.set)
+    try:
+        loop.run_forever()
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+
+@final
+class Shards:
+    """The event loops of a sharded app, each with its own jobs.
+
+    Shard 0 runs on the loop of the app and every other shard on an event
+    loop in a thread of its own. A job belongs to the shard picked by the
+    hash of its ID: its timer, its execution and its entry in the registry
+    all live there.
+    """
+
+    __slots__: tuple[str, ...] = ("_main", "_threads", "loops", "states")
+
+    def __init__(
+        self,
+        states: Sequence[SharedState],
+        main: LoopFactory,
+    ) -> None:
+        self.states: tuple[SharedState, ...] = tuple(states)
+        self.loops: tuple[asyncio.AbstractEventLoop, ...] = ()
+        self._main: LoopFactory = main
+        self._threads: list[threading.Thread] = []
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    @property
+    def registries(self) -> tuple[JobRegistry, ...]:
+        return tuple(state.pending_jobs for state in self.states)
+
+    def index(self, job_id: str) -> int:
+        return hash(job_id) % len(self.states)
+
+    def lookup(self, job_id: str) -> tuple[JobRegistry, ...]:
+        """Return the registries that can hold a job.
+
+        Besides its own shard, shard 0 runs the jobs of the routes that
+        cannot be sharded.
+        """
+        if (index := self.index(job_id)) == 0:
+            return (self.states[0].pending_jobs,)
+        return (self.states[index].pending_jobs, self.states[0].pending_jobs)
+
+    def getloop(self) -> asyncio.AbstractEventLoop:
+        """Return the loop of the calling thread, else the loop of the app."""
+        return running_loop() or self._main()
+
+    async def start(self) -> None:
+        """Start the loop of every other shard, each in its thread.
+
+        The threads are waited for in a worker thread, so the loop of the
+        app keeps running meanwhile.
+        """
+        loops = [self._main()]
+        started: list[threading.Event] = []
+        for index in range(1, len(self.states)):
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=_run_loop,
+                args=(loop, ready),
+                name=f"jobify-shard-{index}",
+                daemon=True,
+            )
+            thread.start()
+            started.append(ready)
+            loops.append(loop)
+            self._threads.append(thread)
+        for ready in started:
+            _ = await asyncio.to_thread(ready.wait)
+        self.loops = tuple(loops)
+
+    async def stop(self) -> None:
+        for loop in self.loops[1:]:
+            _ = loop.call_soon_threadsafe(loop.stop)
+        for thread in self._threads:
+            await asyncio.to_thread(thread.join)
+        self._threads.clear()
@@ -3,13 +3,17 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from jobify._internal.metrics import Metrics
+from jobify._internal.scheduler.cron_timers import CronTimers
+from jobify._internal.scheduler.registry import JobRegistry
+
 if TYPE_CHECKING:
     import asyncio
 
-    from jobify._internal.scheduler.job import Job
-
 
 @dataclass(slots=True, kw_only=True, frozen=True)
 class SharedState:
-    pending_jobs: dict[str, Job[Any]] = field(default_factory=dict)
+    pending_jobs: JobRegistry = field(default_factory=JobRegistry)
     pending_tasks: set[asyncio.Task[Any]] = field(default_factory=set)
+    metrics: Metrics = field(default_factory=Metrics)
+    cron_timers: CronTimers = field(default_factory=CronTimers)
@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable, Sequence
 from typing import NamedTuple, Protocol
 
 from jobify._internal.common.constants import JobStatus
@@ -10,6 +10,24 @@ class ScheduledJob(NamedTuple):
     func_name: str
     message: bytes
     status: JobStatus
+    # POSIX timestamp of the next run, `None` if unknown, as in older rows.
+    exec_at: float | None = None
+
+
+def is_due_between(
+    scheduled: ScheduledJob,
+    before: float | None,
+    since: float | None,
+) -> bool:
+    """Check that a schedule is due in `[since, before)`.
+
+    A schedule without `exec_at` counts as due before anything.
+    """
+    if (exec_at := scheduled.exec_at) is None:
+        return since is None
+    return (before is None or exec_at < before) and (
+        since is None or exec_at >= since
+    )
 
 
 class Storage(Protocol, metaclass=ABCMeta):
@@ -32,3 +50,48 @@ class Storage(Protocol, metaclass=ABCMeta):
     @abstractmethod
     async def delete_schedule(self, job_id: str) -> None:
         raise NotImplementedError
+
+    async def iter_schedules(
+        self,
+        page_size: int,
+        *,
+        before: float | None = None,
+        since: float | None = None,
+    ) -> AsyncIterator[Sequence[ScheduledJob]]:
+        """Yield the stored schedules in pages of at most `page_size`.
+
+        With `before` or `since`, only the schedules whose `exec_at` is in
+        `[since, before)`, as checked by `is_due_between`. Storages that can
+        read a page at a time or filter by `exec_at` should override it,
+        the default reads every schedule with `get_schedules`.
+        """
+        schedules = [
+            scheduled
+            for scheduled in await self.get_schedules()
+            if is_due_between(scheduled, before, since)
+        ]
+        for start in range(0, len(schedules), page_size):
+            yield schedules[start : start + page_size]
+
+    async def delete_schedules(self, job_ids: Sequence[str]) -> None:
+        """Delete several schedules, by default one at a time."""
+        for job_id in job_ids:
+            await self.delete_schedule(job_id)
+
+    async def acquire_cron_lease(
+        self,
+        name: str,  # noqa: ARG002
+        owner: str,  # noqa: ARG002
+        fire_at: float,  # noqa: ARG002
+        ttl: float,  # noqa: ARG002
+    ) -> bool:
+        """Claim the run of the cron job `name` planned at `fire_at`.
+
+        Replicas sharing the storage call it for every fire, and only the
+        first call for a given fire may succeed. The owner keeps the lease
+        for `ttl` seconds and is the only one to run the next fires while
+        it renews it; once it expires, any replica can take it over.
+
+        The default has nothing to share and always succeeds.
+        """
+        return True
@@ -1,12 +1,15 @@
 import functools
+import math
 import sqlite3
 import threading
-from collections.abc import Callable
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, TypeAlias, TypeVar
 
 from typing_extensions import override
 
+from jobify._internal.common.constants import JobStatus
 from jobify._internal.storage.abc import ScheduledJob, Storage
 
 if TYPE_CHECKING:
@@ -21,22 +24,81 @@ CREATE TABLE IF NOT EXISTS {} (
     message BLOB,
     status TEXT,
     created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    exec_at REAL
 );
 """
 
+# Tables created before `exec_at` was stored.
+ADD_EXEC_AT_COLUMN_QUERY = """
+ALTER TABLE {} ADD COLUMN exec_at REAL;
+"""
+
+CREATE_EXEC_AT_INDEX_QUERY = """
+CREATE INDEX IF NOT EXISTS {0}_exec_at ON {0} (exec_at);
+"""
+
+CREATE_LEASES_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS {} (
+    name TEXT PRIMARY KEY,
+    owner TEXT,
+    fire_at REAL,
+    expires_at REAL
+);
+"""
+
+# A fire is claimed once: only a later `fire_at` replaces the stored one,
+# and only for the owner of the lease or once the lease has expired.
+ACQUIRE_LEASE_QUERY = """
+INSERT INTO {0} (name, owner, fire_at, expires_at)
+VALUES (?, ?, ?, ?)
+ON CONFLICT (name) DO UPDATE SET
+    owner = EXCLUDED.owner,
+    fire_at = EXCLUDED.fire_at,
+    expires_at = EXCLUDED.expires_at
+WHERE {0}.fire_at < EXCLUDED.fire_at
+    AND ({0}.owner = EXCLUDED.owner OR {0}.expires_at <= ?);
+"""
+
 SELECT_SCHEDULES_QUERY = """
-SELECT job_id, func_name, message, status
+SELECT job_id, func_name, message, status, exec_at
 FROM {};
 """
 
+SELECT_SCHEDULES_PAGE_QUERY = """
+SELECT rowid, job_id, func_name, message, status, exec_at
+FROM {}
+WHERE rowid > ?
+ORDER BY rowid
+LIMIT ?;
+"""
+
+SELECT_UNTIMED_SCHEDULES_PAGE_QUERY = """
+SELECT rowid, job_id, func_name, message, status, exec_at
+FROM {}
+WHERE exec_at IS NULL AND rowid > ?
+ORDER BY rowid
+LIMIT ?;
+"""
+
+# Pages through `[since, before)` in the order of the `exec_at` index.
+SELECT_DUE_SCHEDULES_PAGE_QUERY = """
+SELECT rowid, job_id, func_name, message, status, exec_at
+FROM {}
+WHERE exec_at >= ? AND exec_at < ?
+    AND (exec_at > ? OR (exec_at = ? AND rowid > ?))
+ORDER BY exec_at, rowid
+LIMIT ?;
+"""
+
 INSERT_SCHEDULE_QUERY = """
-INSERT INTO {} (job_id, func_name, message, status)
-VALUES (?, ?, ?, ?)
+INSERT INTO {} (job_id, func_name, message, status, exec_at)
+VALUES (?, ?, ?, ?, ?)
 ON CONFLICT (job_id) DO UPDATE SET
     func_name = EXCLUDED.func_name,
     message = EXCLUDED.message,
     status = EXCLUDED.status,
+    exec_at = EXCLUDED.exec_at,
     updated_at = CURRENT_TIMESTAMP;
 """
 
@@ -47,6 +109,8 @@ DELETE FROM {} WHERE job_id = ?;
 
 ReturnT = TypeVar("ReturnT")
 
+_Row: TypeAlias = tuple[int, str, str, bytes, JobStatus, float | None]
+
 
 class SQLiteStorage(Storage):
     def __init__(
@@ -54,12 +118,14 @@ class SQLiteStorage(Storage):
         database: str | Path = "jobify.db",
         *,
         table_name: str = "jobify_schedules",
+        leases_table_name: str = "jobify_cron_leases",
         timeout: float = 20.0,
     ) -> None:
         self.database: Path = (
             Path(database) if isinstance(database, str) else database
         )
         self.table_name: str = table_name
+        self.leases_table_name: str = leases_table_name
         self.timeout: float = timeout
         self.getloop: LoopFactory
         self.threadpool: ThreadPoolExecutor | None
@@ -72,12 +138,33 @@ class SQLiteStorage(Storage):
         self.select_schedules_query: str = SELECT_SCHEDULES_QUERY.format(
             table_name,
         )
+        self.select_schedules_page_query: str = (
+            SELECT_SCHEDULES_PAGE_QUERY.format(table_name)
+        )
+        self.select_untimed_schedules_page_query: str = (
+            SELECT_UNTIMED_SCHEDULES_PAGE_QUERY.format(table_name)
+        )
+        self.select_due_schedules_page_query: str = (
+            SELECT_DUE_SCHEDULES_PAGE_QUERY.format(table_name)
+        )
+        self.add_exec_at_column_query: str = ADD_EXEC_AT_COLUMN_QUERY.format(
+            table_name,
+        )
+        self.create_exec_at_index_query: str = (
+            CREATE_EXEC_AT_INDEX_QUERY.format(table_name)
+        )
         self.insert_schedule_query: str = INSERT_SCHEDULE_QUERY.format(
             table_name,
         )
         self.delete_schedule_query: str = DELETE_SCHEDULE_QUERY.format(
             table_name,
         )
+        self.create_leases_table_query: str = CREATE_LEASES_TABLE_QUERY.format(
+            leases_table_name
+        )
+        self.acquire_lease_query: str = ACQUIRE_LEASE_QUERY.format(
+            leases_table_name,
+        )
 
     @property
     def conn(self) -> sqlite3.Connection:
@@ -105,6 +192,13 @@ class SQLiteStorage(Storage):
         _ = conn.execute("PRAGMA journal_mode=WAL;")
         _ = conn.execute("PRAGMA synchronous=NORMAL;")
         _ = conn.execute(self.create_scheduled_table_query)
+        columns = conn.execute(
+            f"PRAGMA table_info({self.table_name});"
+        ).fetchall()
+        if "exec_at" not in {column[1] for column in columns}:
+            _ = conn.execute(self.add_exec_at_column_query)
+        _ = conn.execute(self.create_exec_at_index_query)
+        _ = conn.execute(self.create_leases_table_query)
         conn.commit()
         self._conn = conn
 
@@ -124,12 +218,80 @@ class SQLiteStorage(Storage):
                     func_name=row[1],
                     message=row[2],
                     status=row[3],
+                    exec_at=row[4],
                 )
                 for row in cursor.fetchall()
             ]
 
         return await self._to_thread(get)
 
+    @override
+    async def iter_schedules(
+        self,
+        page_size: int,
+        *,
+        before: float | None = None,
+        since: float | None = None,
+    ) -> AsyncIterator[list[ScheduledJob]]:
+        if before is None and since is None:
+            pages = self._iter_pages(
+                self.select_schedules_page_query,
+                (),
+                (0,),
+                lambda row: (row[0],),
+                page_size,
+            )
+            async for page in pages:
+                yield page
+            return
+
+        if since is None:
+            # Without a known run time, a schedule counts as due.
+            pages = self._iter_pages(
+                self.select_untimed_schedules_page_query,
+                (),
+                (0,),
+                lambda row: (row[0],),
+                page_size,
+            )
+            async for page in pages:
+                yield page
+        low = -math.inf if since is None else since
+        high = math.inf if before is None else before
+        pages = self._iter_pages(
+            self.select_due_schedules_page_query,
+            (low, high),
+            (low, low, 0),
+            lambda row: (row[5], row[5], row[0]),
+            page_size,
+        )
+        async for page in pages:
+            yield page
+
+    async def _iter_pages(
+        self,
+        query: str,
+        bounds: tuple[float, ...],
+        cursor: tuple[float | None, ...],
+        next_cursor: Callable[[_Row], tuple[float | None, ...]],
+        page_size: int,
+    ) -> AsyncIterator[list[ScheduledJob]]:
+        """Yield the rows of a keyset paginated query, page by page.
+
+        The query takes the `bounds`, then the `cursor` of the last row of
+        the previous page and the page size.
+        """
+
+        def get_page() -> list[_Row]:
+            cursor_ = self.conn.execute(query, (*bounds, *cursor, page_size))
+            return cursor_.fetchall()
+
+        while rows := await self._to_thread(get_page):
+            cursor = next_cursor(rows[-1])
+            yield [ScheduledJob(*row[1:]) for row in rows]
+            if len(rows) < page_size:
+                return
+
     @override
     async def add_schedule(self, scheduled: ScheduledJob) -> None:
         def insert() -> None:
@@ -141,6 +303,7 @@ class SQLiteStorage(Storage):
                         scheduled.func_name,
                         scheduled.message,
                         scheduled.status,
+                        scheduled.exec_at,
                     ),
                 )
 
@@ -153,3 +316,33 @@ class SQLiteStorage(Storage):
                 _ = conn.execute(self.delete_schedule_query, (job_id,))
 
         return await self._to_thread(delete)
+
+    @override
+    async def delete_schedules(self, job_ids: Sequence[str]) -> None:
+        def delete() -> None:
+            with self.conn as conn:
+                _ = conn.executemany(
+                    self.delete_schedule_query,
+                    [(job_id,) for job_id in job_ids],
+                )
+
+        return await self._to_thread(delete)
+
+    @override
+    async def acquire_cron_lease(
+        self,
+        name: str,
+        owner: str,
+        fire_at: float,
+        ttl: float,
+    ) -> bool:
+        def acquire() -> bool:
+            now = time.time()
+            with self.conn as conn:
+                cursor = conn.execute(
+                    self.acquire_lease_query,
+                    (name, owner, fire_at, now + ttl, now),
+                )
+            return cursor.rowcount == 1
+
+        return await self._to_thread(acquire)
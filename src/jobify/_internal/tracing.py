@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import importlib
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Protocol, TypeAlias, final
+
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+# W3C trace context headers, e.g. `{"traceparent": "00-..."}`.
+Carrier: TypeAlias = dict[str, str]
+
+
+class Span(Protocol):
+    """The part of a span Jobify uses, as in `opentelemetry.trace.Span`."""
+
+    def set_attribute(self, key: str, value: Any) -> None: ...  # noqa: ANN401
+
+    def record_exception(self, exception: BaseException) -> None: ...
+
+    def end(self) -> None: ...
+
+
+class Tracer(Protocol):
+    """Creates the spans of Jobify.
+
+    `parent` is either a span or a carrier returned by `inject`, which is
+    how a restored job continues the trace it was scheduled in.
+    """
+
+    def start_span(
+        self,
+        name: str,
+        *,
+        parent: Span | Mapping[str, str] | None = None,
+        attributes: Mapping[str, Any] | None = None,
+        start_time: int | None = None,
+    ) -> Span: ...
+
+    def inject(self, span: Span) -> Carrier: ...
+
+
+def _import_opentelemetry(name: str) -> ModuleType:
+    try:
+        return importlib.import_module(f"opentelemetry.{name}")
+    except ImportError as exc:
+        msg = (
+            "OpenTelemetryTracer requires the opentelemetry-api package."
+            " Install it with `pip install opentelemetry-api`."
+        )
+        raise RuntimeError(msg) from exc
+
+
+@final
+class OpenTelemetryTracer(Tracer):
+    """`Tracer` backed by the globally configured OpenTelemetry SDK."""
+
+    __slots__: tuple[str, ...] = ("_propagate", "_trace", "_tracer")
+
+    def __init__(self, tracer: Any | None = None) -> None:  # noqa: ANN401
+        self._trace: Any = _import_opentelemetry("trace")
+        self._propagate: Any = _import_opentelemetry("propagate")
+        self._tracer: Any = tracer or self._trace.get_tracer("jobify")
+
+    @override
+    def start_span(
+        self,
+        name: str,
+        *,
+        parent: Span | Mapping[str, str] | None = None,
+        attributes: Mapping[str, Any] | None = None,
+        start_time: int | None = None,
+    ) -> Span:
+        if parent is None:
+            context = None
+        elif isinstance(parent, Mapping):
+            context = self._propagate.extract(parent)
+        else:
+            context = self._trace.set_span_in_context(parent)
+        span: Span = self._tracer.start_span(
+            name,
+            context=context,
+            attributes=attributes,
+            start_time=start_time,
+        )
+        return span
+
+    @override
+    def inject(self, span: Span) -> Carrier:
+        carrier: Carrier = {}
+        context = self._trace.set_span_in_context(span)
+        self._propagate.inject(carrier, context=context)
+        return carrier
@@ -1,6 +1,8 @@
 """Cron Parser implementation."""
 
-from datetime import datetime
+import calendar
+import functools
+from datetime import datetime, timedelta
 from typing import Final
 
 from crontab import CronTab as _CronTab
@@ -48,3 +50,376 @@ def create_crontab(expression: str) -> CronTab:
 
     """
     return CronTab(expression)
+
+
+SECOND, MINUTE, HOUR, DAY, MONTH, WEEKDAY, YEAR = range(7)
+
+# (lowest, highest) value of every field.
+_RANGES: Final = (
+    (0, 59),
+    (0, 59),
+    (0, 23),
+    (1, 31),
+    (1, 12),
+    (0, 6),
+    (1970, 2099),
+)
+_NAMES: Final = {
+    MONTH: {
+        name: number
+        for number, name in enumerate(
+            (
+                "jan",
+                "feb",
+                "mar",
+                "apr",
+                "may",
+                "jun",
+                "jul",
+                "aug",
+                "sep",
+                "oct",
+                "nov",
+                "dec",
+            ),
+            start=1,
+        )
+    },
+    WEEKDAY: {
+        name: number
+        for number, name in enumerate(
+            ("sun", "mon", "tue", "wed", "thu", "fri", "sat"),
+        )
+    },
+}
+_ALIASES: Final = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+_ONE_SECOND: Final = timedelta(seconds=1)
+
+
+def _bits(values: range | set[int]) -> int:
+    mask = 0
+    for value in values:
+        mask |= 1 << value
+    return mask
+
+
+def _next_bit(mask: int, start: int) -> int:
+    """Return the lowest set bit of `mask` from `start` on, or -1."""
+    rest = mask >> start
+    if not rest:
+        return -1
+    return start + (rest & -rest).bit_length() - 1
+
+
+@functools.cache
+def _month_shape(year: int, month: int) -> tuple[int, int]:
+    """Return the weekday of the 1st, with Sunday as 0, and the last day."""
+    monday_first, last = calendar.monthrange(year, month)
+    return (monday_first + 1) % 7, last
+
+
+def _invalid(entry: str, reason: str) -> ValueError:
+    return ValueError(f"Invalid cron field {entry!r}: {reason}.")
+
+
+def _parse_value(field: int, entry: str, limit: int) -> int:
+    if (number := _NAMES.get(field, {}).get(entry)) is not None:
+        return number
+    if not entry.isdigit():
+        raise _invalid(entry, "not a number")
+    value = int(entry, 10)
+    if not _RANGES[field][0] <= value <= limit:
+        raise _invalid(entry, "out of range")
+    return value
+
+
+def _parse_days_before_end(entry: str) -> set[int]:
+    # `zN` is N days before the last day, `zN-M` a range of those.
+    start, sep, end = entry.partition("-")
+    if not (start.isdigit() and (not sep or end.isdigit())):
+        raise _invalid(entry, "expected a number of days from 0 to 7")
+    first = int(start, 10)
+    last = int(end, 10) if sep else first
+    if not (0 <= first <= last <= 7):  # noqa: PLR2004
+        raise _invalid(entry, "expected a number of days from 0 to 7")
+    return set(range(first, last + 1))
+
+
+def _parse_last_weekdays(entry: str) -> set[int]:
+    # `lN` is the last weekday N of the month, `lN-M` a range of those.
+    start, sep, end = entry.partition("-")
+    if not (start.isdigit() and (not sep or end.isdigit())):
+        raise _invalid(entry, "expected a weekday from 0 to 7")
+    first = int(start, 10)
+    last = int(end, 10) if sep else first
+    if not (0 <= first <= 7 and 0 <= last <= 7):  # noqa: PLR2004
+        raise _invalid(entry, "expected a weekday from 0 to 7")
+    return {day % 7 for day in range(first, last + 1)}
+
+
+def _parse_step(entry: str, limit: int) -> tuple[str, int | None]:
+    if "/" not in entry:
+        return entry, None
+    entry, _, step_entry = entry.partition("/")
+    if not step_entry.isdigit():
+        raise _invalid(step_entry, "the step must be a positive number")
+    step = int(step_entry, 10)
+    if not 0 < step <= limit:
+        raise _invalid(step_entry, "the step is out of range")
+    return entry, step
+
+
+def _parse_range(field: int, entry: str) -> set[int]:
+    low, high = _RANGES[field]
+    # Sunday can also be written as 7.
+    limit = 7 if field == WEEKDAY else high
+    entry, step = _parse_step(entry, limit)
+
+    if "-" in entry:
+        start_entry, _, end_entry = entry.partition("-")
+        start = _parse_value(field, start_entry, limit)
+        end = _parse_value(field, end_entry, limit)
+        if field == WEEKDAY and end == 0:
+            end = 7  # Allows "sat-sun".
+    elif entry == "*":
+        start, end = low, high
+    else:
+        start = _parse_value(field, entry, limit)
+        end = start if step is None else high
+
+    if start > end:
+        raise _invalid(entry, "the range starts after its end")
+    if step is not None and start + step > limit:
+        raise _invalid(entry, "the step leaves the range after one value")
+    values = set(range(start, end + 1, step or 1))
+    if field == WEEKDAY and 7 in values:  # noqa: PLR2004
+        values.discard(7)
+        values.add(0)
+    return values
+
+
+def _compile_field(field: int, entry: str) -> tuple[int, int]:
+    """Compile one field into a mask of values and a mask of special forms.
+
+    The special mask of the day field holds the days before the end of the
+    month (`L` is 0), and that of the weekday field the weekdays that only
+    match in the last week of the month.
+    """
+    low, high = _RANGES[field]
+    values = 0
+    special = 0
+    for item in entry.lower().split(","):
+        if item in ("*", "?"):
+            if item == "?" and field not in (DAY, WEEKDAY):
+                raise _invalid(item, "only allowed in the day fields")
+            values |= _bits(range(low, high + 1))
+        elif item == "l" and field == DAY:
+            special |= 1
+        elif item == "l" and field == WEEKDAY:
+            values |= 1 << 6  # The last day of the week, Saturday.
+        elif item.startswith("z") and field == DAY:
+            special |= _bits(_parse_days_before_end(item[1:]))
+        elif item.startswith("l") and field == WEEKDAY:
+            special |= _bits(_parse_last_weekdays(item[1:]))
+        else:
+            values |= _bits(_parse_range(field, item))
+    return values, special
+
+
+class NativeCronTab(CronParser):
+    """Cron expression parser compiled into one bitmask per field.
+
+    It accepts the same expressions as `CronTab` and computes the same
+    runs, but finds the next run by scanning the bits of each field, from
+    the year down to the second, instead of stepping through datetimes.
+    Like `CronTab`, it works on the wall clock time of `now` and returns
+    a datetime in the same timezone.
+
+    A bare `L` in the day of week field is also accepted, and means
+    Saturday.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_days",
+        "_days_before_end",
+        "_expression",
+        "_first_hour",
+        "_first_minute",
+        "_first_second",
+        "_hours",
+        "_last_weekdays",
+        "_minutes",
+        "_months",
+        "_seconds",
+        "_weekdays",
+        "_years",
+    )
+
+    def __init__(self, expression: str) -> None:
+        """Compile a cron expression.
+
+        Args:
+            expression: A cron expression.
+
+        Raises:
+            ValueError: The expression is not valid.
+
+        """
+        fields = _ALIASES.get(expression, expression).split()
+        if len(fields) == 5:  # noqa: PLR2004
+            fields = ["0", *fields, "*"]
+        elif len(fields) == 6:  # noqa: PLR2004
+            fields = ["0", *fields]
+        if len(fields) != 7:  # noqa: PLR2004
+            msg = f"Cron expression {expression!r} needs 5 to 7 fields."
+            raise ValueError(msg)
+
+        masks = [
+            _compile_field(field, entry) for field, entry in enumerate(fields)
+        ]
+        self._expression: Final = expression
+        self._seconds: Final = masks[SECOND][0]
+        self._minutes: Final = masks[MINUTE][0]
+        self._hours: Final = masks[HOUR][0]
+        self._months: Final = masks[MONTH][0]
+        self._years: Final = masks[YEAR][0]
+        self._days: Final = masks[DAY][0]
+        self._days_before_end: Final = masks[DAY][1]
+        # Days of the month that match the weekdays, and the days that are
+        # in the last week of a month, for each weekday of the 1st.
+        self._weekdays: Final = tuple(
+            self._days_of_weekdays(masks[WEEKDAY][0], first)
+            for first in range(7)
+        )
+        self._last_weekdays: Final = tuple(
+            self._days_of_weekdays(masks[WEEKDAY][1], first)
+            for first in range(7)
+        )
+        self._first_hour: Final = _next_bit(self._hours, 0)
+        self._first_second: Final = _next_bit(self._seconds, 0)
+        self._first_minute: Final = _next_bit(self._minutes, 0)
+
+    @staticmethod
+    def _days_of_weekdays(weekdays: int, first: int) -> int:
+        return _bits(
+            {
+                day
+                for day in range(1, 32)
+                if weekdays >> (first + day - 1) % 7 & 1
+            },
+        )
+
+    def _days_in(self, year: int, month: int) -> int:
+        """Return the mask of the days of a month that match."""
+        first, last = _month_shape(year, month)
+        month_days = (1 << (last + 1)) - 2
+        days = self._days
+        if before_end := self._days_before_end:
+            offset = 0
+            while (offset := _next_bit(before_end, offset)) != -1:
+                days |= 1 << max(last - offset, 0)
+                offset += 1
+        last_week = month_days & ~((1 << (last - 6)) - 1)
+        weekdays = self._weekdays[first] | (
+            self._last_weekdays[first] & last_week
+        )
+        return days & weekdays & month_days
+
+    def _time_from(
+        self,
+        hour: int,
+        minute: int,
+        second: int,
+    ) -> tuple[int, int, int] | None:
+        """Return the first matching time of a day from the given one on."""
+        next_hour = _next_bit(self._hours, hour)
+        if next_hour == hour:
+            next_minute = _next_bit(self._minutes, minute)
+            if next_minute == minute:
+                next_second = _next_bit(self._seconds, second)
+                if next_second != -1:
+                    return hour, minute, next_second
+                next_minute = _next_bit(self._minutes, minute + 1)
+            if next_minute != -1:
+                return hour, next_minute, self._first_second
+            next_hour = _next_bit(self._hours, hour + 1)
+        if next_hour == -1:
+            return None
+        return next_hour, self._first_minute, self._first_second
+
+    @override
+    def next_run(self, *, now: datetime) -> datetime:
+        """Compute the next scheduled execution time.
+
+        Args:
+            now: Current datetime.
+
+        Returns:
+            The next run datetime, strictly after `now`.
+
+        Raises:
+            ValueError: The expression has no run after `now` before the
+                end of 2099.
+
+        """
+        start = now.replace(microsecond=0, tzinfo=None) + _ONE_SECOND
+        year, month, day = start.year, start.month, start.day
+        hour, minute, second = start.hour, start.minute, start.second
+        if year < _RANGES[YEAR][0]:
+            year, month, day = _RANGES[YEAR][0], 1, 1
+            hour = minute = second = 0
+
+        while (next_year := _next_bit(self._years, year)) != -1:
+            if next_year != year:
+                year, month, day = next_year, 1, 1
+                hour = minute = second = 0
+            while (next_month := _next_bit(self._months, month)) != -1:
+                if next_month != month:
+                    month, day = next_month, 1
+                    hour = minute = second = 0
+                days = self._days_in(year, month) >> day << day
+                if days >> day & 1:
+                    if (
+                        time := self._time_from(hour, minute, second)
+                    ) is not None:
+                        return datetime(
+                            year, month, day, *time, tzinfo=now.tzinfo
+                        )
+                    days ^= 1 << day
+                if days:
+                    return datetime(
+                        year,
+                        month,
+                        _next_bit(days, day),
+                        self._first_hour,
+                        self._first_minute,
+                        self._first_second,
+                        tzinfo=now.tzinfo,
+                    )
+                month, day = month + 1, 1
+                hour = minute = second = 0
+            year, month, day = year + 1, 1, 1
+            hour = minute = second = 0
+
+        msg = f"Cron expression {self._expression!r} has no run after {now}."
+        raise ValueError(msg)
+
+
+def create_native_crontab(expression: str) -> NativeCronTab:
+    """Create a NativeCronTab instance.
+
+    Args:
+        expression: A cron expression.
+
+    Returns:
+        A new NativeCronTab instance.
+
+    """
+    return NativeCronTab(expression)
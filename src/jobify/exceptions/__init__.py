@@ -11,6 +11,7 @@ from jobify._internal.exceptions import (
     DuplicateJobError,
     JobFailedError,
     JobNotCompletedError,
+    JobRescheduledError,
     JobTimeoutError,
     RouteAlreadyRegisteredError,
 )
@@ -21,6 +22,7 @@ __all__ = (
     "DuplicateJobError",
     "JobFailedError",
     "JobNotCompletedError",
+    "JobRescheduledError",
     "JobTimeoutError",
     "RouteAlreadyRegisteredError",
 )
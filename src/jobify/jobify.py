@@ -4,21 +4,34 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import itertools
 import logging
-from typing import TYPE_CHECKING, Literal, ParamSpec, TypeVar
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, ParamSpec, TypeVar
 from zoneinfo import ZoneInfo
 
 from typing_extensions import Self
 
+from jobify._internal.common.constants import (
+    RESTORE_CHUNK_SIZE,
+    RESTORE_PAGE_SIZE,
+    JobStatus,
+    RunMode,
+)
 from jobify._internal.configuration import (
     Cron,
     JobifyConfiguration,
     WorkerPools,
 )
+from jobify._internal.inspection import INSPECTION_ERRORS
 from jobify._internal.message import Message
+from jobify._internal.metrics import Metrics
 from jobify._internal.router.root import RootRouter
+from jobify._internal.runners import PoolStrategy
+from jobify._internal.scheduler.registry import JobRegistry, ShardedJobs
 from jobify._internal.serializers.json import JSONSerializer
 from jobify._internal.serializers.json_extended import ExtendedJSONSerializer
+from jobify._internal.shards import Shards
 from jobify._internal.shared_state import SharedState
 from jobify._internal.storage.dummy import DummyStorage
 from jobify._internal.storage.sqlite import SQLiteStorage
@@ -26,17 +39,21 @@ from jobify._internal.typeadapter.dummy import DummyDumper, DummyLoader
 from jobify.crontab import create_crontab
 
 if TYPE_CHECKING:
+    import inspect
     from collections.abc import Callable, Sequence
     from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
     from types import TracebackType
 
     from jobify._internal.common.types import Lifespan, LoopFactory
+    from jobify._internal.configuration import Retention
     from jobify._internal.cron_parser import CronFactory
     from jobify._internal.middleware.base import BaseMiddleware
     from jobify._internal.middleware.exceptions import MappingExceptionHandlers
+    from jobify._internal.router.root import RootRoute
     from jobify._internal.scheduler.job import Job
     from jobify._internal.serializers.base import Serializer
-    from jobify._internal.storage.abc import Storage
+    from jobify._internal.storage.abc import ScheduledJob, Storage
+    from jobify._internal.tracing import Tracer
     from jobify._internal.typeadapter.base import Dumper, Loader
 
 
@@ -61,6 +78,21 @@ def cache_result(f: Callable[ParamsT, ReturnT]) -> Callable[ParamsT, ReturnT]:
     return wrapper
 
 
+class ShutdownReport(NamedTuple):
+    """Jobs that were running when `Jobify.shutdown` was called."""
+
+    drained: int
+    """Jobs that finished before the drain deadline."""
+    cancelled: int
+    """Jobs that were still running at the deadline."""
+
+
+class _DecodedJob(NamedTuple):
+    route: RootRoute[..., Any]
+    message: Message
+    bound: inspect.BoundArguments
+
+
 class Jobify(RootRouter):
     """Jobify is the main app for scheduling and managing background jobs.
 
@@ -84,9 +116,35 @@ class Jobify(RootRouter):
         exception_handlers: MappingExceptionHandlers | None = None,
         threadpool_executor: ThreadPoolExecutor | None = None,
         processpool_executor: ProcessPoolExecutor | None = None,
+        interpreterpool_executor: ThreadPoolExecutor | None = None,
+        processpool_initializer: Callable[[], None] | None = None,
+        processpool_max_tasks_per_child: int | None = None,
+        processpool_max_worker_rss: int | None = None,
+        tracer: Tracer | None = None,
+        restore_horizon: float | None = None,
+        drain_timeout: float | None = None,
+        retention: Retention | None = None,
+        cron_lease: float | None = None,
+        shards: int = 1,
     ) -> None:
         """Initialize a `Jobify` instance."""
+        if shards < 1:
+            msg = "shards must be >= 1."
+            raise ValueError(msg)
         getloop = cache_result(loop_factory)
+        shared_state = SharedState(pending_jobs=JobRegistry(retention))
+        app_shards = None
+        if shards > 1:
+            states = [
+                shared_state,
+                *(
+                    SharedState(pending_jobs=JobRegistry(retention))
+                    for _ in range(1, shards)
+                ),
+            ]
+            app_shards = Shards(states, getloop)
+            # Runners and storage await on the loop of the calling shard.
+            getloop = app_shards.getloop
 
         if storage is False:
             storage = DummyStorage()
@@ -118,86 +176,341 @@ class Jobify(RootRouter):
             serializer=serializer,
             worker_pools=WorkerPools(
                 _processpool=processpool_executor,
+                _interpreterpool=interpreterpool_executor,
                 threadpool=threadpool_executor,
+                process_initializer=processpool_initializer,
+                max_tasks_per_child=processpool_max_tasks_per_child,
+                max_worker_rss=processpool_max_worker_rss,
             ),
             cron_factory=cron_factory or create_crontab,
+            tracer=tracer,
+            restore_horizon=restore_horizon,
+            drain_timeout=drain_timeout,
+            cron_lease=cron_lease,
+            shards=app_shards,
         )
         super().__init__(
             lifespan=lifespan,
             middleware=middleware,
-            shared_state=SharedState(),
+            shared_state=shared_state,
             jobify_config=self.configs,
             exception_handlers=exception_handlers,
         )
 
+    async def _start_worker_pools(self) -> None:
+        process_routes = [
+            route
+            for route in self.task._routes.values()
+            if isinstance(route._run_strategy, PoolStrategy)
+            and route._run_strategy.mode is RunMode.PROCESS
+        ]
+        if not process_routes:
+            return
+        # `__main__` is re-imported by the workers themselves.
+        modules = [
+            route.func.__module__
+            for route in process_routes
+            if route.func.__module__ != "__main__"
+        ]
+        await self.configs.worker_pools.start_processpool(
+            modules,
+            self.configs.getloop(),
+        )
+
     async def _restore_schedules(self) -> None:
-        schedules = await self.configs.storage.get_schedules()
-        for sch in schedules:
+        """Restore the stored jobs.
+
+        Pages of schedules are decoded in a worker thread and their timers
+        are armed in chunks, so the event loop keeps running meanwhile.
+        With a `restore_horizon`, only the schedules due before it are read
+        here: the storage pages the rest by run time, and they are decoded
+        and armed in the background. Schedules that cannot be restored are
+        deleted together at the end.
+        """
+        storage = self.configs.storage
+        horizon = self.configs.restore_horizon
+        failed: list[str] = []
+        if horizon is None:
+            async for page in storage.iter_schedules(RESTORE_PAGE_SIZE):
+                decoded = await self._decode_page(page, failed)
+                await self._arm_restored(decoded, failed)
+            if failed:
+                await storage.delete_schedules(failed)
+            return
+
+        deadline = datetime.now(tz=self.configs.tz) + timedelta(
+            seconds=horizon,
+        )
+        later: list[_DecodedJob] = []
+        pages = storage.iter_schedules(
+            RESTORE_PAGE_SIZE,
+            before=deadline.timestamp(),
+        )
+        async for page in pages:
+            decoded = await self._decode_page(page, failed)
+            due: list[_DecodedJob] = []
+            # Schedules stored without a run time are only known to be due
+            # later once decoded.
+            for item in decoded:
+                at = item.message.trigger.get("at")
+                is_later = isinstance(at, datetime) and at > deadline
+                (later if is_later else due).append(item)
+            await self._arm_restored(due, failed)
+
+        task = asyncio.create_task(
+            self._finish_restore(later, deadline, failed),
+        )
+        pending_tasks = self.task._shared_state.pending_tasks
+        pending_tasks.add(task)
+        task.add_done_callback(pending_tasks.discard)
+
+    async def _finish_restore(
+        self,
+        later: list[_DecodedJob],
+        deadline: datetime,
+        failed: list[str],
+    ) -> None:
+        storage = self.configs.storage
+        await self._arm_restored(later, failed)
+        pages = storage.iter_schedules(
+            RESTORE_PAGE_SIZE,
+            since=deadline.timestamp(),
+        )
+        async for page in pages:
+            decoded = await self._decode_page(page, failed)
+            await self._arm_restored(decoded, failed)
+        if failed:
+            await storage.delete_schedules(failed)
+
+    async def _decode_page(
+        self,
+        page: Sequence[ScheduledJob],
+        failed: list[str],
+    ) -> list[_DecodedJob]:
+        schedules: list[ScheduledJob] = []
+        for sch in page:
             if self.find_job(sch.job_id):
-                msg = (
-                    f"Job {sch.job_id} is already active (code defined)."
-                    "Skipping DB restore."
+                logger.debug(
+                    "Job %s is already active (code defined). "
+                    "Skipping DB restore.",
+                    sch.job_id,
                 )
-                logger.debug(msg)
                 continue
+            if route := self.task._routes.get(sch.func_name):
+                try:
+                    # Registers the argument types before decoding.
+                    _ = route.func_spec
+                except INSPECTION_ERRORS:
+                    # The code of the route is broken, not the stored job,
+                    # so the job is kept for a fixed release.
+                    logger.exception(
+                        "Cannot inspect %s to restore job %s",
+                        sch.func_name,
+                        sch.job_id,
+                    )
+                    continue
+            schedules.append(sch)
+        if not schedules:
+            return []
+
+        loop = self.configs.getloop()
+        threadpool = self.configs.worker_pools.threadpool
+        results = await loop.run_in_executor(
+            threadpool,
+            self._decode_schedules,
+            schedules,
+        )
+        decoded: list[_DecodedJob] = []
+        for sch, result in zip(schedules, results, strict=True):
+            if isinstance(result, Exception):
+                self._restore_failed(sch, result, failed)
+            else:
+                decoded.append(result)
+        return decoded
+
+    def _decode_schedules(
+        self,
+        schedules: Sequence[ScheduledJob],
+    ) -> list[_DecodedJob | Exception]:
+        results: list[_DecodedJob | Exception] = []
+        for sch in schedules:
             try:
-                await self._feed_message(sch.message)
-            except (KeyError, TypeError, ValueError) as exc:
-                # KeyError: The function has been removed from the router
-                #   (the code has changed).
-                # TypeError: The arguments in the database do not match the new
-                #   function signature.
-                # ValueError: Serializer error.
-                msg = (
-                    f"Cannot restore job {sch.job_id} ({sch.func_name}). "
-                    f"Exception Type: {type(exc)}. "
-                    f"Reason: {exc}. Removing from storage."
-                )
-                logger.warning(msg)
-                await self.configs.storage.delete_schedule(sch.job_id)
-            except Exception:  # pragma: no cover
-                msg = f"Unexpected error restoring job {sch.job_id}"
-                logger.exception(msg)
+                results.append(self._decode(sch.message))
+            except Exception as exc:  # noqa: BLE001, PERF203
+                results.append(exc)
+        return results
 
-    async def _feed_message(self, raw_msg: bytes) -> None:
+    def _decode(self, raw_msg: bytes) -> _DecodedJob:
         de_message = self.configs.serializer.loadb(raw_msg)
         msg = self.configs.loader.load(de_message, Message)
         route = self.task._routes[msg.func_name]
+        params_type = route.func_spec.params_type
         for name, arg in msg.arguments.items():
             msg.arguments[name] = self.configs.loader.load(
                 arg,
-                route.func_spec.params_type[name],
+                params_type[name],
             )
         bound = route.func_spec.signature.bind(**msg.arguments)
-        builder = route.create_builder(bound)
-        if "cron" in msg.trigger:
-            _ = builder._cron(**msg.trigger)
-        else:
-            _ = builder._at(**msg.trigger)
+        return _DecodedJob(route, msg, bound)
+
+    async def _arm_restored(
+        self,
+        decoded: Sequence[_DecodedJob],
+        failed: list[str],
+    ) -> None:
+        for index, (route, msg, bound) in enumerate(decoded, start=1):
+            if self.find_job(msg.job_id):
+                continue
+            builder = route.create_builder(bound)
+            try:
+                if "cron" in msg.trigger:
+                    job = builder._cron(**msg.trigger, attempt=msg.attempt)
+                else:
+                    job = builder._at(**msg.trigger, attempt=msg.attempt)
+            except ValueError as exc:
+                logger.warning(
+                    "Cannot restore job %s (%s). Reason: %s. "
+                    "Removing from storage.",
+                    msg.job_id,
+                    msg.func_name,
+                    exc,
+                )
+                failed.append(msg.job_id)
+                continue
+            # Links the execution to the trace the job was scheduled in.
+            job._trace_context = msg.trace_context
+            if index % RESTORE_CHUNK_SIZE == 0:
+                await asyncio.sleep(0)
+
+    def _restore_failed(
+        self,
+        sch: ScheduledJob,
+        exc: Exception,
+        failed: list[str],
+    ) -> None:
+        if not isinstance(exc, (KeyError, TypeError, ValueError)):
+            logger.error(
+                "Unexpected error restoring job %s",
+                sch.job_id,
+                exc_info=exc,
+            )
+            return
+        # KeyError: The function has been removed from the router
+        #   (the code has changed).
+        # TypeError: The arguments in the database do not match the new
+        #   function signature.
+        # ValueError: Serializer error.
+        logger.warning(
+            "Cannot restore job %s (%s). Exception Type: %s. "
+            "Reason: %s. Removing from storage.",
+            sch.job_id,
+            sch.func_name,
+            type(exc),
+            exc,
+        )
+        failed.append(sch.job_id)
+
+    def metrics(self) -> str:
+        """Render the metrics of every route in the OpenMetrics text format.
+
+        The result can be served as is on a Prometheus scrape endpoint,
+        with the content type
+        `application/openmetrics-text; version=1.0.0; charset=utf-8`.
+
+        Returns:
+            Counters of scheduled, started, succeeded, failed and timed out
+            jobs, histograms of execution time and start lateness, gauges of
+            running and pending jobs, the circuit breaker states, the
+            statistics of the result caches and of the cron parser cache,
+            and the recycling of the process pool.
+
+        """
+        if (shards := self.configs.shards) is None:
+            shared_state = self.task._shared_state
+            return shared_state.metrics.render(
+                shared_state.pending_jobs.values(),
+                self.task._breakers,
+                self.task._caches,
+                self.configs.cron_parsers,
+                self.configs.worker_pools,
+            )
+        metrics = Metrics.merge(state.metrics for state in shards.states)
+        return metrics.render(
+            itertools.chain.from_iterable(
+                tuple(jobs.values()) for jobs in shards.registries
+            ),
+            self.task._breakers,
+            self.task._caches,
+            self.configs.cron_parsers,
+            self.configs.worker_pools,
+        )
+
+    def _registries(self) -> tuple[JobRegistry, ...]:
+        if (shards := self.configs.shards) is None:
+            return (self.task._shared_state.pending_jobs,)
+        return shards.registries
+
+    @property
+    def jobs(self) -> JobRegistry | ShardedJobs:
+        """The pending jobs, by ID.
+
+        Besides the mapping methods, `query` finds jobs by route, status and
+        planned time, and `count` counts them, without scanning every job.
+        A sharded app returns a read-only view over the jobs of its shards.
+
+        Example:
+            ```python
+            # The next 100 jobs of `send_email` that are due within a minute
+            soon = datetime.now(tz=timezone.utc) + timedelta(minutes=1)
+            jobs = app.jobs.query(
+                route="send_email",
+                status=JobStatus.SCHEDULED,
+                due_before=soon,
+                limit=100,
+            )
+            running = app.jobs.count(status=JobStatus.RUNNING)
+            ```
+
+        """
+        if (shards := self.configs.shards) is None:
+            return self.task._shared_state.pending_jobs
+        return ShardedJobs(shards.registries)
 
     def find_job(self, id_: str, /) -> Job[ReturnT] | None:
-        """Find an active job by its ID.
+        """Find a job by its ID.
 
         Args:
             id_: Unique identifier of the job.
 
         Returns:
-            The `Job` instance if it's currently pending or running,
+            The `Job` instance if it's currently pending or running, or if
+            it has completed and is still kept by the `retention` policy,
             otherwise `None`.
 
         """
-        return self.task._shared_state.pending_jobs.get(id_)
-
-    async def wait_all(self, timeout: float | None = None) -> None:
+        if (shards := self.configs.shards) is None:
+            return self.task._shared_state.pending_jobs.find(id_)
+        for jobs in shards.lookup(id_):
+            if (job := jobs.find(id_)) is not None:
+                return job
+        return None
+
+    async def wait_all(
+        self,
+        timeout: float | None = None,
+        *,
+        route: str | None = None,
+        include_crons: bool = True,
+    ) -> None:
         """Wait for all currently scheduled jobs to complete.
 
-        This method waits until all jobs currently registered have finished
-        executing (with statuses of SUCCESS, FAILED, or TIMEOUT). This is
-        useful in situations where it's important to ensure that background
-        tasks have completed before moving on.
+        This method waits until no job is pending any more: every job has
+        finished executing (with statuses of SUCCESS, FAILED, or TIMEOUT) or
+        was cancelled. This is useful in situations where it's important to
+        ensure that background tasks have completed before moving on.
 
-        The method sets an internal event when both conditions are met:
-        1. No jobs remain in the jobs registry (`_jobs_registry`)
+        The scheduler keeps a count of the pending jobs, so the wait costs
+        the same however many jobs there are.
 
         Args:
             timeout (optional): The maximum time in seconds to wait for the
@@ -205,6 +518,11 @@ class Jobify(RootRouter):
                 will be used, which means the job will wait indefinitely. If a
                 timeout is specified and it is reached, the method will raise
                 an `asyncio.TimeoutError`.
+            route (optional): Only wait for the jobs of the route with this
+                name.
+            include_crons: Whether to wait for cron jobs as well. A cron job
+                is pending until it is cancelled or reaches its `max_runs`,
+                so pass `False` when the app runs unbounded crons.
 
         Example:
             ```python
@@ -217,16 +535,20 @@ class Jobify(RootRouter):
                 await jobify.wait_all(timeout=30.0)
             except asyncio.TimeoutError:
                 print("Timeout reached while waiting for jobs")
+
+            # Ignore the crons, and the jobs of other routes
+            await jobify.wait_all(route="send_email", include_crons=False)
             ```
 
         """
-
-        async def target() -> None:
-            while jobs := self.task._shared_state.pending_jobs.values():
-                coros = (job.wait() for job in jobs)
-                _ = await asyncio.gather(*coros, return_exceptions=True)
-
-        await asyncio.wait_for(target(), timeout=timeout)
+        waiters = [
+            jobs.wait_idle(route, crons=include_crons)
+            for jobs in self._registries()
+            if jobs.outstanding(route, crons=include_crons)
+        ]
+        if not waiters:
+            return
+        await asyncio.wait_for(asyncio.gather(*waiters), timeout=timeout)
 
     async def startup(self) -> None:
         """Initialize the Jobify application.
@@ -234,52 +556,133 @@ class Jobify(RootRouter):
         This method:
         1. Marks the application as started
         2. Propagates startup events to all routers and their registrators
-        3. Schedules any pending cron jobs
+        3. Starts the process pool workers and preloads the modules of
+           every `RunMode.PROCESS` route
+        4. Schedules any pending cron jobs
 
         Raises:
             RuntimeError: If application startup fails due to configuration
             issues or router initialization errors.
 
         """
+        if self.configs.shards is not None:
+            await self.configs.shards.start()
         self.configs.app_started = True
         await self.configs.storage.startup()
         await self._propagate_startup(self)
+        await self._start_worker_pools()
         self.task.start_pending_crons()
         await self._restore_schedules()
 
-    async def shutdown(self) -> None:
+    async def shutdown(
+        self,
+        drain_timeout: float | None = None,
+    ) -> ShutdownReport:
         """Gracefully shut down the Jobify application.
 
         This method performs a structured shutdown:
-        1. Marks the application as stopped (`app_started = False`).
-        2. Propagates shutdown events to all routers/components.
-        3. Cancels all scheduled future jobs in the registry
-           (`_jobs_registry`).
-        4. Closes the jobify configuration (e.g., stopping the internal
-           scheduler).
-        5. Cancels all currently running tasks (in `_tasks_registry`), waits
-           for their completion, and explicitly clears the task registry.
+        1. Marks the application as stopped (`app_started = False`), so no
+           new job is scheduled and no due job is started any more.
+        2. Lets the running jobs finish for up to `drain_timeout` seconds,
+           including their storage writes, and cancels the rest.
+        3. Cancels all scheduled future jobs in the registry.
+        4. Closes the worker pools, propagates the shutdown events to all
+           routers and closes the storage.
 
-        Note:
-            The method uses `return_exceptions=True` when gathering cancelled
-            tasks to prevent shutdown from being interrupted by task exception.
+        A cancelled job is left in the storage, so a persisted job runs
+        again after the next startup.
+
+        Args:
+            drain_timeout: The maximum time in seconds to wait for the
+                running jobs. Defaults to the `drain_timeout` of the app.
+                With `None` there, or `0`, the running jobs are cancelled
+                immediately.
+
+        Returns:
+            How many running jobs were drained and how many were cancelled.
+
+        Example:
+            ```python
+            report = await app.shutdown(drain_timeout=30)
+            if report.cancelled:
+                logger.warning("%s jobs were cancelled", report.cancelled)
+            ```
 
         """
         self.configs.app_started = False
+        if drain_timeout is None:
+            drain_timeout = self.configs.drain_timeout
+
+        shards = self.configs.shards
+        if shards is None:
+            report = await self._drain(self.task._shared_state, drain_timeout)
+        else:
+            # Every shard drains its jobs on its own loop.
+            reports = await asyncio.gather(
+                self._drain(shards.states[0], drain_timeout),
+                *(
+                    asyncio.wrap_future(
+                        asyncio.run_coroutine_threadsafe(
+                            self._drain(state, drain_timeout),
+                            loop,
+                        ),
+                    )
+                    for state, loop in zip(
+                        shards.states[1:],
+                        shards.loops[1:],
+                        strict=True,
+                    )
+                ),
+            )
+            report = ShutdownReport(
+                drained=sum(r.drained for r in reports),
+                cancelled=sum(r.cancelled for r in reports),
+            )
+        if report.cancelled:
+            logger.warning(
+                "Cancelled %s running jobs at shutdown.",
+                report.cancelled,
+            )
 
-        if tasks := self.task._shared_state.pending_tasks:
+        self.configs.worker_pools.close()
+        await self._propagate_shutdown()
+        await self.configs.storage.shutdown()
+        if shards is not None:
+            await shards.stop()
+        return report
+
+    async def _drain(
+        self,
+        shared_state: SharedState,
+        drain_timeout: float | None,
+    ) -> ShutdownReport:
+        running = {
+            task
+            for job in shared_state.pending_jobs.query(
+                status=JobStatus.RUNNING,
+            )
+            if (task := job._task) is not None and not task.done()
+        }
+        tasks = shared_state.pending_tasks
+        # Background work, like a restore that is still arming timers.
+        for task in tasks - running:
+            _ = task.cancel()
+
+        drained = 0
+        if running and drain_timeout:
+            done, running = await asyncio.wait(running, timeout=drain_timeout)
+            drained = len(done)
+
+        if tasks:
             for task in tuple(tasks):
                 _ = task.cancel()
             _ = await asyncio.gather(*tasks, return_exceptions=True)
             tasks.clear()
 
-        if jobs := tuple(self.task._shared_state.pending_jobs.values()):
+        if jobs := tuple(shared_state.pending_jobs.values()):
             for job in jobs:
                 job._cancel()
-
-        self.configs.worker_pools.close()
-        await self._propagate_shutdown()
-        await self.configs.storage.shutdown()
+        return ShutdownReport(drained=drained, cancelled=len(running))
 
     async def __aenter__(self) -> Self:
         """Enter the Jobify context manager.
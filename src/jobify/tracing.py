@@ -0,0 +1,11 @@
+"""Tracing interface of Jobify.
+
+Pass a `Tracer` to `Jobify(tracer=...)` to get spans for scheduling,
+serialization, storage writes, the wait in the queue and the execution
+of every job. `OpenTelemetryTracer` implements it on top of the
+`opentelemetry-api` package, which is not installed with Jobify.
+"""
+
+from jobify._internal.tracing import Carrier, OpenTelemetryTracer, Span, Tracer
+
+__all__ = ("Carrier", "OpenTelemetryTracer", "Span", "Tracer")
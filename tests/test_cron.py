@@ -1,13 +1,28 @@
 import asyncio
+import random
 from datetime import datetime, timedelta
 from unittest import mock
 from zoneinfo import ZoneInfo
 
 import pytest
+from crontab import CronTab
 
-from jobify import Cron
-from jobify.crontab import create_crontab
-from tests.conftest import create_app
+from jobify import Cron, Jobify
+from jobify._internal.cron_parser import CronParser, CronParserCache
+from jobify.crontab import NativeCronTab, create_crontab
+from tests.conftest import create_app, cron_next_run
+
+UTC = ZoneInfo("UTC")
+# (lowest, highest) value of every field, with Sunday as 7 too.
+CRON_RANGES = (
+    (0, 59),
+    (0, 59),
+    (0, 23),
+    (1, 31),
+    (1, 12),
+    (0, 7),
+    (2024, 2032),
+)
 
 
 def test_cronparser() -> None:
@@ -97,3 +112,205 @@ async def test_cron_shutdown_graceful() -> None:
         await task
 
     assert len(app.task._shared_state.pending_jobs) == 0
+
+
+async def test_cron_group_shares_next_run(
+    amock: mock.AsyncMock,
+    now: datetime,
+) -> None:
+    parser = mock.Mock(spec=CronParser)
+    parser.next_run.side_effect = cron_next_run()
+    app = Jobify(cron_factory=lambda _: parser, storage=False)
+    f = app.task(amock)
+
+    async with app:
+        jobs = [
+            await f.schedule().cron(
+                Cron("* * * * *", max_runs=1),
+                job_id=str(i),
+                now=now,
+            )
+            for i in range(20)
+        ]
+        assert len({job.exec_at for job in jobs}) == 1
+        assert parser.next_run.call_count == 1
+        assert len(app.task._shared_state.cron_timers) == 1
+        _ = await asyncio.gather(*(job.wait() for job in jobs))
+
+    assert amock.await_count == len(jobs)
+    assert len(app.task._shared_state.cron_timers) == 0
+
+
+async def test_cron_group_cancel() -> None:
+    app = Jobify(storage=False)
+
+    @app.task
+    async def t() -> None:
+        return None
+
+    async with app:
+        timers = app.task._shared_state.cron_timers
+        jobs = [
+            await t.schedule().cron("@yearly", job_id=str(i)) for i in range(3)
+        ]
+        await jobs[0].cancel()
+        assert len(timers) == 1
+        assert jobs[0]._handle is not None
+        assert jobs[0]._handle.cancelled()
+        assert jobs[1]._handle is not None
+        assert not jobs[1]._handle.cancelled()
+
+        for job in jobs[1:]:
+            await job.cancel()
+        assert len(timers) == 0
+
+
+def test_cron_parser_cache() -> None:
+    cache = CronParserCache(create_crontab)
+    daily = cache("@daily")
+    assert cache("@daily") is daily
+    assert cache("@hourly") is not daily
+    assert (cache.hits, cache.misses) == (1, 2)
+    # Only the parsers in use are kept.
+    assert len(cache) == 1
+
+    del daily
+    assert len(cache) == 0
+
+
+async def test_cron_parser_shared(amock: mock.AsyncMock) -> None:
+    app = create_app()
+    f = app.task(amock)
+
+    async with app:
+        for i in range(3):
+            _ = await f.schedule().cron("@daily", job_id=str(i))
+        text = app.metrics()
+
+    cron_parsers = app.configs.cron_parsers
+    assert (cron_parsers.hits, cron_parsers.misses) == (2, 1)
+    assert "jobify_cron_parser_hits_total 2" in text
+    assert "jobify_cron_parser_misses_total 1" in text
+    assert "jobify_cron_parsers 1" in text
+
+
+def _random_cron_item(rng: random.Random, field: int, *, single: bool) -> str:
+    low, high = CRON_RANGES[field]
+    first, last = sorted((rng.randint(low, high), rng.randint(low, high)))
+    # `CronTab` ignores the rest of a list after a `zN` item.
+    specials = {3: ["L", "?", "z2", "z1-3"], 5: ["l5", "L1-5", "?", "mon-fri"]}
+    return rng.choice(
+        [
+            "*",
+            str(first),
+            f"{first}-{last}",
+            f"*/{rng.randint(1, max((high - low) // 2, 1))}",
+            f"{first}/{rng.randint(1, 5)}",
+            f"{first}-{last}/{rng.randint(1, 4)}",
+            *(specials.get(field, []) if single else []),
+        ],
+    )
+
+
+def _random_cron(rng: random.Random) -> str:
+    fields: list[str] = []
+    for field in range(7):
+        if rng.random() < 0.8:  # noqa: PLR2004
+            fields.append(_random_cron_item(rng, field, single=True))
+        else:
+            items = (_random_cron_item(rng, field, single=False) for _ in "ab")
+            fields.append(",".join(items))
+    size = rng.choice((5, 6, 7, 7))
+    return " ".join(fields[7 - size :] if size < 7 else fields)  # noqa: PLR2004
+
+
+def test_native_crontab_matches_crontab() -> None:
+    rng = random.Random(48)  # noqa: S311
+    tz = ZoneInfo("Europe/Moscow")
+    start = datetime(2024, 1, 1, tzinfo=tz)
+    compared = 0
+    for _ in range(300):
+        expression = _random_cron(rng)
+        try:
+            expected = CronTab(expression)
+        except ValueError:
+            with pytest.raises(ValueError, match="Invalid cron field"):
+                _ = NativeCronTab(expression)
+            continue
+        native = NativeCronTab(expression)
+        for _ in range(3):
+            now = start + timedelta(
+                seconds=rng.randint(0, 4 * 365 * 86400),
+                microseconds=rng.randint(0, 999_999),
+            )
+            next_run = expected.next(now=now, return_datetime=True)
+            if next_run is None:
+                with pytest.raises(ValueError, match="has no run after"):
+                    _ = native.next_run(now=now)
+            else:
+                assert native.next_run(now=now) == next_run, expression
+            compared += 1
+    assert compared > 600  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("expression", "now", "expected"),
+    [
+        (
+            "@yearly",
+            datetime(2024, 12, 31, 23, 59, 59, tzinfo=UTC),
+            datetime(2025, 1, 1, tzinfo=UTC),
+        ),
+        (
+            "0 0 29 2 *",
+            datetime(2025, 3, 1, tzinfo=UTC),
+            datetime(2028, 2, 29, tzinfo=UTC),
+        ),
+        (
+            "0 0 L * *",
+            datetime(2024, 2, 10, tzinfo=UTC),
+            datetime(2024, 2, 29, tzinfo=UTC),
+        ),
+        (
+            "0 0 * * l5",
+            datetime(2024, 5, 1, tzinfo=UTC),
+            datetime(2024, 5, 31, tzinfo=UTC),
+        ),
+        (
+            "0 0 ? * L",
+            datetime(2024, 5, 1, tzinfo=UTC),
+            datetime(2024, 5, 4, tzinfo=UTC),
+        ),
+        (
+            "0 0 1 * 1",
+            datetime(2024, 1, 2, tzinfo=UTC),
+            datetime(2024, 4, 1, tzinfo=UTC),
+        ),
+        (
+            "*/15 * * * * * *",
+            datetime(2024, 1, 1, 0, 0, 50, tzinfo=UTC),
+            datetime(2024, 1, 1, 0, 1, tzinfo=UTC),
+        ),
+        (
+            "30 9 * * mon-fri 2030",
+            datetime(2024, 1, 1, tzinfo=UTC),
+            datetime(2030, 1, 1, 9, 30, tzinfo=UTC),
+        ),
+    ],
+)
+def test_native_crontab_next_run(
+    expression: str,
+    now: datetime,
+    expected: datetime,
+) -> None:
+    assert NativeCronTab(expression).next_run(now=now) == expected
+
+
+def test_native_crontab_errors() -> None:
+    with pytest.raises(ValueError, match="needs 5 to 7 fields"):
+        _ = NativeCronTab("* * * *")
+    with pytest.raises(ValueError, match="out of range"):
+        _ = NativeCronTab("60 * * * * * *")
+    never = NativeCronTab("0 0 31 2 *")
+    with pytest.raises(ValueError, match="has no run after"):
+        _ = never.next_run(now=datetime(2024, 1, 1, tzinfo=UTC))
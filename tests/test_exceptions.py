@@ -1,9 +1,11 @@
 import asyncio
+import threading
 import time
 from unittest.mock import Mock
 
 import pytest
 
+from jobify import INJECT, CancellationToken, RunMode
 from jobify._internal.exceptions import (
     ApplicationStateError,
     JobNotCompletedError,
@@ -87,3 +89,20 @@ async def test_job_timeout() -> None:
         assert type(job2.exception) is JobTimeoutError
         assert str(job2.exception) == match.format(id=job2.id, timeout=timeout)
         assert job3.result() == "test"
+
+
+async def test_job_timeout_cancels_thread() -> None:
+    app = create_app()
+    stopped = threading.Event()
+
+    @app.task(timeout=0.01, run_mode=RunMode.THREAD)
+    def f1(token: CancellationToken = INJECT) -> None:
+        _ = token.wait(5)
+        stopped.set()
+
+    async with app:
+        job = await f1.schedule().delay(0)
+        await job.wait()
+
+    assert type(job.exception) is JobTimeoutError
+    assert stopped.wait(1)
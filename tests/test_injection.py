@@ -1,3 +1,4 @@
+import functools
 import inspect
 from typing import Any, no_type_check
 from unittest.mock import AsyncMock, Mock
@@ -8,9 +9,8 @@ from typing_extensions import override
 from jobify import INJECT, Job, JobContext, Jobify, State
 from jobify._internal.common.constants import EMPTY
 from jobify._internal.common.datastructures import RequestState
-from jobify._internal.injection import inject_context
+from jobify._internal.injection import has_injection, inject_context
 from jobify._internal.runners import Runnable, create_run_strategy
-from jobify.exceptions import JobFailedError
 from jobify.middleware import BaseMiddleware, CallNext
 from tests.conftest import create_app
 
@@ -57,28 +57,62 @@ async def test_injection() -> None:
         assert request_test_num == 1
 
 
-async def test_injection_wrong_usage() -> None:
+def test_injection_wrong_usage() -> None:
     app = create_app()
 
-    @app.task
     @no_type_check
     async def untyped_func(_job=INJECT) -> None:  # noqa: ANN001
         pass
 
-    @app.task
     async def not_exists_type_in_map(_job: Jobify = INJECT) -> None:
         pass
 
-    async with app:
-        job1 = await untyped_func.schedule().delay(0)
-        job2 = await not_exists_type_in_map.schedule().delay(0)
-        await job1.wait()
-        await job2.wait()
-
-    with pytest.raises(JobFailedError, match=f"job_id: {job1.id}"):
-        job1.result()
-    assert "Parameter _job requires" in str(job1.exception)
-    assert "Unknown type for injection" in str(job2.exception)
+    async def keyword_only(*, _job: Jobify = INJECT) -> None:
+        pass
+
+    # Routes with INJECT parameters are still checked when registered.
+    with pytest.raises(ValueError, match="Parameter _job requires"):
+        _ = app.task(untyped_func)
+    with pytest.raises(ValueError, match="Unknown type for injection"):
+        _ = app.task(not_exists_type_in_map)
+    with pytest.raises(ValueError, match="Unknown type for injection"):
+        _ = app.task(keyword_only)
+    assert not app.task._routes
+
+
+def test_has_injection() -> None:
+    async def plain(num: int = 1) -> None:
+        pass
+
+    async def injected(num: int, *, context: JobContext = INJECT) -> None:
+        pass
+
+    assert not has_injection(plain)
+    assert has_injection(injected)
+    assert has_injection(functools.partial(plain))
+
+
+def test_injection_plan() -> None:
+    app = create_app()
+
+    @app.task(func_name="plain")
+    async def plain(num: int) -> int:
+        return num
+
+    @app.task(func_name="injected")
+    async def injected(
+        num: int,
+        job: "Job[None]" = INJECT,
+        context: JobContext = INJECT,
+    ) -> None:
+        pass
+
+    routes = app.task._routes
+    assert routes["plain"].func_spec.injection == ()
+    assert routes["injected"].func_spec.injection == (
+        ("job", "job"),
+        ("context", None),
+    )
 
 
 async def test_inject_context_skips_non_inject_parameters(
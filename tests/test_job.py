@@ -1,11 +1,21 @@
 import asyncio
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import ANY, AsyncMock
+from zoneinfo import ZoneInfo
 
 import pytest
 
-from jobify import Job
+from jobify import Job, Jobify, Retention, RunMode, StreamOverflow
 from jobify._internal.common.constants import JobStatus
 from jobify._internal.exceptions import DuplicateJobError
+from jobify._internal.scheduler.registry import JobRegistry
+from jobify.exceptions import JobFailedError
+from jobify.storage import SQLiteStorage
 from tests.conftest import create_app
 
 
@@ -33,6 +43,31 @@ async def test_job() -> None:
     assert job2._handle.cancelled()
 
 
+async def test_job_event_is_lazy(amock: AsyncMock) -> None:
+    app = create_app()
+    f = app.task(amock)
+
+    async with app:
+        first = await f.schedule().delay(0)
+        waited = await f.schedule().delay(0.01)
+        waiter = asyncio.create_task(waited.wait())
+        await asyncio.sleep(0)
+        assert waited._event is not None
+        assert not waited.is_done()
+
+        await waiter
+        await first.wait()
+        assert first.is_done()
+        assert waited.is_done()
+
+        # A completed job does not need an event to be awaited.
+        done = await f.schedule().delay(0)
+        await asyncio.sleep(0.01)
+        assert done.is_done()
+        await done.wait()
+        assert done._event is None
+
+
 async def test_all_jobs_completed(amock: AsyncMock) -> None:
     app = create_app()
     f = app.task(amock)
@@ -59,6 +94,184 @@ async def test_all_jobs_completed(amock: AsyncMock) -> None:
         )
 
 
+async def test_wait_all_filters() -> None:
+    app = create_app()
+
+    @app.task(func_name="fast")
+    async def fast() -> None:
+        await asyncio.sleep(0.01)
+
+    @app.task(func_name="slow")
+    async def slow() -> None:
+        await asyncio.sleep(10)
+
+    async with app:
+        jobs = app.task._shared_state.pending_jobs
+        cron = await fast.schedule().cron("* * * * *", job_id="cron")
+        quick = await fast.schedule().delay(0)
+        _ = await slow.schedule().delay(0)
+        assert jobs.outstanding() == 3  # noqa: PLR2004
+        assert jobs.outstanding("fast", crons=False) == 1
+
+        await app.wait_all(timeout=1, route="fast", include_crons=False)
+        assert quick.is_done()
+        assert jobs.outstanding("fast") == 1
+
+        with pytest.raises(asyncio.TimeoutError):
+            await app.wait_all(timeout=0.01, include_crons=False)
+
+        await cron.cancel()
+        await app.wait_all(timeout=0, route="fast")
+
+
+async def test_retention_max_per_route() -> None:
+    app = Jobify(storage=False, retention=Retention(max_per_route=2))
+
+    @app.task(func_name="a")
+    def a(num: int) -> int:
+        return num
+
+    @app.task(func_name="b")
+    def b() -> None: ...
+
+    async with app:
+        jobs = [await a.schedule(num).delay(0) for num in range(4)]
+        other = await b.schedule().delay(0)
+        await app.wait_all()
+
+        assert [app.find_job(job.id) for job in jobs] == [
+            None,
+            None,
+            *jobs[2:],
+        ]
+        assert app.find_job(other.id) is other
+        found: Job[int] | None = app.find_job(jobs[3].id)
+        assert found is not None
+        assert found.result() == jobs[3].result()
+
+
+async def test_retention_ttl() -> None:
+    app = Jobify(storage=False, retention=Retention(ttl=0.05))
+
+    @app.task
+    def f() -> None: ...
+
+    async with app:
+        job = await f.schedule().delay(0)
+        await job.wait()
+        assert app.find_job(job.id) is job
+
+        await asyncio.sleep(0.06)
+        assert app.find_job(job.id) is None
+        assert app.task._shared_state.pending_jobs.completed is not None
+        assert len(app.task._shared_state.pending_jobs.completed) == 0
+
+
+def test_retention_config() -> None:
+    with pytest.raises(ValueError, match=r"Set max_per_route, ttl or both\."):
+        _ = Retention()
+    with pytest.raises(ValueError, match=r"max_per_route must be >= 1\."):
+        _ = Retention(max_per_route=0)
+    with pytest.raises(ValueError, match="ttl must be > 0"):
+        _ = Retention(ttl=0)
+
+
+async def test_failed_job_frames_cleared() -> None:
+    app = create_app()
+
+    class Payload: ...
+
+    @app.task
+    def f() -> None:
+        payload = Payload()
+        raise ValueError(payload)
+
+    async with app:
+        job = await f.schedule().delay(0)
+        await job.wait()
+
+    assert job.exception is not None
+    tb = job.exception.__traceback__
+    frames = []
+    while tb is not None:
+        frames.append(tb.tb_frame)
+        tb = tb.tb_next
+    assert frames[-1].f_code.co_name == "f"
+    assert "payload" not in frames[-1].f_locals
+
+
+async def test_job_registry_query(now: datetime) -> None:
+    app = create_app()
+
+    @app.task(func_name="a")
+    async def a() -> None:
+        await asyncio.sleep(10)
+
+    @app.task(func_name="b")
+    def b() -> None: ...
+
+    async with app:
+        a_jobs = [await a.schedule().delay(60 - i, now=now) for i in range(3)]
+        b_jobs = [await b.schedule().delay(30 + i, now=now) for i in range(3)]
+        running = await a.schedule().delay(0, now=now)
+        await asyncio.sleep(0.01)
+
+        jobs = app.jobs
+        by_time = sorted([*a_jobs, *b_jobs], key=lambda job: job.exec_at)
+        assert jobs.query(limit=4) == [running, *by_time[:3]]
+        assert jobs.query(route="a", status=JobStatus.SCHEDULED) == [
+            *reversed(a_jobs),
+        ]
+        assert jobs.query(status=JobStatus.RUNNING) == [running]
+        due_before = now + timedelta(seconds=59)
+        assert jobs.query(route="a", due_before=due_before) == [
+            running,
+            a_jobs[2],
+        ]
+        assert jobs.query(due_before=now + timedelta(seconds=31)) == [
+            running,
+            b_jobs[0],
+        ]
+        assert jobs.count() == len(by_time) + 1
+        assert jobs.count(route="b") == len(b_jobs)
+        assert jobs.count(route="a", status=JobStatus.RUNNING) == 1
+        assert jobs.count(status=JobStatus.SUCCESS) == 0
+
+        # Moving and cancelling jobs keeps the indexes in sync.
+        b_jobs[2].exec_at = now
+        await a_jobs[0].cancel()
+        assert jobs.query(route="b", limit=1) == [b_jobs[2]]
+        assert jobs.query(status=JobStatus.CANCELLED) == []
+        assert a_jobs[0] not in jobs.query(route="a")
+
+
+def test_due_index() -> None:
+    rng = random.Random(0)  # noqa: S311
+    registry = JobRegistry()
+    start = datetime(2026, 1, 1, tzinfo=ZoneInfo("UTC"))
+    for i in range(500):
+        job = Job[None](
+            job_id=str(i),
+            exec_at=start + timedelta(seconds=rng.randrange(100)),
+            pending_jobs=registry,
+            storage=ANY,
+        )
+        registry[job.id] = job
+    for _ in range(2000):
+        job = registry[str(rng.randrange(500))]
+        if rng.random() < 0.1:  # noqa: PLR2004
+            _ = registry.pop(job.id)
+            registry[job.id] = job
+        else:
+            job.exec_at = start + timedelta(seconds=rng.randrange(100))
+
+    expected = sorted(registry.values(), key=lambda job: job.exec_at)
+    assert [job.exec_at for job in registry.query()] == [
+        job.exec_at for job in expected
+    ]
+    assert len(registry._due._heap) <= 2 * len(registry) + 64
+
+
 async def test_duplicate_job_error(amock: AsyncMock) -> None:
     app = create_app()
     f = app.task(amock)
@@ -72,10 +285,173 @@ async def test_duplicate_job_error(amock: AsyncMock) -> None:
 
 async def test_job_handle_not_set() -> None:
     job = Job[None](
-        job_id=ANY,
+        job_id="test",
         exec_at=ANY,
-        pending_jobs={},
+        pending_jobs=JobRegistry(),
         job_status=JobStatus.SCHEDULED,
         storage=ANY,
     )
     job._cancel()
+
+
+async def test_job_stream() -> None:
+    app = create_app()
+    produced: list[int] = []
+
+    @app.task(func_name="numbers", stream_buffer=2)
+    async def numbers(count: int) -> AsyncIterator[int]:
+        for i in range(count):
+            produced.append(i)
+            yield i
+
+    async with app:
+        job = await numbers.schedule(5).delay(0)
+        stream = job.stream()
+        assert await anext(stream) == 0
+        await asyncio.sleep(0.01)
+        # The producer waits while the buffer of a consumer is full.
+        assert produced == [0, 1, 2, 3]
+        assert job.status is JobStatus.RUNNING
+
+        items = [item async for item in stream]
+        await job.wait()
+
+    assert items == [1, 2, 3, 4]
+    assert job.result() is None
+
+
+async def test_job_stream_without_consumer() -> None:
+    app = create_app()
+
+    @app.task(
+        func_name="numbers",
+        stream_buffer=2,
+        stream_overflow=StreamOverflow.DROP_OLDEST,
+    )
+    async def numbers(count: int) -> AsyncIterator[int]:
+        for i in range(count):
+            yield i
+
+    async with app:
+        job = await numbers.schedule(5).delay(0)
+        # Nobody reads the stream: the oldest items are dropped.
+        await asyncio.wait_for(job.wait(), timeout=1)
+        items = [item async for item in job.stream()]
+
+    assert job.status is JobStatus.SUCCESS
+    assert items == [3, 4]
+    assert job._stream is not None
+    assert job._stream.dropped == 3  # noqa: PLR2004
+
+
+async def test_job_stream_waits_for_late_consumer(tmp_path: Path) -> None:
+    app = Jobify(storage=SQLiteStorage(tmp_path / "stream.db"))
+
+    @app.task(func_name="numbers", stream_buffer=4)
+    async def numbers(count: int) -> AsyncIterator[int]:
+        for i in range(count):
+            yield i
+
+    async with app:
+        # The producer starts while `delay` still writes to the storage.
+        job = await numbers.schedule(100).delay(0)
+        await asyncio.sleep(0.01)
+        assert job.status is JobStatus.RUNNING
+        items = [item async for item in job.stream()]
+        await job.wait()
+
+    assert items == list(range(100))
+    assert job._stream is not None
+    assert job._stream.dropped == 0
+
+
+async def test_job_stream_sync_generator() -> None:
+    app = create_app()
+
+    @app.task(func_name="letters", run_mode=RunMode.THREAD)
+    def letters() -> Iterator[str]:
+        yield from "abc"
+
+    async with app:
+        job = await letters.schedule().delay(0)
+        items = [item async for item in job.stream()]
+
+    assert items == ["a", "b", "c"]
+
+
+async def test_job_stream_sync_generator_timeout() -> None:
+    app = create_app()
+    closed = threading.Event()
+
+    @app.task(func_name="slow", run_mode=RunMode.THREAD, timeout=0.01)
+    def slow() -> Iterator[str]:
+        try:
+            time.sleep(0.05)
+            yield "a"
+        finally:
+            closed.set()
+
+    async with app:
+        job = await slow.schedule().delay(0)
+        await job.wait()
+
+    # Closed once the step cut by the timeout is over.
+    assert job.status is JobStatus.TIMEOUT
+    assert closed.is_set()
+
+
+async def test_job_stream_failed() -> None:
+    app = create_app()
+
+    @app.task(func_name="broken")
+    async def broken() -> AsyncIterator[int]:
+        yield 1
+        raise ValueError
+
+    async with app:
+        job = await broken.schedule().delay(0)
+        stream = job.stream()
+        assert await anext(stream) == 1
+        with pytest.raises(JobFailedError):
+            _ = await anext(stream)
+
+    assert job.status is JobStatus.FAILED
+
+
+async def test_job_stream_wrong_usage(amock: AsyncMock) -> None:
+    app = create_app()
+    f = app.task(amock, func_name="f")
+
+    def gen() -> Iterator[int]:
+        yield 1
+
+    match = "Generator functions can only stream from RunMode.THREAD"
+    with pytest.raises(ValueError, match=match):
+        _ = app.task(gen, run_mode=RunMode.PROCESS)
+
+    async with app:
+        job = await f.schedule().delay(0)
+        with pytest.raises(TypeError, match="does not produce a stream"):
+            _ = [item async for item in job.stream()]
+
+
+async def test_job_cancel_running() -> None:
+    app = create_app()
+    started = asyncio.Event()
+
+    @app.task(func_name="slow")
+    async def slow() -> None:
+        started.set()
+        await asyncio.sleep(60)
+
+    async with app:
+        job = await slow.schedule().delay(0)
+        _ = await started.wait()
+        await job.cancel()
+        await asyncio.wait_for(job.wait(), timeout=1)
+        await asyncio.sleep(0)
+
+        assert job.status is JobStatus.CANCELLED
+        assert job._task is not None
+        assert job._task.cancelled()
+        assert not app.task._shared_state.pending_tasks
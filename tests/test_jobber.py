@@ -1,9 +1,15 @@
+import asyncio
+import threading
+import time
 from unittest.mock import Mock
 
-from jobify import Jobify
+import pytest
+
+from jobify import Jobify, JobStatus, ShutdownReport
 from jobify._internal.typeadapter.dummy import DummyDumper, DummyLoader
 from jobify.serializers import ExtendedJSONSerializer, JSONSerializer
 from jobify.storage import SQLiteStorage
+from tests.conftest import create_app
 
 
 def test_app_setup() -> None:
@@ -19,3 +25,132 @@ def test_app_setup() -> None:
     assert isinstance(app.configs.serializer, JSONSerializer)
     assert isinstance(app.configs.dumper, Mock)
     assert isinstance(app.configs.loader, Mock)
+
+
+async def test_shutdown_drain() -> None:
+    app = create_app()
+    calls: list[str] = []
+
+    @app.task
+    async def work(name: str, seconds: float) -> str:
+        calls.append(name)
+        await asyncio.sleep(seconds)
+        return name
+
+    await app.startup()
+    quick = await work.schedule("quick", 0.01).delay(0)
+    stuck = await work.schedule("stuck", 10).delay(0)
+    later = await work.schedule("later", 0).delay(0.05)
+    await asyncio.sleep(0.005)
+
+    report = await app.shutdown(drain_timeout=0.1)
+
+    assert report == ShutdownReport(drained=1, cancelled=1)
+    assert calls == ["quick", "stuck"]
+    assert quick.result() == "quick"
+    assert stuck.status is not JobStatus.SUCCESS
+    assert later.is_done()
+    assert not app.task._shared_state.pending_jobs
+
+
+async def test_shutdown_without_drain() -> None:
+    app = Jobify(storage=False, drain_timeout=0.1)
+
+    @app.task
+    async def work() -> None:
+        await asyncio.sleep(10)
+
+    await app.startup()
+    _ = await work.schedule().delay(0)
+    await asyncio.sleep(0.005)
+    report = await app.shutdown(drain_timeout=0)
+
+    assert report == ShutdownReport(drained=0, cancelled=1)
+
+
+async def test_sharded_app() -> None:
+    app = Jobify(storage=False, shards=3)
+
+    @app.task
+    async def where(n: int) -> str:
+        await asyncio.sleep(0)
+        return f"{n}:{threading.current_thread().name}"
+
+    @app.task
+    async def spawn(n: int) -> str:
+        # Scheduled from the thread of a shard.
+        job = await where.schedule(n).delay(0)
+        await job.wait()
+        return job.result()
+
+    @app.task
+    async def sleeper() -> None:
+        await asyncio.sleep(10)
+
+    async with app:
+        jobs = [await where.schedule(n).delay(0) for n in range(30)]
+        spawned = await spawn.schedule(30).delay(0, job_id="spawn")
+        sleeping = [await sleeper.schedule().delay(5) for _ in range(6)]
+        assert app.jobs.count(route=sleeper.name) == len(sleeping)
+
+        for job in sleeping:
+            assert app.find_job(job.id) is job
+            await job.cancel()
+            assert job.status is JobStatus.CANCELLED
+        await app.wait_all(timeout=5)
+
+        threads = {job.result().split(":")[1] for job in jobs}
+        assert len(threads) == len(app.configs.shards or ())
+        assert spawned.result().startswith("30:")
+        assert app.find_job("spawn") is None
+        assert not app.jobs
+        succeeded = f'jobify_jobs_succeeded_total{{route="{where.name}"}} 31'
+        assert succeeded in app.metrics()
+
+
+async def test_sharded_shutdown() -> None:
+    app = Jobify(storage=False, shards=2)
+
+    @app.task
+    async def work(seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+    await app.startup()
+    for _ in range(4):
+        _ = await work.schedule(0.01).delay(0)
+    stuck = [await work.schedule(10).delay(0) for _ in range(4)]
+    await asyncio.sleep(0.005)
+    report = await app.shutdown(drain_timeout=0.2)
+
+    assert report == ShutdownReport(drained=4, cancelled=4)
+    assert all(job.is_done() for job in stuck)
+    assert not app.jobs
+
+
+async def test_shards_do_not_block_loop() -> None:
+    app = Jobify(storage=False, shards=2)
+    shards = app.configs.shards
+    assert shards is not None
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    try:
+        await shards.start()
+        # The shard is busy, so joining its thread takes a while.
+        _ = shards.loops[1].call_soon_threadsafe(time.sleep, 0.2)
+        ticks = 0
+        await shards.stop()
+        assert ticks > 1
+    finally:
+        _ = ticker.cancel()
+
+
+def test_shards_config() -> None:
+    with pytest.raises(ValueError, match=r"shards must be >= 1\."):
+        _ = Jobify(storage=False, shards=0)
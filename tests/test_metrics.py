@@ -0,0 +1,102 @@
+import asyncio
+from unittest import mock
+
+from jobify import CircuitBreaker, ResultCache
+from jobify._internal.metrics import Histogram
+from tests.conftest import create_app
+
+
+def test_histogram() -> None:
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.sum == 5.65  # noqa: PLR2004
+
+
+async def test_metrics(amock: mock.AsyncMock) -> None:
+    app = create_app()
+    ok = app.task(amock, func_name="ok")
+
+    @app.task(func_name="slow", timeout=0.01)
+    async def slow() -> None:
+        await asyncio.sleep(1)
+
+    @app.task(func_name="broken")
+    async def broken() -> None:
+        raise ValueError
+
+    async with app:
+        for _ in range(3):
+            _ = await ok.schedule().delay(0)
+        _ = await slow.schedule().delay(0)
+        _ = await broken.schedule().delay(0)
+        await app.wait_all()
+        _ = await ok.schedule().delay(60)
+
+        metrics = app.task._shared_state.metrics.routes
+        assert metrics["ok"].scheduled == 4  # noqa: PLR2004
+        assert metrics["ok"].started == 3  # noqa: PLR2004
+        assert metrics["ok"].succeeded == 3  # noqa: PLR2004
+        assert metrics["slow"].timed_out == 1
+        assert metrics["broken"].failed == 1
+        assert sum(metrics["ok"].duration.counts) == 3  # noqa: PLR2004
+        assert sum(metrics["ok"].lateness.counts) == 3  # noqa: PLR2004
+        assert all(m.in_flight == 0 for m in metrics.values())
+
+        text = app.metrics()
+
+    assert text.endswith("# EOF\n")
+    assert "# TYPE jobify_jobs_succeeded counter" in text
+    assert 'jobify_jobs_scheduled_total{route="ok"} 4' in text
+    assert 'jobify_jobs_succeeded_total{route="ok"} 3' in text
+    assert 'jobify_jobs_timed_out_total{route="slow"} 1' in text
+    assert 'jobify_jobs_failed_total{route="broken"} 1' in text
+    assert 'jobify_job_duration_seconds_bucket{route="ok",le="+Inf"} 3' in text
+    assert 'jobify_job_lateness_seconds_count{route="ok"} 3' in text
+    assert 'jobify_jobs_in_flight{route="ok"} 0' in text
+    assert 'jobify_jobs_pending{route="ok"} 1' in text
+    assert "jobify_circuit_state" not in text
+
+
+async def test_metrics_started_skips_middleware_outcomes() -> None:
+    app = create_app()
+    breaker = CircuitBreaker(1, recovery_timeout=60)
+
+    @app.task(func_name="cached", cache=ResultCache(maxsize=1))
+    async def cached(num: int) -> int:
+        return num
+
+    @app.task(func_name="down", circuit_breaker=breaker)
+    async def down() -> None:
+        raise ValueError
+
+    async with app:
+        for _ in range(3):
+            job = await cached.schedule(1).delay(0)
+            await job.wait()
+        for _ in range(2):
+            _ = await down.schedule().delay(0)
+            await asyncio.sleep(0.01)
+
+        # Cache hits and deferrals by the open circuit do not run the job.
+        metrics = app.task._shared_state.metrics.routes
+        assert metrics["cached"].started == 1
+        assert sum(metrics["cached"].lateness.counts) == 1
+        assert metrics["down"].started == 1
+        assert metrics["down"].rescheduled == 1
+        assert sum(metrics["down"].lateness.counts) == 1
+
+
+async def test_metrics_circuit_breaker(amock: mock.AsyncMock) -> None:
+    app = create_app()
+    _ = app.task(amock, func_name="f", circuit_breaker=CircuitBreaker(1))
+    async with app:
+        text = app.metrics()
+
+    assert (
+        'jobify_circuit_state{route="f",jobify_circuit_state="closed"} 1'
+        in text
+    )
+    assert 'jobify_circuit_transitions_total{route="f",to="open"} 0' in text
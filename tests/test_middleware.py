@@ -3,9 +3,18 @@ from typing import Any
 from unittest import mock
 from unittest.mock import call
 
+import pytest
 from typing_extensions import override
 
-from jobify import JobContext, JobStatus
+from jobify import (
+    INJECT,
+    CircuitBreaker,
+    JobContext,
+    JobStatus,
+    ResultCache,
+    RetryPolicy,
+)
+from jobify._internal.common.constants import CircuitState
 from jobify.middleware import BaseMiddleware, CallNext
 from tests.conftest import create_app
 
@@ -75,12 +84,275 @@ async def test_retry(
 
     retry = 3
     app = create_app()
-    f = app.task(amock, retry=retry)
+    f = app.task(amock, retry=RetryPolicy(retry, backoff_base=0))
     async with app:
         job = await f.schedule().delay(0)
         await job.wait()
 
     amock.assert_has_awaits([call()] * (retry + 1))
-    sleep_mock.assert_has_awaits(
-        mock.call(min(2**attempt, 60)) for attempt in range(retry)
-    )
+    # Retries are rescheduled instead of sleeping inside the job.
+    sleep_mock.assert_not_awaited()
+    assert job.status is JobStatus.FAILED
+    assert job.attempt == retry
+    assert type(job.exception) is ValueError
+
+
+async def test_retry_rescheduled(amock: mock.AsyncMock) -> None:
+    amock.side_effect = [ValueError, "ok"]
+    app = create_app()
+    f = app.task(amock, retry=RetryPolicy(1, backoff_base=0.05))
+    async with app:
+        job = await f.schedule().delay(0)
+        await asyncio.sleep(0.01)
+        assert job.status is JobStatus.SCHEDULED
+        assert not job.is_done()
+        assert job.attempt == 1
+
+        await job.wait()
+        assert job.result() == "ok"
+
+
+async def test_retry_on(amock: mock.AsyncMock) -> None:
+    amock.side_effect = KeyError
+    app = create_app()
+    policy = RetryPolicy(3, backoff_base=0, retry_on=(ValueError,))
+    f = app.task(amock, retry=policy)
+    async with app:
+        job = await f.schedule().delay(0)
+        await job.wait()
+
+    amock.assert_awaited_once()
+    assert job.attempt == 0
+    assert job.status is JobStatus.FAILED
+
+
+def test_retry_policy() -> None:
+    policy = RetryPolicy(5, backoff_base=2, backoff_cap=10)
+    assert [policy.delay(n) for n in range(1, 5)] == [2, 4, 8, 10]
+    assert policy.should_retry(ValueError(), 4)
+    assert not policy.should_retry(ValueError(), 5)
+
+    jittered = RetryPolicy(1, backoff_base=8, jitter=0.5)
+    assert all(4 <= jittered.delay(1) <= 8 for _ in range(100))  # noqa: PLR2004
+
+    with pytest.raises(ValueError, match="max_retries must be >= 0"):
+        _ = RetryPolicy(-1)
+    with pytest.raises(ValueError, match="jitter must be between 0 and 1"):
+        _ = RetryPolicy(1, jitter=2)
+
+
+async def test_route_chains(amock: mock.AsyncMock) -> None:
+    app = create_app()
+    _ = app.task(amock, func_name="plain")
+    _ = app.task(amock, func_name="same")
+    _ = app.task(amock, func_name="limited", retry=1, timeout=1)
+
+    async with app:
+        registrator = app.task
+        plain = registrator._routes["plain"]
+        same = registrator._routes["same"]
+        limited = registrator._routes["limited"]
+        assert registrator.system_middleware(plain) == []
+        assert registrator.system_middleware(limited) == [
+            registrator._retry_middleware,
+            registrator._timeout_middleware,
+        ]
+        assert plain._chain_middleware is same._chain_middleware
+        assert plain._chain_middleware is not limited._chain_middleware
+
+
+async def test_exception_handler_cache() -> None:
+    app = create_app()
+    handler = mock.Mock()
+    app.add_exception_handler(LookupError, handler)
+
+    @app.task
+    async def f() -> None:
+        raise KeyError
+
+    async with app:
+        job1 = await f.schedule().delay(0)
+        job2 = await f.schedule().delay(0)
+        await app.wait_all()
+
+    assert handler.call_args_list == [
+        call(job1.exception, mock.ANY),
+        call(job2.exception, mock.ANY),
+    ]
+    exc_middleware = app.task._exc_middleware
+    assert exc_middleware._handlers_cache == {KeyError: handler}
+
+    app.add_exception_handler(KeyError, mock.Mock())
+    assert exc_middleware._handlers_cache == {}
+
+
+async def test_circuit_breaker(amock: mock.AsyncMock) -> None:
+    amock.side_effect = [ValueError, ValueError, "ok", "ok"]
+    app = create_app()
+    breaker = CircuitBreaker(2, recovery_timeout=0.05)
+    f = app.task(amock, func_name="flaky", circuit_breaker=breaker)
+    async with app:
+        circuit = app.task._breakers["flaky"]
+        for _ in range(2):
+            job = await f.schedule().delay(0)
+            await job.wait()
+            assert job.status is JobStatus.FAILED
+        assert circuit.transitions[CircuitState.OPEN] == 1
+
+        # Deferred without running while the circuit is open.
+        job = await f.schedule().delay(0)
+        await asyncio.sleep(0.01)
+        assert job.status is JobStatus.SCHEDULED
+        assert amock.await_count == 2  # noqa: PLR2004
+        assert circuit.deferred == 1
+
+        # The deferred job is the trial run that closes the circuit.
+        await job.wait()
+        assert job.result() == "ok"
+        assert circuit.state is CircuitState.CLOSED
+
+        job = await f.schedule().delay(0)
+        await job.wait()
+        assert job.result() == "ok"
+
+    assert circuit.transitions == {
+        CircuitState.OPEN: 1,
+        CircuitState.HALF_OPEN: 1,
+        CircuitState.CLOSED: 1,
+    }
+
+
+async def test_circuit_breaker_trial_failure(amock: mock.AsyncMock) -> None:
+    amock.side_effect = ValueError
+    app = create_app()
+    breaker = CircuitBreaker(1, recovery_timeout=0.01)
+    f = app.task(amock, func_name="down", circuit_breaker=breaker)
+    async with app:
+        circuit = app.task._breakers["down"]
+        job = await f.schedule().delay(0)
+        await job.wait()
+        assert circuit.state is CircuitState.OPEN
+
+        await asyncio.sleep(0.02)
+        job = await f.schedule().delay(0)
+        await job.wait()
+        assert job.status is JobStatus.FAILED
+        assert circuit.state is CircuitState.OPEN
+        assert circuit.transitions[CircuitState.OPEN] == 2  # noqa: PLR2004
+
+
+async def test_circuit_breaker_cancelled_trial() -> None:
+    app = create_app()
+    breaker = CircuitBreaker(1, recovery_timeout=0.01)
+    calls: list[str] = []
+
+    @app.task(func_name="trial", circuit_breaker=breaker)
+    async def trial(mode: str) -> str:
+        calls.append(mode)
+        if mode == "fail":
+            raise ValueError
+        if mode == "hang":
+            await asyncio.sleep(10)
+        return mode
+
+    async with app:
+        circuit = app.task._breakers["trial"]
+        job = await trial.schedule("fail").delay(0)
+        await job.wait()
+        assert circuit.state is CircuitState.OPEN
+
+        await asyncio.sleep(0.02)
+        hanging = await trial.schedule("hang").delay(0)
+        await asyncio.sleep(0.01)
+        assert circuit.transitions[CircuitState.HALF_OPEN] == 1
+        await hanging.cancel()
+
+        # The cancelled trial gives its slot back to the next job.
+        job = await trial.schedule("ok").delay(0)
+        await asyncio.wait_for(job.wait(), timeout=1)
+        assert job.result() == "ok"
+        assert circuit.transitions[CircuitState.CLOSED] == 1
+        assert circuit.deferred == 0
+
+    assert calls == ["fail", "hang", "ok"]
+
+
+async def test_cache() -> None:
+    app = create_app()
+    calls: list[int] = []
+
+    @app.task(func_name="square", cache=ResultCache(maxsize=2))
+    async def square(num: int, context: JobContext = INJECT) -> int:
+        assert context.job.func_name == "square"
+        calls.append(num)
+        return num * num
+
+    async with app:
+        for num in (2, 3, 2, 4, 2):
+            job = await square.schedule(num).delay(0)
+            await job.wait()
+            assert job.result() == num * num
+
+        # 3 is the least recently used result when 4 is stored.
+        job = await square.schedule(num=3).delay(0)
+        await job.wait()
+
+        cache = app.task._caches["square"]
+        assert calls == [2, 3, 4, 3]
+        assert (cache.hits, cache.misses, cache.evictions) == (2, 4, 2)
+        assert cache.size == 2  # noqa: PLR2004
+        assert cache.hit_rate == pytest.approx(1 / 3)
+        text = app.metrics()
+
+    assert 'jobify_cache_hits_total{route="square"} 2' in text
+    assert 'jobify_cache_evictions_total{route="square"} 2' in text
+    assert 'jobify_cache_size{route="square"} 2' in text
+
+
+async def test_cache_ttl_and_key(amock: mock.AsyncMock) -> None:
+    app = create_app()
+    config = ResultCache(ttl=0.05, key=lambda arguments: arguments["user"])
+
+    @app.task(func_name="f", cache=config)
+    async def f(user: Any, request_id: int) -> Any:  # noqa: ANN401
+        return await amock(user, request_id)
+
+    amock.side_effect = lambda user, _: user
+    async with app:
+        for request_id in (1, 2):
+            job = await f.schedule("a", request_id).delay(0)
+            await job.wait()
+            assert job.result() == "a"
+        assert amock.await_count == 1
+
+        await asyncio.sleep(0.06)
+        job = await f.schedule("a", 3).delay(0)
+        await job.wait()
+        assert amock.await_count == 2  # noqa: PLR2004
+
+        # Failures are not cached and unhashable keys are not looked up.
+        amock.side_effect = ValueError
+        job = await f.schedule("b", 4).delay(0)
+        await job.wait()
+        assert job.status is JobStatus.FAILED
+        amock.side_effect = None
+        amock.return_value = "ok"
+        job = await f.schedule(["c"], 5).delay(0)
+        await job.wait()
+        assert job.result() == "ok"
+        assert amock.await_count == 4  # noqa: PLR2004
+
+
+def test_cache_config() -> None:
+    with pytest.raises(ValueError, match="ttl must be > 0"):
+        _ = ResultCache(ttl=0)
+    with pytest.raises(ValueError, match="maxsize must be >= 1"):
+        _ = ResultCache(maxsize=0)
+
+    app = create_app()
+
+    async def gen() -> Any:  # noqa: ANN401
+        yield 1
+
+    with pytest.raises(ValueError, match="cannot be cached"):
+        _ = app.task(gen, cache=ResultCache())
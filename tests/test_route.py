@@ -1,9 +1,16 @@
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from typing import Any
 
 import pytest
 
+from jobify import Jobify, RunMode, StreamOverflow
+from jobify._internal.inspection import make_func_spec
 from jobify._internal.router.base import resolve_name
-from jobify.exceptions import RouteAlreadyRegisteredError
+from jobify.exceptions import (
+    ApplicationStateError,
+    RouteAlreadyRegisteredError,
+)
+from jobify.storage import SQLiteStorage
 from tests.conftest import create_app
 
 
@@ -51,7 +58,7 @@ async def test_original_func_call() -> None:
 def test_patch_job_name() -> None:
     app = create_app()
 
-    @app.task
+    @app.task(run_mode=RunMode.PROCESS)
     def t() -> None:
         pass
 
@@ -76,3 +83,83 @@ def test_patch_job_name() -> None:
     assert t1_reg is not t
     assert t2_reg is not t
     assert t1_reg is not t2_reg
+
+
+def test_patch_job_name_thread() -> None:
+    app = create_app()
+
+    # Run in this process, so it is never pickled.
+    @app.task
+    def t() -> None:
+        pass
+
+    assert t.func.__name__ == "t"
+    assert t.name.endswith(":t")
+
+
+def _positional(a: int, b: str = "b", c: float = 1.0) -> None:
+    pass
+
+
+def _keyword(a: int, *args: int, d: int, **kwargs: int) -> None:
+    pass
+
+
+@pytest.mark.parametrize(
+    ("func", "args", "kwargs"),
+    [
+        (_positional, (1,), {}),
+        (_positional, (1, "x", 2.0), {}),
+        (_positional, (1,), {"c": 3.0}),
+        (_keyword, (1, 2, 3), {"d": 4, "e": 5}),
+    ],
+)
+def test_func_spec_bind(
+    func: Callable[..., None],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> None:
+    func_spec = make_func_spec(func)
+    expected = func_spec.signature.bind(*args, **kwargs)
+
+    bound = func_spec.bind(*args, **kwargs)
+
+    assert bound.arguments == expected.arguments
+    assert (bound.args, bound.kwargs) == (expected.args, expected.kwargs)
+
+
+def test_func_spec_bind_errors() -> None:
+    func_spec = make_func_spec(_positional)
+    assert func_spec.positional == ("a", "b", "c")
+    assert func_spec.required == 1
+
+    with pytest.raises(TypeError, match="missing a required argument"):
+        _ = func_spec.bind()
+    with pytest.raises(TypeError, match="too many positional arguments"):
+        _ = func_spec.bind(1, "x", 2.0, 3)
+
+
+async def test_route_schedule() -> None:
+    app = Jobify(storage=SQLiteStorage(":memory:"))
+    durable = app.task(_positional, func_name="durable")
+    transient = app.task(_keyword, func_name="transient", durable=False)
+
+    @app.task(func_name="ticks", cron="0 0 1 1 *", durable=False)
+    async def ticks() -> AsyncIterator[int]:
+        yield 1
+
+    async with app:
+        schedule = durable.schedule(1)._route
+        # Shared by every job of the route.
+        assert durable.schedule(2)._route is schedule
+        assert schedule.persist is True
+        assert schedule.stream_buffer is None
+        assert schedule.stream_overflow is StreamOverflow.WAIT
+        # Nobody can read the stream of a cron fire before it starts.
+        cron_schedule = ticks.schedule()._route
+        assert cron_schedule.stream_overflow is StreamOverflow.DROP_OLDEST
+        assert schedule.dump_arguments is False
+        assert transient.schedule(1, d=1)._route.persist is False
+
+    with pytest.raises(ApplicationStateError, match="is not started"):
+        _ = durable.schedule(1)
@@ -1,9 +1,14 @@
 import asyncio
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 import pytest
 
-from jobify import Cron, Jobify, JobRouter, RunMode
+from jobify import Cron, Jobify, JobRouter, JobStatus, RunMode
 from jobify._internal.router.base import Router
 from tests.conftest import create_app
 
@@ -22,12 +27,32 @@ async def f2(num: int) -> int:
     return num + 1
 
 
+def setup_worker() -> None:
+    os.environ["JOBIFY_TEST_WORKER"] = "ready"
+
+
+def worker_env() -> str | None:
+    return os.environ.get("JOBIFY_TEST_WORKER")
+
+
+def sleeper(seconds: float) -> None:
+    time.sleep(seconds)
+
+
 @pytest.mark.parametrize(
     "run_mode",
     [
         pytest.param(RunMode.MAIN, id="main"),
         pytest.param(RunMode.THREAD, id="thread"),
         pytest.param(RunMode.PROCESS, id="process"),
+        pytest.param(
+            RunMode.INTERPRETER,
+            id="interpreter",
+            marks=pytest.mark.skipif(
+                sys.version_info < (3, 14),
+                reason="InterpreterPoolExecutor requires Python 3.14",
+            ),
+        ),
     ],
 )
 @pytest.mark.parametrize(
@@ -78,3 +103,178 @@ async def test_jobify(  # noqa: PLR0913
     assert job_async.result() == expected
     assert app.task._shared_state.pending_jobs == {}
     assert app.task._shared_state.pending_tasks == set()
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 14),
+    reason="InterpreterPoolExecutor is available",
+)
+def test_interpreter_mode_unsupported() -> None:
+    app = create_app()
+    match = "RunMode.INTERPRETER requires Python 3.14 or newer."
+    with pytest.raises(RuntimeError, match=match):
+        _ = app.task(f1, run_mode=RunMode.INTERPRETER)
+
+
+async def test_processpool_warmup() -> None:
+    app = Jobify(storage=False, processpool_initializer=setup_worker)
+    task = app.task(worker_env, run_mode=RunMode.PROCESS)
+    async with app:
+        pools = app.configs.worker_pools
+        assert pools.preload_modules == (__name__,)
+        assert pools._processpool is not None
+        assert pools._processpool._processes  # spawned before the first job
+
+        job = await task.schedule().delay(0)
+        await job.wait()
+
+    assert job.result() == "ready"
+    assert pools._processpool is None
+
+
+async def test_processpool_recycle_by_rss() -> None:
+    app = Jobify(storage=False, processpool_max_worker_rss=1)
+    task = app.task(f1, func_name="f1_rss", run_mode=RunMode.PROCESS)
+    async with app:
+        pools = app.configs.worker_pools
+        first_pool = pools._processpool
+        jobs = [await task.schedule(num).delay(0) for num in range(3)]
+        await app.wait_all()
+
+        assert [job.result() for job in jobs] == [1, 2, 3]
+        assert pools.process_tasks == len(jobs)
+        assert pools.processpool_recycles >= 1
+        assert pools._processpool is not first_pool
+
+
+async def test_processpool_recycle_custom_executor() -> None:
+    executor = ProcessPoolExecutor(
+        max_workers=2,
+        mp_context=multiprocessing.get_context("forkserver"),
+        initializer=setup_worker,
+    )
+    app = Jobify(
+        storage=False,
+        processpool_executor=executor,
+        processpool_max_worker_rss=1,
+    )
+    task = app.task(worker_env, func_name="env_rss", run_mode=RunMode.PROCESS)
+    async with app:
+        pools = app.configs.worker_pools
+        job = await task.schedule().delay(0)
+        await job.wait()
+        new_pool = pools.processpool
+
+        # The replacement keeps the settings of the custom executor.
+        assert pools.processpool_recycles == 1
+        assert new_pool is not executor
+        assert getattr(new_pool, "_max_workers", None) == 2  # noqa: PLR2004
+        assert new_pool._mp_context is executor._mp_context
+        job = await task.schedule().delay(0)
+        await job.wait()
+        assert job.result() == "ready"
+        text = app.metrics()
+
+    assert "jobify_processpool_recycles_total 2" in text
+    assert "jobify_process_tasks_total 2" in text
+
+
+def test_processpool_recycle_unknown_executor() -> None:
+    class Executor(ProcessPoolExecutor):
+        pass
+
+    match = "cannot recycle an executor of type"
+    with pytest.raises(ValueError, match=match):
+        _ = Jobify(
+            storage=False,
+            processpool_executor=Executor(max_workers=1),
+            processpool_max_worker_rss=1,
+        )
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 11),
+    reason="max_tasks_per_child requires Python 3.11",
+)
+async def test_processpool_max_tasks_per_child() -> None:
+    app = Jobify(storage=False, processpool_max_tasks_per_child=2)
+    task = app.task(f1, func_name="f1_tasks", run_mode=RunMode.PROCESS)
+    async with app:
+        for num in range(4):
+            job = await task.schedule(num).delay(0)
+            await job.wait()
+            assert job.result() == num + 1
+
+        pools = app.configs.worker_pools
+        assert pools.worker_recycles >= 1
+        assert pools.processpool_recycles == 0
+
+
+async def test_processpool_terminates_timed_out_job() -> None:
+    app = Jobify(storage=False)
+    slow = app.task(sleeper, timeout=0.5, run_mode=RunMode.PROCESS)
+    fast = app.task(f1, func_name="f1_after", run_mode=RunMode.PROCESS)
+    async with app:
+        pools = app.configs.worker_pools
+        first_pool = pools._processpool
+        assert first_pool is not None
+        assert first_pool._processes
+        workers = tuple(first_pool._processes.values())
+
+        job = await slow.schedule(60).delay(0)
+        await job.wait()
+        assert job.status is JobStatus.TIMEOUT
+        assert pools.process_terminations == 1
+        assert pools._processpool is not first_pool
+        assert not pools._abandoned
+        for worker in workers:
+            worker.join(5)
+            assert not worker.is_alive()
+
+        # The new pool does not wait for the abandoned call.
+        job = await fast.schedule(1).delay(0)
+        await asyncio.wait_for(job.wait(), timeout=30)
+        assert job.result() == 2  # noqa: PLR2004
+
+
+async def test_processpool_terminates_timed_out_job_custom_executor() -> None:
+    executor = ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("forkserver"),
+        initializer=setup_worker,
+    )
+    app = Jobify(storage=False, processpool_executor=executor)
+    slow = app.task(sleeper, timeout=0.5, run_mode=RunMode.PROCESS)
+    env = app.task(worker_env, func_name="env_after", run_mode=RunMode.PROCESS)
+    async with app:
+        pools = app.configs.worker_pools
+        job = await slow.schedule(60).delay(0)
+        await job.wait()
+        assert job.status is JobStatus.TIMEOUT
+        assert pools.process_terminations == 1
+
+        # The replacement keeps the settings of the custom executor.
+        new_pool = pools.processpool
+        assert new_pool is not executor
+        assert getattr(new_pool, "_max_workers", None) == 1
+        job = await env.schedule().delay(0)
+        await asyncio.wait_for(job.wait(), timeout=30)
+        assert job.result() == "ready"
+
+
+async def test_processpool_keeps_unknown_executor() -> None:
+    class Executor(ProcessPoolExecutor):
+        pass
+
+    executor = Executor(max_workers=1)
+    app = Jobify(storage=False, processpool_executor=executor)
+    slow = app.task(sleeper, timeout=0.1, run_mode=RunMode.PROCESS)
+    async with app:
+        pools = app.configs.worker_pools
+        job = await slow.schedule(0.5).delay(0)
+        await job.wait()
+
+        # Its settings cannot be copied, so the executor is not replaced.
+        assert job.status is JobStatus.TIMEOUT
+        assert pools.process_terminations == 0
+        assert pools.processpool is executor
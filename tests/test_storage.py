@@ -1,16 +1,28 @@
 import asyncio
-from collections.abc import Iterator
+import functools
+import sqlite3
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, call
 
 import pytest
 
-from jobify import Cron, Job, Jobify, JobStatus
+from jobify import (
+    INJECT,
+    Cron,
+    Job,
+    JobContext,
+    Jobify,
+    JobStatus,
+    RetryPolicy,
+)
 from jobify._internal.cron_parser import CronParser
 from jobify._internal.message import Message
-from jobify._internal.storage.abc import ScheduledJob
+from jobify._internal.storage.abc import ScheduledJob, Storage
 from jobify._internal.storage.sqlite import SQLiteStorage
+from jobify.jobify import _DecodedJob
 from jobify.serializers import ExtendedJSONSerializer
 from tests.conftest import create_cron_factory, cron_next_run
 
@@ -95,12 +107,14 @@ async def test_sqlite_with_jobify(now: datetime) -> None:
             func_name=f1.name,
             message=raw_msg1,
             status=JobStatus.SCHEDULED,
+            exec_at=job1.exec_at.timestamp(),
         )
         cron_scheduled = ScheduledJob(
             job_id=job1_cron.id,
             func_name=f1.name,
             message=raw_msg2,
             status=JobStatus.SCHEDULED,
+            exec_at=job1_cron.exec_at.timestamp(),
         )
         assert await app.configs.storage.get_schedules() == [
             at_scheduled,
@@ -222,6 +236,15 @@ async def test_restore_schedules_invalid_jobs() -> None:
         invalid_argument_job,
     ]
     mock_storage.delete_schedule = AsyncMock()
+    # The default paging and batch delete of the storage interface.
+    mock_storage.iter_schedules = functools.partial(
+        Storage.iter_schedules,
+        mock_storage,
+    )
+    mock_storage.delete_schedules = functools.partial(
+        Storage.delete_schedules,
+        mock_storage,
+    )
 
     app = Jobify(storage=mock_storage)
 
@@ -237,3 +260,353 @@ async def test_restore_schedules_invalid_jobs() -> None:
             call("job_unexpected_arguments"),
         ],
     )
+
+
+async def test_restore_retry_attempt(storage: SQLiteStorage) -> None:
+    calls: list[int] = []
+
+    async def _f(num: int) -> int:
+        calls.append(num)
+        if len(calls) == 1:
+            raise ValueError
+        return num
+
+    app = Jobify(storage=storage)
+    _ = app.task(_f, func_name="retried", retry=RetryPolicy(3))
+    async with app:
+        job = await app.task._routes["retried"].schedule(7).delay(0)
+        await asyncio.sleep(0.01)
+        assert job.status is JobStatus.SCHEDULED
+
+        (scheduled,) = await storage.get_schedules()
+        raw = app.configs.serializer.loadb(scheduled.message)
+        msg = app.configs.loader.load(raw, Message)
+        assert msg.attempt == 1
+        assert msg.arguments == {"num": 7}
+
+    app2 = Jobify(storage=storage)
+    _ = app2.task(_f, func_name="retried", retry=RetryPolicy(3))
+    async with app2:
+        restored: Job[int] | None = app2.find_job(job.id)
+        assert restored is not None
+        assert restored.attempt == 1
+        await restored.wait()
+        assert restored.result() == 7  # noqa: PLR2004
+
+
+async def test_restore_cron_retry_attempt(storage: SQLiteStorage) -> None:
+    calls: list[int] = []
+
+    async def _tick() -> int:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise ValueError
+        return len(calls)
+
+    def create(app: Jobify) -> None:
+        _ = app.task(
+            _tick, func_name="tick", retry=RetryPolicy(3, backoff_base=0.5)
+        )
+
+    def stored_message(app: Jobify, scheduled: ScheduledJob) -> Message:
+        raw = app.configs.serializer.loadb(scheduled.message)
+        return app.configs.loader.load(raw, Message)
+
+    app = Jobify(storage=storage)
+    create(app)
+    async with app:
+        route = app.task._routes["tick"]
+        job = await route.schedule().cron("* * * * * * *", job_id="tick")
+        for _ in range(120):
+            if job.attempt:
+                break
+            await asyncio.sleep(0.01)
+        assert job.attempt == 1
+        retry_at = job.exec_at
+
+        (scheduled,) = await storage.get_schedules()
+        msg = stored_message(app, scheduled)
+        assert msg.attempt == 1
+        assert msg.trigger.get("at") == retry_at
+        assert scheduled.exec_at == retry_at.timestamp()
+
+    app2 = Jobify(storage=storage)
+    create(app2)
+    async with app2:
+        restored: Job[int] | None = app2.find_job("tick")
+        assert restored is not None
+        assert restored.attempt == 1
+        assert restored.exec_at == retry_at
+        await restored.wait()
+        assert restored.result() == 2  # noqa: PLR2004
+
+        # Once the retry is over, the stored message is a plain cron again.
+        (scheduled,) = await storage.get_schedules()
+        msg = stored_message(app2, scheduled)
+        assert msg.attempt == 0
+        assert "at" not in msg.trigger
+
+
+@dataclass
+class Invoice:
+    number: int
+
+
+async def test_restore_lazy_route(storage: SQLiteStorage) -> None:
+    async def _send(invoice: Invoice) -> int:
+        return invoice.number
+
+    app = Jobify(storage=storage)
+    _ = app.task(_send, func_name="send")
+    async with app:
+        route = app.task._routes["send"]
+        assert route._func_spec is None
+        job = await route.schedule(Invoice(5)).delay(60)
+
+    app2 = Jobify(storage=storage)
+    _ = app2.task(_send, func_name="send")
+    _ = app2.task(_send, func_name="unused")
+    assert isinstance(app2.configs.serializer, ExtendedJSONSerializer)
+    assert "Invoice" not in app2.configs.serializer.registry
+    async with app2:
+        # Only the route of the stored job is inspected, before decoding.
+        assert app2.task._routes["unused"]._func_spec is None
+        restored: Job[int] | None = app2.find_job(job.id)
+        assert restored is not None
+        assert restored.exec_at == job.exec_at
+
+
+async def test_restore_uninspectable_route(storage: SQLiteStorage) -> None:
+    async def _f(num: int) -> int:
+        return num
+
+    app = Jobify(storage=storage)
+    _ = app.task(_f, func_name="f")
+    async with app:
+        job = await app.task._routes["f"].schedule(1).delay(60)
+
+    async def _broken(num: "Missing") -> int:  # type: ignore[name-defined]  # noqa: F821
+        return num  # type: ignore[no-any-return]
+
+    app2 = Jobify(storage=storage)
+    _ = app2.task(_broken, func_name="f")
+    async with app2:
+        # An unresolved annotation skips the job and keeps it stored.
+        assert app2.find_job(job.id) is None
+        stored = {sch.job_id for sch in await storage.get_schedules()}
+        assert stored == {job.id}
+
+
+async def test_sqlite_pages(storage: SQLiteStorage) -> None:
+    storage.threadpool = None
+    storage.getloop = asyncio.get_running_loop
+    await storage.startup()
+    try:
+        for num in range(5):
+            await storage.add_schedule(
+                ScheduledJob(str(num), "f", b"", JobStatus.SCHEDULED),
+            )
+        # Updating a row keeps its place.
+        await storage.add_schedule(
+            ScheduledJob("0", "g", b"", JobStatus.SCHEDULED),
+        )
+        pages = [
+            [sch.job_id for sch in page]
+            async for page in storage.iter_schedules(2)
+        ]
+        assert pages == [["0", "1"], ["2", "3"], ["4"]]
+
+        await storage.delete_schedules(["1", "3", "missing"])
+        remaining = await storage.get_schedules()
+        assert [sch.job_id for sch in remaining] == ["0", "2", "4"]
+    finally:
+        await storage.shutdown()
+
+
+async def test_sqlite_pages_by_exec_at(storage: SQLiteStorage) -> None:
+    storage.threadpool = None
+    storage.getloop = asyncio.get_running_loop
+    await storage.startup()
+    try:
+        for job_id, exec_at in (
+            ("c", 3.0),
+            ("a", 1.0),
+            ("none", None),
+            ("b2", 2.0),
+            ("b1", 2.0),
+            ("d", 4.0),
+        ):
+            await storage.add_schedule(
+                ScheduledJob(job_id, "f", b"", JobStatus.SCHEDULED, exec_at),
+            )
+        due = [
+            [sch.job_id for sch in page]
+            async for page in storage.iter_schedules(2, before=3.0)
+        ]
+        assert due == [["none"], ["a", "b2"], ["b1"]]
+        later = [
+            [sch.job_id for sch in page]
+            async for page in storage.iter_schedules(2, since=3.0)
+        ]
+        assert later == [["c", "d"]]
+        stored = await storage.get_schedules()
+        assert {sch.job_id: sch.exec_at for sch in stored}["d"] == 4.0  # noqa: PLR2004
+    finally:
+        await storage.shutdown()
+
+
+async def test_sqlite_adds_exec_at_column(storage: SQLiteStorage) -> None:
+    conn = sqlite3.connect(storage.database)
+    try:
+        _ = conn.execute(
+            f"CREATE TABLE {storage.table_name} ("
+            "job_id TEXT PRIMARY KEY, func_name TEXT, message BLOB, "
+            "status TEXT, created_at TEXT, updated_at TEXT);",
+        )
+        _ = conn.execute(
+            f"INSERT INTO {storage.table_name} "  # noqa: S608
+            "(job_id, func_name, message, status) VALUES ('old', 'f', '', ?);",
+            (JobStatus.SCHEDULED,),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    storage.threadpool = None
+    storage.getloop = asyncio.get_running_loop
+    await storage.startup()
+    try:
+        # Rows stored without a run time are restored before the horizon.
+        pages = [
+            [sch.job_id for sch in page]
+            async for page in storage.iter_schedules(2, before=0.0)
+        ]
+        assert pages == [["old"]]
+        assert [
+            page async for page in storage.iter_schedules(2, since=0.0)
+        ] == []
+    finally:
+        await storage.shutdown()
+
+
+async def test_restore_horizon(storage: SQLiteStorage) -> None:
+    async def _f(num: int) -> int:
+        return num
+
+    app = Jobify(storage=storage)
+    _ = app.task(_f, func_name="f")
+    async with app:
+        route = app.task._routes["f"]
+        soon = await route.schedule(1).delay(0.05)
+        later = await route.schedule(2).delay(3600)
+
+    await storage.startup()
+    try:
+        await storage.add_schedule(
+            ScheduledJob("broken", "f", b"{", JobStatus.SCHEDULED),
+        )
+    finally:
+        await storage.shutdown()
+
+    app2 = Jobify(storage=storage, restore_horizon=60)
+    _ = app2.task(_f, func_name="f")
+    decoded: list[str] = []
+    decode_schedules = app2._decode_schedules
+
+    def _decode_schedules(
+        schedules: Sequence[ScheduledJob],
+    ) -> list[_DecodedJob | Exception]:
+        decoded.extend(sch.job_id for sch in schedules)
+        return decode_schedules(schedules)
+
+    app2._decode_schedules = _decode_schedules  # type: ignore[method-assign]
+    async with app2:
+        # Jobs due later than the horizon are read and armed after startup.
+        assert decoded == ["broken", soon.id]
+        assert app2.find_job(soon.id) is not None
+        assert app2.find_job(later.id) is None
+
+        await asyncio.sleep(0.01)
+        assert app2.find_job(later.id) is not None
+        stored = {sch.job_id for sch in await storage.get_schedules()}
+        assert stored == {soon.id, later.id}
+
+
+async def test_sqlite_cron_lease(storage: SQLiteStorage) -> None:
+    storage.threadpool = None
+    storage.getloop = asyncio.get_running_loop
+    await storage.startup()
+    try:
+        assert await storage.acquire_cron_lease("c", "a", 1.0, 60)
+        # A fire runs once, and the lease keeps the next ones for its owner.
+        assert not await storage.acquire_cron_lease("c", "a", 1.0, 60)
+        assert not await storage.acquire_cron_lease("c", "b", 2.0, 60)
+        assert await storage.acquire_cron_lease("c", "a", 2.0, 0.01)
+
+        await asyncio.sleep(0.02)
+        assert not await storage.acquire_cron_lease("c", "b", 2.0, 60)
+        assert await storage.acquire_cron_lease("c", "b", 3.0, 60)
+        assert await storage.acquire_cron_lease("d", "a", 3.0, 60)
+    finally:
+        await storage.shutdown()
+
+
+async def test_cron_lease_replicas(storage: SQLiteStorage) -> None:
+    runs: list[tuple[int, datetime]] = []
+
+    def replica(num: int) -> Jobify:
+        app = Jobify(storage=SQLiteStorage(storage.database), cron_lease=0.5)
+
+        @app.task(cron="* * * * * * *", func_name="tick")
+        def _(context: JobContext = INJECT) -> None:
+            runs.append((num, context.job.exec_at))
+
+        return app
+
+    first, second = replica(1), replica(2)
+    await first.startup()
+    await second.startup()
+    try:
+        await asyncio.sleep(1.1)
+        fires = [fire_at for _, fire_at in runs]
+        assert fires
+        assert len(set(fires)) == len(fires)
+
+        # The other replica takes over once the lease has expired.
+        _ = await first.shutdown()
+        runs.clear()
+        await asyncio.sleep(1.1)
+        assert {num for num, _ in runs} == {2}
+    finally:
+        if first.configs.app_started:
+            _ = await first.shutdown()
+        _ = await second.shutdown()
+
+
+async def test_cron_lease_replicas_max_runs(storage: SQLiteStorage) -> None:
+    runs: list[int] = []
+
+    def replica(num: int) -> Jobify:
+        app = Jobify(storage=SQLiteStorage(storage.database), cron_lease=0.5)
+
+        @app.task(
+            cron=Cron("* * * * * * *", max_runs=2),
+            func_name="tick",
+        )
+        def _() -> None:
+            runs.append(num)
+
+        return app
+
+    first, second = replica(1), replica(2)
+    await first.startup()
+    await second.startup()
+    try:
+        await asyncio.sleep(3.1)
+        # The replica without the lease counts the fires it skips too.
+        assert len(runs) == 2  # noqa: PLR2004
+        assert first.find_job("tick") is None
+        assert second.find_job("tick") is None
+    finally:
+        _ = await first.shutdown()
+        _ = await second.shutdown()
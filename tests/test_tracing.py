@@ -0,0 +1,129 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+from typing_extensions import override
+
+from jobify import Job, Jobify
+from jobify._internal.message import Message
+from jobify.storage import SQLiteStorage
+from jobify.tracing import Carrier, OpenTelemetryTracer, Span, Tracer
+
+
+@dataclass
+class FakeSpan:
+    name: str
+    parent: Any
+    attributes: dict[str, Any]
+    start_time: int | None
+    exceptions: list[BaseException] = field(default_factory=list)
+    ended: bool = False
+
+    def set_attribute(self, key: str, value: Any) -> None:  # noqa: ANN401
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.exceptions.append(exception)
+
+    def end(self) -> None:
+        self.ended = True
+
+
+class FakeTracer(Tracer):
+    def __init__(self) -> None:
+        self.spans: list[FakeSpan] = []
+
+    @override
+    def start_span(
+        self,
+        name: str,
+        *,
+        parent: Span | Mapping[str, str] | None = None,
+        attributes: Mapping[str, Any] | None = None,
+        start_time: int | None = None,
+    ) -> Span:
+        span = FakeSpan(name, parent, dict(attributes or {}), start_time)
+        self.spans.append(span)
+        return span
+
+    @override
+    def inject(self, span: Span) -> Carrier:
+        assert isinstance(span, FakeSpan)
+        return {"traceparent": f"{span.name}:{self.spans.index(span)}"}
+
+
+async def test_tracing() -> None:
+    tracer = FakeTracer()
+    app = Jobify(storage=SQLiteStorage(":memory:"), tracer=tracer)
+
+    @app.task(func_name="f")
+    async def f(num: int) -> int:
+        if num < 0:
+            raise ValueError
+        return num
+
+    async with app:
+        job = await f.schedule(1).delay(0)
+        await job.wait()
+        failed = await f.schedule(-1).delay(0)
+        await failed.wait()
+
+    names = [span.name for span in tracer.spans[:5]]
+    assert names == [
+        "jobify.schedule",
+        "jobify.serialize",
+        "jobify.storage.write",
+        "jobify.queue_wait",
+        "jobify.execute",
+    ]
+    assert all(span.ended for span in tracer.spans)
+    origin = {"traceparent": "jobify.schedule:0"}
+    assert job._trace_context == origin
+    assert all(span.parent == origin for span in tracer.spans[1:5])
+    assert tracer.spans[0].attributes == {
+        "jobify.route": "f",
+        "jobify.job_id": job.id,
+    }
+    assert tracer.spans[3].start_time == int(job.exec_at.timestamp() * 1e9)
+    assert tracer.spans[4].attributes["jobify.status"] == "success"
+
+    execute = tracer.spans[-1]
+    assert execute.name == "jobify.execute"
+    assert execute.attributes["jobify.status"] == "failed"
+    assert execute.exceptions == [failed.exception]
+
+
+async def test_tracing_restore(tmp_path: Any) -> None:  # noqa: ANN401
+    storage = SQLiteStorage(tmp_path / "trace.db")
+
+    async def f() -> None:
+        return None
+
+    app = Jobify(storage=storage, tracer=FakeTracer())
+    _ = app.task(f, func_name="f")
+    async with app:
+        job = await app.task._routes["f"].schedule().delay(60)
+        (scheduled,) = await storage.get_schedules()
+        raw = app.configs.serializer.loadb(scheduled.message)
+        msg = app.configs.loader.load(raw, Message)
+        assert msg.trace_context == job._trace_context
+
+    app2 = Jobify(storage=storage)
+    _ = app2.task(f, func_name="f")
+    async with app2:
+        restored: Job[None] | None = app2.find_job(job.id)
+        assert restored is not None
+        assert restored._trace_context == job._trace_context
+
+
+def test_opentelemetry_not_installed() -> None:
+    try:
+        import opentelemetry  # noqa: F401, PLC0415
+    except ImportError:
+        pass
+    else:  # pragma: no cover
+        pytest.skip("opentelemetry is installed")
+
+    with pytest.raises(RuntimeError, match="requires the opentelemetry-api"):
+        _ = OpenTelemetryTracer()